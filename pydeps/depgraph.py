@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function
-from collections import defaultdict, deque
+from collections import defaultdict
 import fnmatch
 from .pycompat import zip_longest
 import json
@@ -186,54 +186,70 @@ class Graph:
             self.neighbours[u].append(v)
 
 
-    def transpose(self):
-        return Graph(self.V, [(v, u) for u, v in self.edges])
+    def strongly_connected_components(self):
+        """Strongly connected components (sets of GraphNode), largest first.
 
-    def dfs(self, v, visited, stack):
-        visited[v.index] = True
-        for neighbour in self.neighbours[v]:
-            if not visited[neighbour.index]:
-                self.dfs(neighbour, visited, stack)
-        stack.append(v)
- 
-    
-    def fill_order(self):
-        def _fill_order(visited, stack):
-            for i, node in enumerate(self.V):
-                if not visited[i]:
-                    self.dfs(node, visited, stack)
-        visited = [False] * len(self.V)
-        stack = deque()
-        _fill_order(visited, stack)
-        return stack
-
-    def dfs_util(self, v, visited):
-        component = []
-
-        def _dfs_util(v, visited):
-            visited[v.index] = True
-            component.append(v)
-            for neighbour in self.neighbours[v]:
-                if not visited[neighbour.index]:
-                    _dfs_util(neighbour, visited)
-
-        _dfs_util(v, visited)
-        return set(component)
-
-    def kosaraju(self):
-        stack = self.fill_order()
-        transposed_graph = self.transpose()
-        
-        visited = [False] * len(self.V)
+           Uses a single iterative Tarjan pass over integer adjacency lists
+           (no transposed graph, no recursion limit on deep import chains).
+           Components of equal size keep a topological order of the
+           condensation graph.
+        """
+        n = len(self.V)
+        adjacency = [[] for _ in range(n)]
+        for u, v in self.edges:
+            adjacency[u.index].append(v.index)
+
+        index = [-1] * n            # discovery order (-1: not visited)
+        lowlink = [0] * n
+        on_stack = [False] * n
+        stack = []
         scc_list = []
-        
-        while stack:
-            node = stack.pop()  # popleft?
-            if not visited[node.index]:
-                component = transposed_graph.dfs_util(node, visited)
-                scc_list.append(component)
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(adjacency[root]))]
+
+            while work:
+                node, neighbours = work[-1]
+                for neighbour in neighbours:
+                    if index[neighbour] == -1:
+                        index[neighbour] = lowlink[neighbour] = counter
+                        counter += 1
+                        stack.append(neighbour)
+                        on_stack[neighbour] = True
+                        work.append((neighbour, iter(adjacency[neighbour])))
+                        break
+                    if on_stack[neighbour] and index[neighbour] < lowlink[node]:
+                        lowlink[node] = index[neighbour]
+                else:
+                    work.pop()
+                    if lowlink[node] == index[node]:
+                        component = set()
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.add(self.V[member])
+                            if member == node:
+                                break
+                        scc_list.append(component)
+                    if work:
+                        parent = work[-1][0]
+                        if lowlink[node] < lowlink[parent]:
+                            lowlink[parent] = lowlink[node]
+
+        # Tarjan emits components in reverse topological order
+        scc_list.reverse()
         return sorted(scc_list, key=lambda x: len(x), reverse=True)
 
+    # kept for existing callers
+    kosaraju = strongly_connected_components
+
 
 class DepGraph(object):
     """The dependency graph.
@@ -415,8 +431,8 @@ class DepGraph(object):
 
 
     def find_import_cycles(self):
-        # 내부 Graph로 옮겨 Kosaraju 알고리즘 수행
-        """Divide the graph into strongly connected components using kosaraju's algorithm.
+        # 내부 Graph로 옮겨 Tarjan 알고리즘 수행
+        """Divide the graph into strongly connected components using Tarjan's algorithm.
         """
 
         vertices = {src.name: GraphNode(src) for src in sorted(
@@ -429,7 +445,7 @@ class DepGraph(object):
                 edges.append((u, vertices[tmp.name]))
         graph = Graph(vertices.values(), edges)
 
-        scc = [c for c in graph.kosaraju() if len(c) > 1]
+        scc = [c for c in graph.strongly_connected_components() if len(c) > 1]
         self.cycles = [[n.src for n in c] for c in scc]
         for c in scc:
             for node in c:
@@ -6,32 +6,263 @@ pydeps 모듈 레벨 분석과 AST 기반 클래스/메소드/필드 분석을 
 """
 
 import os
+import gc
 import sys
-import uuid
 import time
+import hashlib
 import logging
-from pathlib import Path
-from typing import List, Dict, Set, Optional, Callable, Any
+import threading
+import multiprocessing
+import pickle
+from os import urandom
+from queue import Full, Queue
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Sequence
+from contextlib import contextmanager
+from functools import partial, cached_property
+from heapq import heappush, heapreplace
+from itertools import chain, count, islice, repeat
+from operator import add, attrgetter, methodcaller, mul
+from typing import List, Dict, DefaultDict, Set, Optional, Callable, Any, Tuple, Iterable, Iterator
 from datetime import datetime, timedelta
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import concurrent.futures
+from array import array
+from dataclasses import dataclass, field
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, BrokenExecutor
 
 DEBUG_MODE = os.getenv('PYVIEW_DEBUG', 'false').lower() == 'true'
 
 from .models import (
     AnalysisResult, ProjectInfo, DependencyGraph,
     PackageInfo, ModuleInfo, ClassInfo, MethodInfo, FieldInfo,
-    Relationship, CyclicDependency, DependencyType, QualityMetrics, EntityType,
+    Relationship, CyclicDependency, CycleRecord, DependencyType, QualityMetrics, EntityType,
     create_module_id
 )
-from .ast_analyzer import ASTAnalyzer, FileAnalysis
-from .legacy_bridge import LegacyBridge
-from .code_metrics import CodeMetricsEngine
-from .cache_manager import CacheManager, IncrementalAnalyzer, AnalysisCache, FileMetadata
-from .performance_optimizer import LargeProjectAnalyzer, PerformanceConfig, ResultPaginator
+from .ast_analyzer import ASTAnalyzer, FileAnalysis, parse_source
+from .cache_manager import CacheManager, IncrementalAnalyzer, AnalysisCache, FileMetadata, FileDigestCache, SourceASTCache
 from .gitignore_patterns import create_gitignore_matcher
+from .io_utils import hash_bytes, hash_file, read_file_bytes, stat_files
+from .graph_utils import (
+    CSRGraph, EdgeIndex, tarjan_scc, find_cycle_in_component, has_self_loop, iter_adjacency_edges,
+    mutual_edge_pairs
+)
 
 logger = logging.getLogger(__name__)
 
+# 워커에서 재사용하는 상태 없는 분석기 (파일마다 인스턴스를 만들지 않음, 풀 생성 시 _init_worker가 옵션대로 교체)
+_WORKER_ANALYZER = ASTAnalyzer()
+
+
+def _init_worker(enable_type_inference: bool = True):
+    """워커 프로세스 초기화: 엔진 옵션대로 공용 분석기를 한 번만 생성"""
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = ASTAnalyzer(enable_type_inference=enable_type_inference)
+
+# 워커 하나당 처리할 작업 수 상한 (넘으면 다음 병렬 단계 전에 풀 전체를 새로 생성하여 워커 메모리 증가 억제)
+# ProcessPoolExecutor의 max_tasks_per_child는 작업이 많을 때 워커 교체 중 교착되므로 사용하지 않음
+_WORKER_MAX_TASKS = 64
+
+
+# import 이름을 절대 모듈 이름으로 변환 (지금은 상대 import의 앞쪽 점만 제거, 절대 import는 그대로)
+# 파일 경로에 의존하지 않으므로 import마다 메소드를 호출하지 않고 map으로 일괄 적용
+_resolve_import_name = methodcaller('lstrip', '.')
+
+
+def _file_stem(file_path: str) -> str:
+    """파일 경로의 확장자를 뺀 파일명 (Path(file_path).stem과 같은 결과, PurePath 객체 생성 없이 문자열 연산만 사용)"""
+    name = os.path.basename(file_path)
+    dot = name.rfind('.')
+    return name if dot <= 0 else name[:dot]                                     # '.hidden'처럼 점으로 시작하면 그대로
+
+
+def _intern_analysis(analysis: FileAnalysis) -> FileAnalysis:
+    """분석 결과의 식별자성 문자열을 sys.intern으로 공유 (제자리 수정 후 그대로 반환)
+
+    워커 프로세스나 디스크 캐시에서 역직렬화된 결과는 파일마다 같은 모듈명/클래스 ID/타입 문자열을
+    따로 가지므로, 통합 전에 하나의 객체로 합쳐 메모리를 줄이고 dict 조회 시 해시를 재사용한다.
+    고유한 ID(id 필드)와 본문/문서 문자열은 중복되지 않으므로 그대로 둔다.
+    """
+    intern = sys.intern
+    analysis.file_path = file_path = intern(analysis.file_path)
+    module_info = analysis.module_info
+    module_info.id = intern(module_info.id)
+    module_info.file_path = file_path
+
+    for imp in analysis.imports:
+        imp.module = intern(imp.module)
+        if imp.name is not None:
+            imp.name = intern(imp.name)
+    for cls in analysis.classes:
+        cls.name = intern(cls.name)
+        cls.module_id = intern(cls.module_id)
+        cls.file_path = file_path
+        cls.bases[:] = map(intern, cls.bases)
+        cls.decorators[:] = map(intern, cls.decorators)
+    for method in analysis.methods:
+        method.name = intern(method.name)
+        method.file_path = file_path
+        if method.class_id is not None:
+            method.class_id = intern(method.class_id)
+        if method.return_annotation is not None:
+            method.return_annotation = intern(method.return_annotation)
+        method.decorators[:] = map(intern, method.decorators)
+        for arg in method.args:                                                     # {'name': ..., 'annotation': ...}
+            arg['name'] = intern(arg['name'])
+            annotation = arg.get('annotation')
+            if isinstance(annotation, str):
+                arg['annotation'] = intern(annotation)
+    for fld in analysis.fields:
+        fld.name = intern(fld.name)
+        fld.class_id = intern(fld.class_id)
+        fld.file_path = file_path
+        if fld.type_annotation is not None:
+            fld.type_annotation = intern(fld.type_annotation)
+    for rel in analysis.relationships:
+        rel.from_entity = intern(rel.from_entity)
+        rel.to_entity = intern(rel.to_entity)
+        rel.file_path = file_path
+    return analysis
+
+
+# 나가는 import가 없는 모듈의 이웃 집합
+_NO_IMPORTS: frozenset = frozenset()
+
+# 품질 메트릭을 계산할 소스 파일 최대 크기 (이보다 크면 생성/벤더링 코드로 보고 건너뜀)
+_MAX_METRICS_SOURCE_BYTES = 1024 * 1024
+
+
+class _LazyPaths(Sequence):
+    """순환 경로(간선) 딕셔너리 목록을 첫 접근 시 생성하는 읽기 전용 시퀀스
+
+    대부분의 소비자는 entities/severity만 읽고 paths는 쓰지 않으므로 (CyclicDependency 변환 포함)
+    간선별 딕셔너리를 미리 만들지 않는다. 길이는 생성 없이 알 수 있고, 복사/피클링하면 일반 list가 된다.
+    """
+    __slots__ = ('_build', '_length', '_items')
+
+    def __init__(self, build: Callable[[], List[Dict]], length: int):
+        self._build = build                                                                  # 경로 목록 생성 함수
+        self._length = length                                                                # 경로 수
+        self._items: Optional[List[Dict]] = None                                             # 생성된 경로 목록
+
+    def _materialize(self) -> List[Dict]:
+        if self._items is None:
+            self._items = self._build()
+            self._build = None                                                               # 캡처한 간선 목록 해제
+        return self._items
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _LazyPaths)):
+            return self._materialize() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+    def __reduce__(self):
+        return list, (self._materialize(),)
+
+
+@contextmanager
+def _gc_paused():
+    """블록 실행 동안 순환 GC 중지
+
+    워커 결과를 역직렬화하면 수만 개의 모델 객체가 한꺼번에 생성되어 세대별 GC가 반복 실행되는데,
+    이 객체들은 모두 살아남으므로 검사는 낭비다 (역직렬화 시간의 절반 이상).
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+@dataclass
+class ModuleColumns:
+    """대규모 프로젝트 모듈 정보의 열(column) 저장소
+
+    모듈마다 ModuleInfo 객체를 만들지 않고 속성별 리스트/array에 저장한다. 결과에 포함될
+    모듈(코드 라인 수 상위 detail_limit개)만 클래스/함수/임포트 목록을 보관하고, ModuleInfo는 조립 시에만 생성한다.
+    파일 탐색 순서의 앞쪽이 아니라 가장 큰 모듈이 남도록 최소 힙으로 상위 모듈을 유지한다.
+    """
+    detail_limit: int                                                                        # 상세 정보를 보관할 모듈 수
+    ids: List[str] = field(default_factory=list)                                             # 모듈 ID 열
+    names: List[str] = field(default_factory=list)                                           # 모듈명 열
+    file_paths: List[str] = field(default_factory=list)                                      # 파일 경로 열
+    loc: array = field(default_factory=lambda: array('i'))                                   # 코드 라인 수 열 (정수 array)
+    details: List[Tuple[int, int, Tuple[list, list, list]]] = field(default_factory=list)    # (라인 수, -순번, (클래스, 함수, 임포트)) 최소 힙
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, analysis: FileAnalysis):
+        """파일 분석 결과 하나의 모듈 정보를 열에 추가"""
+        loc = analysis.module_info.loc
+        if self.detail_limit:                                                                # 결과에 포함될 후보 모듈만 상세 정보 보관
+            entry = (loc, -len(self.ids), (analysis.classes, analysis.module_info.functions, analysis.imports))
+            if len(self.details) < self.detail_limit:
+                heappush(self.details, entry)
+            elif entry > self.details[0]:                                                    # 현재 최소보다 크면 교체 (같으면 먼저 온 모듈 유지)
+                heapreplace(self.details, entry)
+        self.ids.append(create_module_id(analysis.file_path))                                # 모듈 고유 ID 생성
+        self.names.append(_file_stem(analysis.file_path))                                    # 파일명에서 모듈명 추출
+        self.file_paths.append(analysis.file_path)                                           # 파일 전체 경로
+        self.loc.append(loc)                                                                 # 코드 라인 수
+
+    def to_module_infos(self) -> List[ModuleInfo]:
+        """상세 정보를 보관한 모듈(최대 detail_limit개)만 코드 라인 수 내림차순으로 ModuleInfo 생성"""
+        ids, names, file_paths = self.ids, self.names, self.file_paths
+        return [
+            ModuleInfo(id=ids[-neg_index], name=names[-neg_index], file_path=file_paths[-neg_index],
+                       classes=classes, functions=functions, imports=imports, loc=loc)
+            for loc, neg_index, (classes, functions, imports) in sorted(self.details, reverse=True)
+        ]
+
+
+@dataclass
+class EdgeColumns:
+    """대규모 프로젝트 관계(간선)의 정수 열 저장소
+
+    엔티티 ID는 처음 등장한 순서대로 정수 인덱스로 바꾸고, 간선은 소스/타겟 인덱스 array 두 개에
+    저장한다 (간선당 8바이트, CSR 그래프 구축에 바로 사용). Relationship 객체는 결과에 포함될
+    앞쪽 간선(detail_limit개)만 보관한다.
+    """
+    detail_limit: int                                                                        # 객체로 보관할 앞쪽 관계 수
+    node_index: DefaultDict[str, int] = field(                                               # 엔티티 ID -> 정수 인덱스
+        default_factory=lambda: defaultdict(count().__next__))                               # 처음 보는 ID는 다음 번호 (C 레벨 부여)
+    src: array = field(default_factory=lambda: array('i'))                                   # 간선 소스 인덱스 열
+    dst: array = field(default_factory=lambda: array('i'))                                   # 간선 타겟 인덱스 열
+    details: List[Relationship] = field(default_factory=list)                                # 앞쪽 관계 객체
+
+    def __len__(self) -> int:
+        return len(self.src)
+
+    @property
+    def node_ids(self) -> List[str]:
+        """정수 인덱스 -> 엔티티 ID (딕셔너리 삽입 순서가 곧 인덱스 순서)"""
+        return list(self.node_index)
+
+    def extend(self, relationships: List[Relationship]):
+        """파일 하나의 관계 목록을 간선 열에 추가
+
+        간선마다 파이썬 함수를 호출하지 않도록 ID -> 인덱스 변환은 defaultdict 조회와 map 체인으로만 수행한다.
+        """
+        if len(self.details) < self.detail_limit:                                            # 결과에 포함될 관계만 객체로 보관
+            self.details.extend(relationships[:self.detail_limit - len(self.details)])
+        node = self.node_index.__getitem__
+        self.src.extend(map(node, map(attrgetter('from_entity'), relationships)))
+        self.dst.extend(map(node, map(attrgetter('to_entity'), relationships)))
+
 
 class AnalysisOptions:
     """분석을 위한 설정 옵션들"""
@@ -46,7 +277,12 @@ class AnalysisOptions:
                  enable_caching: bool = True,                                                 # 캐싱 기능 활성화 여부
                  enable_quality_metrics: bool = True,                                        # 품질 메트릭 계산 활성화 여부
                  enable_performance_optimization: bool = True,                               # 성능 최적화 기능 활성화 여부
-                 max_memory_mb: int = 1024):                                                  # 최대 메모리 사용량 (MB)
+                 max_memory_mb: int = 1024,                                                   # 최대 메모리 사용량 (MB)
+                 incremental: bool = False,                                                   # 변경되지 않은 파일의 AST 분석 결과 재사용 여부
+                 cycle_algorithm: str = 'tarjan',                                             # 상세 순환 탐지 알고리즘 ('tarjan' 또는 'dfs')
+                 use_processes: bool = True,                                                  # 병렬 분석 워커 종류 (False면 스레드, IPC/피클링 없음)
+                 worker_start_method: Optional[str] = None,                                   # 워커 프로세스 시작 방식 ('fork', 'spawn', 'forkserver', None이면 플랫폼 기본값)
+                 large_project_cycles: bool = False):                                         # 대규모 프로젝트(>=1000파일)에서도 관계 순환 탐지 여부
 
         self.max_depth = max_depth                                                           # 의존성 탐색 깊이 설정
         self.exclude_patterns = exclude_patterns or ['__pycache__', '.git', '.venv', 'venv', 'env', 'tests']  # 기본 제외 패턴들
@@ -58,23 +294,41 @@ class AnalysisOptions:
         self.enable_quality_metrics = enable_quality_metrics                                # 품질 메트릭 계산 설정
         self.enable_performance_optimization = enable_performance_optimization              # 성능 최적화 설정
         self.max_memory_mb = max_memory_mb                                                   # 메모리 사용량 제한 설정
+        self.incremental = incremental                                                       # 파일 단위 증분 AST 분석 설정
+        self.cycle_algorithm = cycle_algorithm                                               # 순환 탐지 알고리즘 선택 (A/B 비교용)
+        self.use_processes = use_processes                                                   # 프로세스(또는 서브인터프리터) 풀 사용 여부
+        self.worker_start_method = worker_start_method                                       # 지정하면 해당 방식의 프로세스 풀 사용 (서브인터프리터 제외)
+        self.large_project_cycles = large_project_cycles                                     # 기본값은 메모리/시간 절약을 위해 순환 탐지 생략
 
 
 class ProgressCallback:
     """분석 진행 상황을 받기 위한 인터페이스"""
 
+    min_interval_ns = 250_000_000                                                            # 파일 단위 갱신 최소 간격 (250ms)
+    min_interval_items = 100                                                                 # 파일 단위 갱신 최소 개수 간격
+
     def __init__(self, callback: Callable[[dict], None] = None):
         """진행률 콜백 초기화"""
         self.callback = callback or self._default_callback                                   # 사용자 정의 콜백 또는 기본 콜백 사용
+        self._last_emit_ns = 0                                                               # 마지막 갱신 시각 (perf_counter_ns)
+        self._lock = threading.Lock()                                                        # 여러 단계가 동시에 갱신할 때 콜백 직렬화
+
+    def should_update(self, completed: int, total: int) -> bool:
+        """파일 루프에서 진행률을 보고할지 결정 (100개마다 또는 250ms마다, 마지막은 항상)"""
+        if completed >= total or completed % self.min_interval_items == 0:
+            return True
+        return time.perf_counter_ns() - self._last_emit_ns >= self.min_interval_ns
 
     def update(self, stage: str, progress: float, **kwargs):
-        """진행 상황 업데이트"""
+        """진행 상황 업데이트 (스레드 안전)"""
         data = {
             'stage': stage,                                                                  # 현재 진행 중인 단계
             'progress': progress,                                                            # 진행률 (0-100)
             **kwargs                                                                         # 추가 정보들
         }
-        self.callback(data)                                                                  # 콜백 함수 호출
+        with self._lock:
+            self._last_emit_ns = time.perf_counter_ns()                                      # 갱신 시각 기록
+            self.callback(data)                                                              # 콜백 함수 호출
 
     def _default_callback(self, data: dict):
         """콘솔에 로그를 출력하는 기본 콜백"""
@@ -91,33 +345,99 @@ class AnalyzerEngine:
         self.options = options or AnalysisOptions()                                          # 분석 옵션 설정 (기본값 또는 사용자 지정)
         self.logger = logging.getLogger(__name__)                                            # 로거 초기화
 
-        # 핵심 분석 컴포넌트들 초기화
+        # 핵심 분석 컴포넌트들 초기화 (나머지 컴포넌트는 첫 사용 시 생성)
         self.ast_analyzer = ASTAnalyzer(enable_type_inference=self.options.enable_type_inference)  # AST 기반 상세 분석기
-        self.legacy_bridge = LegacyBridge()                                                  # pydeps 연동 브리지
         self.metrics_engine = None  # 임시로 비활성화 (hanging 방지)                              # 코드 품질 메트릭 엔진
-        self.cache_manager = CacheManager() if options and options.enable_caching else None  # 분석 결과 캐시 관리자
-        self.incremental_analyzer = IncrementalAnalyzer(self.cache_manager) if self.cache_manager else None  # 증분 분석기
-
-        # 성능 최적화 컴포넌트들
-        if options and options.enable_performance_optimization:                              # 성능 최적화가 활성화된 경우
-            perf_config = PerformanceConfig(                                                 # 성능 설정 생성
-                max_memory_mb=options.max_memory_mb,                                         # 최대 메모리 사용량
-                max_workers=options.max_workers,                                             # 최대 워커 수
-                batch_size=100,                                                              # 배치 크기
-                enable_streaming=True,                                                       # 스트리밍 처리 활성화
-                enable_gc=True                                                               # 가비지 컬렉션 활성화
-            )
-            self.large_project_analyzer = LargeProjectAnalyzer(perf_config)                  # 대규모 프로젝트 분석기
-            self.result_paginator = ResultPaginator()                                        # 결과 페이징 처리기
-        else:
-            self.large_project_analyzer = None                                               # 성능 최적화 비활성화
-            self.result_paginator = None
+        self._enable_caching = bool(options and options.enable_caching)                      # 명시적 옵션이 있을 때만 캐시 사용
+        self._enable_performance_optimization = bool(options and options.enable_performance_optimization)  # 명시적 옵션이 있을 때만 최적화 사용
 
         # 분석 상태 관리
         self.current_analysis_id: Optional[str] = None                                       # 현재 분석 세션 ID
         self.total_files = 0                                                                 # 전체 파일 수
         self.processed_files = 0                                                             # 처리된 파일 수
+
+        # 병렬 AST 분석용 프로세스 풀 (첫 병렬 분석 시 생성, 이후 analyze_project 호출 간 재사용)
+        self._pool: Optional[Executor] = None
+        self._pool_tasks = 0                                                                 # 현재 풀에 제출한 작업 수 (풀 교체 기준)
+        # 파일 선행 읽기/해싱용 I/O 스레드 풀 (첫 사용 시 생성, 워커 수 이하로 제한)
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+
+        # 관계 목록의 소스/타겟 열 (순환 탐지와 결합도 메트릭이 공유, 관계 목록이 바뀌면 다시 생성)
+        self._edge_index: Optional[EdgeIndex] = None
+        self._edge_index_source: Optional[List[Relationship]] = None
+
+        # 통합 결과 메모이제이션 (pydeps 결과 + 파일별 내용 해시 지문 -> 피클된 통합 결과, 결과가 크므로 최근 2개만)
+        self._integration_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._integration_cache_size = 2
+
+        # 이번 분석에서 계산한 파일 내용 SHA-256 (AST 캐시, 증분 인덱스, 파일 메타데이터가 공유)
+        self._file_digests: Dict[str, str] = {}
+        self._digest_cache: Optional[FileDigestCache] = None                                # (mtime, size)가 같으면 이전 실행의 해시 재사용
     
+    # === 지연 생성 컴포넌트 (분석 경로에 따라 일부만 사용되므로 첫 접근 시 import/생성) ===
+
+    @cached_property
+    def legacy_bridge(self):
+        """pydeps 연동 브리지 (pydeps import 포함)"""
+        from .legacy_bridge import LegacyBridge
+        return LegacyBridge()
+
+    @cached_property
+    def cache_manager(self) -> Optional[CacheManager]:
+        """분석 결과 캐시 관리자 (캐시 디렉토리 생성 포함)"""
+        return CacheManager() if self._enable_caching else None
+
+    @cached_property
+    def incremental_analyzer(self) -> Optional[IncrementalAnalyzer]:
+        """증분 분석기"""
+        return IncrementalAnalyzer(self.cache_manager) if self.cache_manager else None
+
+    @cached_property
+    def ast_cache(self) -> Optional[SourceASTCache]:
+        """소스 해시 기반 AST 분석 디스크 캐시"""
+        return self.cache_manager.get_ast_cache() if self.cache_manager else None
+
+    @cached_property
+    def large_project_analyzer(self):
+        """대규모 프로젝트 분석기 (성능 최적화 비활성화시 None)"""
+        if not self._enable_performance_optimization:
+            return None
+
+        from .performance_optimizer import LargeProjectAnalyzer, PerformanceConfig
+        perf_config = PerformanceConfig(                                                     # 성능 설정 생성
+            max_memory_mb=self.options.max_memory_mb,                                        # 최대 메모리 사용량
+            max_workers=self.options.max_workers,                                            # 최대 워커 수
+            batch_size=100,                                                                  # 배치 크기
+            enable_streaming=True,                                                           # 스트리밍 처리 활성화
+            enable_gc=True                                                                   # 가비지 컬렉션 활성화
+        )
+        return LargeProjectAnalyzer(perf_config)
+
+    @cached_property
+    def result_paginator(self):
+        """결과 페이징 처리기 (성능 최적화 비활성화시 None)"""
+        if not self._enable_performance_optimization:
+            return None
+
+        from .performance_optimizer import ResultPaginator
+        return ResultPaginator()
+
+    # === 리소스 정리 ===
+
+    def close(self):
+        """세션 워커 풀과 I/O 스레드 풀 종료 (엔진을 더 이상 쓰지 않을 때 호출, 이후 분석 시 풀을 새로 생성)"""
+        pool, self._pool = self._pool, None
+        io_pool, self._io_pool = self._io_pool, None
+        for executor in (pool, io_pool):
+            if executor is not None:
+                executor.shutdown(wait=True)                                                 # 실행 중인 작업이 끝날 때까지 대기
+
+    def __enter__(self) -> 'AnalyzerEngine':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def analyze_project(self,
                        project_path: str,
                        progress_callback: ProgressCallback = None) -> AnalysisResult:
@@ -131,8 +451,9 @@ class AnalyzerEngine:
         Returns:
             5단계 모든 레벨이 포함된 완전한 분석 결과
         """
-        start_time = time.time()                        # 분석 시작 시간 기록 (성능 측정용)
-        self.current_analysis_id = str(uuid.uuid4())    # 각 분석 세션을 UUID로 고유 식별
+        start_time = time.perf_counter()                # 분석 시작 시간 기록 (성능 측정용, 단조 시계)
+        self.current_analysis_id = urandom(16).hex()    # 각 분석 세션을 128비트 난수로 고유 식별
+        self._file_digests = {}                         # 이전 분석의 다이제스트는 재사용하지 않음
 
         if progress_callback is None:                   # 진행률 콜백이 없으면 기본 콜백 생성
             progress_callback = ProgressCallback()
@@ -142,11 +463,14 @@ class AnalyzerEngine:
             progress_callback.update("Discovering project files", 5)       # 진행률 5% - 파일 탐색 시작
             project_files = self._discover_project_files(project_path)      # 프로젝트 내 모든 Python 파일 수집
             self.total_files = len(project_files)                           # 전체 파일 수 저장 (진행률 계산용)
+            if self.cache_manager:                                          # 변경되지 않은 파일의 내용 해시는 다시 계산하지 않음
+                self._digest_cache = self.cache_manager.get_file_digest_cache(project_path)
+                self._digest_cache.prune(project_files)                     # 삭제된 파일 정리
 
             # Stage 1.2: Check for large project optimization
             if self.large_project_analyzer and len(project_files) > 1000:  # 대규모 프로젝트 최적화 조건 확인 (1000개 파일 초과)
                 progress_callback.update("Analyzing project complexity", 7) # 진행률 7% - 복잡도 분석 시작
-                project_stats = self.large_project_analyzer.estimate_project_size(project_path)  # 파일 수뿐만 아니라 실제 복잡도 측정
+                project_stats = self.large_project_analyzer.estimate_project_size(project_path, project_files)  # 탐색한 파일 목록으로 복잡도 측정 (재탐색 없음)
 
                 if project_stats['complexity'] in ['high', 'very_high']:    # 높은 복잡도면 최적화된 분석 방법 사용
                     progress_callback.update("Large project detected, using optimized analysis", 10)  # 진행률 10% - 대규모 분석 모드
@@ -195,66 +519,78 @@ class AnalyzerEngine:
             self.logger.error(f"Analysis failed: {e}")                                     # 에러 로그 출력
             raise                                                                           # 예외 다시 발생시켜 상위로 전달
 
+        finally:
+            digest_cache, self._digest_cache = self._digest_cache, None
+            if digest_cache is not None:                                                    # 이번 분석에서 계산한 해시 저장
+                digest_cache.save()
+            if self.__dict__.get('ast_cache') is not None:                                  # 이번 분석에서 AST 캐시를 썼으면 오래된 항목 정리
+                self.ast_cache.prune()                                                      # 수정 전 소스의 항목 제거 (크기/기간 상한)
+
     def _discover_project_files(self, project_path: str) -> List[str]:
         """프로젝트 내 모든 Python 파일 탐색 (.gitignore 스타일 패턴 지원)"""
-        python_files = []                                                                   # Python 파일 경로 리스트
+        python_files = list(self._iter_project_files(project_path))                         # 호출 경계에서만 리스트로 변환
 
+        self.logger.info(f"Discovered {len(python_files)} Python files")                  # 발견된 파일 수 로그 출력
+        return python_files                                                                # 발견된 파일 리스트 반환
+
+    def _iter_project_files(self, project_path: str) -> Iterator[str]:
+        """os.scandir 기반 단일 패스 탐색으로 Python 파일 경로를 순차 생성"""
         # .gitignore 스타일 패턴 매처 생성
         pattern_matcher = create_gitignore_matcher(self.options.exclude_patterns)
+        excluded_names = pattern_matcher.literal_names                                      # 단순 이름 패턴만 있으면 집합 조회로 판정
+        if excluded_names is not None:
+            def should_exclude(relative_path: str, name: str) -> bool:
+                return name in excluded_names                                               # 상위 구성요소는 이미 걸러졌으므로 이름만 확인
+        else:
+            def should_exclude(relative_path: str, name: str) -> bool:
+                return pattern_matcher.should_exclude(relative_path)
 
-        project_path_obj = Path(project_path)                                              # 프로젝트 경로를 Path 객체로 변환
-
-        for root, dirs, files in os.walk(project_path):                                     # 디렉토리 트리 순회
-            root_path = Path(root)
+        stack = [(project_path, '')]                                                        # 방문할 (디렉토리, 상대 경로 접두사)
+        while stack:
+            dir_path, rel_prefix = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:                                            # DirEntry 사용으로 추가 stat 호출 회피
+                    entries = list(it)
+            except OSError:                                                                 # 접근 불가 디렉토리는 건너뜀 (os.walk와 동일)
+                continue
 
-            # 제외할 디렉토리 필터링 (.gitignore 스타일 패턴 매칭)
-            dirs_to_keep = []
-            for d in dirs:
-                dir_path = root_path / d
-                # 프로젝트 루트 기준 상대 경로로 변환
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                # 프로젝트 루트 기준 상대 경로 (문자열 연결, Path.relative_to 불필요)
+                relative_path = rel_prefix + name
                 try:
-                    relative_dir_path = dir_path.relative_to(project_path_obj)
-                    if not pattern_matcher.should_exclude(relative_dir_path):
-                        dirs_to_keep.append(d)
-                except ValueError:
-                    # relative_to 실패시 절대 경로로 확인
-                    if not pattern_matcher.should_exclude(dir_path):
-                        dirs_to_keep.append(d)
-            dirs[:] = dirs_to_keep
-
-            for file in files:                                                              # 현재 디렉토리의 모든 파일 확인
-                if file.endswith('.py'):                                                    # Python 파일만 선택
-                    file_path = os.path.join(root, file)                                   # 전체 파일 경로 생성
-                    file_path_obj = Path(file_path)
-
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    # 제외할 디렉토리 필터링 (심볼릭 링크 디렉토리는 따라가지 않음)
+                    if not entry.is_symlink() and not should_exclude(relative_path, name):
+                        subdirs.append((entry.path, relative_path + os.sep))
+                elif name.endswith('.py'):                                                  # Python 파일만 선택
                     # .gitignore 스타일 패턴 매칭으로 제외 여부 확인
-                    try:
-                        relative_file_path = file_path_obj.relative_to(project_path_obj)
-                        if not pattern_matcher.should_exclude(relative_file_path):
-                            python_files.append(file_path)                                 # 유효한 Python 파일 추가
-                    except ValueError:
-                        # relative_to 실패시 절대 경로로 확인
-                        if not pattern_matcher.should_exclude(file_path_obj):
-                            python_files.append(file_path)
+                    if not should_exclude(relative_path, name):
+                        yield entry.path                                                    # 유효한 Python 파일
+
+            stack.extend(reversed(subdirs))                                                 # 현재 디렉토리 파일 다음에 하위 디렉토리를 순서대로 순회
 
-        self.logger.info(f"Discovered {len(python_files)} Python files")                  # 발견된 파일 수 로그 출력
-        return python_files                                                                # 발견된 파일 리스트 반환
-    
     # === 일반 프로젝트 분석 경로 (< 1000 파일) ===
 
     def _perform_full_analysis(self, project_path: str, project_files: List[str],
                               progress_callback: ProgressCallback, start_time: float = None) -> AnalysisResult:
         """캐싱 없이 완전한 분석 수행"""
         if start_time is None:                                                              # 시작 시간이 없으면
-            start_time = time.time()                                                        # 현재 시간으로 설정
+            start_time = time.perf_counter()                                                # 현재 시간으로 설정
 
         # Stage 2: pydeps module-level analysis
+        # (pydeps는 os.chdir과 sys.path를 바꾸므로 다른 단계와 겹치지 않도록 현재 스레드에서 먼저 실행)
         progress_callback.update("Running module-level analysis", 15)                      # 진행률 15% - 모듈 수준 분석 시작
         pydeps_result = self._run_pydeps_analysis(project_path, progress_callback)          # pydeps로 모듈 간 의존성 분석
 
         # Stage 3: AST detailed analysis
         progress_callback.update("Analyzing code structure", 30)                           # 진행률 30% - 코드 구조 분석 시작
-        ast_analyses = self._run_ast_analysis(project_files, progress_callback)             # AST로 상세 코드 구조 분석
+        ast_analyses = self._run_ast_analysis(project_files, progress_callback, project_path)  # AST로 상세 코드 구조 분석
 
         # Stage 4: Data integration
         progress_callback.update("Integrating analysis results", 70)                       # 진행률 70% - 분석 결과 통합 시작
@@ -342,82 +678,305 @@ class AnalyzerEngine:
             }
     
     def _run_ast_analysis(self, project_files: List[str],
-                         progress_callback: ProgressCallback) -> List[FileAnalysis]:
+                         progress_callback: ProgressCallback,
+                         project_path: str = None) -> List[FileAnalysis]:
         """모든 프로젝트 파일에 대해 AST 분석 실행"""
+        # 증분 모드: (mtime, size)가 변하지 않은 파일은 이전 분석 결과 재사용                  # 변경된 파일만 다시 파싱
+        file_index = None
+        cached_analyses = []
+        changed_files = project_files
+        if self.options.incremental and self.cache_manager and project_path:
+            file_index = self.cache_manager.get_file_analysis_index(                        # 프로젝트별 파일 분석 인덱스 로드
+                project_path, self.ast_analyzer.cache_tag)                                  # 분석기 버전/옵션이 다르면 인덱스 전체 폐기
+            changed_files = []
+            for file_path in project_files:
+                analysis = file_index.lookup(file_path)                                     # 변경 여부 확인 (의심스러운 경우만 해시 검증)
+                if analysis is not None:
+                    cached_analyses.append(analysis)                                        # 캐시된 분석 결과 재사용
+                    self._file_digests[file_path] = file_index.entries[file_path].checksum  # 분석 당시 내용 해시 (통합 결과 지문에 사용)
+                else:
+                    changed_files.append(file_path)                                         # 다시 분석할 파일
+            self.logger.info(f"Incremental AST analysis: reusing {len(cached_analyses)}, "
+                             f"re-analyzing {len(changed_files)} files")
+
         # 멀티프로세싱 사용 여부 결정 (파일이 많고 멀티프로세싱이 활성화된 경우)            # 성능 최적화를 위한 분기 처리
-        if len(project_files) > 10 and self.options.max_workers and self.options.max_workers > 1:
-            return self._run_parallel_ast_analysis(project_files, progress_callback)        # 병렬 처리로 분석
+        if len(changed_files) > 10 and self.options.max_workers and self.options.max_workers > 1:
+            analyses = self._run_parallel_ast_analysis(changed_files, progress_callback)    # 병렬 처리로 분석
         else:
-            return self._run_sequential_ast_analysis(project_files, progress_callback)      # 순차 처리로 분석
+            analyses = self._run_sequential_ast_analysis(changed_files, progress_callback)  # 순차 처리로 분석
+
+        if file_index is not None:                                                          # 새 분석 결과를 인덱스에 반영
+            for analysis in analyses:
+                file_index.store(analysis.file_path, analysis, self._file_digests.get(analysis.file_path))  # 그룹화 때 계산한 해시 재사용
+            file_index.prune(project_files)                                                 # 삭제된 파일 정리
+            file_index.save()
+
+        return cached_analyses + analyses
     
     def _run_sequential_ast_analysis(self, project_files: List[str],
                                     progress_callback: ProgressCallback) -> List[FileAnalysis]:
         """순차적으로 파일을 하나씩 AST 분석 (단일 스레드)"""
-        analyses = []                                                                           # 분석 결과를 저장할 리스트
+        results = {}                                                                            # 파일 경로 -> 분석 결과
         total_files = len(project_files)                                                        # 전체 파일 수
-
-        for i, file_path in enumerate(project_files):                                          # 각 파일을 순차적으로 처리
-            try:
-                # 개별 파일 분석 (클래스, 메소드, 필드 추출)                                    # AST 파싱으로 상세 구조 분석
-                analysis = self.ast_analyzer.analyze_file(file_path)                           # ASTAnalyzer로 파일 분석
-                if analysis:                                                                    # 분석 결과가 있으면
-                    analyses.append(analysis)                                                   # 결과 리스트에 추가
-
-                # 진행률 업데이트 (30%에서 시작해서 65%까지)                                   # 전체 분석 파이프라인에서의 비중 반영
-                progress_percentage = 30 + (35 * (i + 1) / total_files)
-                progress_callback.update(f"Analyzing file {i+1}/{total_files}", progress_percentage)
-
-            except Exception as e:                                                              # 개별 파일 분석 실패시
-                self.logger.warning(f"Failed to analyze file {file_path}: {e}")               # 경고 로그 (전체 실패하지 않고 계속 진행)
-
-        return analyses                                                                         # 모든 파일 분석 결과 반환
+        completed_files = 0                                                                     # 처리된 파일 수
+
+        # 내용이 동일한 파일은 한 묶음으로 처리 (파싱 1회)                                     # 생성 코드/빈 __init__.py 중복 파싱 방지
+        # 다음 파일들은 백그라운드 스레드가 미리 읽고, 현재 스레드는 파싱만 수행               # 디스크 I/O와 파싱을 겹쳐서 실행
+        file_groups = self._group_identical_files(project_files)
+        for (digest, file_group), content, _ in self._read_ahead(file_groups, lambda entry: self._read_file_bytes(entry[1][0])):
+            # 개별 파일 분석 (클래스, 메소드, 필드 추출)                                        # 읽기 실패시 content=None -> 그룹 분석에서 오류 보고
+            for file_path, analysis, error in self._analyze_file_group(self.ast_analyzer, file_group, self.ast_cache, content, digest):
+                if error is not None:                                                           # 개별 파일 분석 실패시
+                    self.logger.warning(f"Failed to analyze file {file_path}: {error}")       # 경고 로그 (전체 실패하지 않고 계속 진행)
+                elif analysis:                                                                  # 분석 결과가 있으면
+                    results[file_path] = _intern_analysis(analysis)                             # 결과 저장 (캐시에서 읽은 결과의 문자열 공유)
+
+                # 진행률 업데이트 (30%에서 시작해서 65%까지, 일정 간격으로만)                   # 보고하지 않을 때는 메시지도 만들지 않음
+                completed_files += 1
+                if progress_callback.should_update(completed_files, total_files):
+                    progress_percentage = 30 + (35 * completed_files / total_files)
+                    progress_callback.update(f"Analyzing file {completed_files}/{total_files}", progress_percentage)
+
+        return [results[f] for f in project_files if f in results]                              # 입력 파일 순서대로 반환
     
     def _run_parallel_ast_analysis(self, project_files: List[str],
                                   progress_callback: ProgressCallback) -> List[FileAnalysis]:
         """병렬로 여러 파일을 동시에 AST 분석 (멀티프로세싱)"""
-        analyses = []                                                                           # 분석 결과를 저장할 리스트
+        results = {}                                                                            # 파일 경로 -> 분석 결과
         total_files = len(project_files)                                                        # 전체 파일 수
-        completed_files = 0                                                                     # 완료된 파일 수
+        file_groups = self._group_identical_files(project_files)                               # (다이제스트, 내용이 동일한 파일 묶음)
+        # 큰 파일 묶음부터 분배 (LPT 스케줄링): 큰 파일이 마지막에 남아 나머지 워커가 노는 시간 감소
+        # 결과는 파일 경로로 모은 뒤 입력 순서대로 반환하므로 분배 순서는 결과에 영향 없음
+        file_sizes = stat_files(project_files)
+        file_groups.sort(key=lambda group: sum(file_sizes[f].st_size for f in group[1] if f in file_sizes), reverse=True)
 
         # 멀티프로세싱 풀로 병렬 처리 (CPU 집약적 작업이므로 프로세스 풀 사용)               # AST 파싱은 CPU 집약적이므로 멀티프로세싱 활용
-        with ProcessPoolExecutor(max_workers=self.options.max_workers) as executor:
-            # 모든 파일에 대해 분석 작업 제출
-            future_to_file = {
-                executor.submit(self._analyze_single_file, file_path): file_path               # 각 파일을 개별 프로세스에서 분석
-                for file_path in project_files
-            }
-
-            # 완료되는 대로 결과 수집
-            for future in as_completed(future_to_file):                                        # 완료 순서대로 결과 처리
-                file_path = future_to_file[future]                                             # 해당 파일 경로 가져오기
-                try:
-                    analysis = future.result()                                                  # 분석 결과 가져오기
-                    if analysis:                                                                # 분석 결과가 있으면
-                        analyses.append(analysis)                                               # 결과 리스트에 추가
+        executor = self._get_process_pool(len(file_groups))                                     # 세션 동안 유지되는 풀 (작업 수 상한까지 재사용)
 
-                except Exception as e:                                                          # 개별 파일 분석 실패시
-                    self.logger.warning(f"Parallel analysis failed for {file_path}: {e}")     # 경고 로그
+        try:
+            # 정렬된 묶음을 하나씩 전달 (chunksize=1: 연속 청크로 보내면 가장 큰 묶음들이 한 워커에 몰림)
+            task = partial(self._analyze_file_task, ast_cache=self.ast_cache)                   # 워커에서도 같은 디스크 캐시 사용
+            if type(executor) is ThreadPoolExecutor:                                            # 스레드 워커는 엔진의 분석기를 그대로 공유 (상태 없음)
+                task = partial(task, analyzer=self.ast_analyzer)
+            with _gc_paused():                                                                  # 결과 역직렬화 중 GC 반복 실행 방지
+                group_results = executor.map(task, file_groups, chunksize=1)                    # 비어 있는 워커가 다음으로 큰 묶음을 가져감
+                completed_files = 0
+                for file_path, analysis, error in chain.from_iterable(group_results):
+                    if error is not None:                                                       # 개별 파일 분석 실패시
+                        self.logger.warning(f"Parallel analysis failed for {file_path}: {error}")  # 경고 로그
+                    elif analysis:                                                              # 분석 결과가 있으면
+                        results[file_path] = _intern_analysis(analysis)                         # 결과 저장 (역직렬화된 문자열 공유)
+
+                    # 진행률 업데이트 (30%에서 시작해서 65%까지, 일정 간격으로만)               # 보고하지 않을 때는 메시지도 만들지 않음
+                    completed_files += 1
+                    if progress_callback.should_update(completed_files, total_files):
+                        progress_percentage = 30 + (35 * completed_files / total_files)
+                        progress_callback.update(f"Analyzing file {completed_files}/{total_files}", progress_percentage)
+        except BrokenExecutor:                                                                  # 워커가 비정상 종료된 경우
+            self._pool = None                                                                   # 다음 분석에서 새 풀 생성
+            raise
+
+        return [results[f] for f in project_files if f in results]                              # 입력 파일 순서대로 반환
+
+    def _get_process_pool(self, task_count: int = 0) -> Executor:
+        """병렬 분석용 워커 풀을 지연 생성하여 재사용 (task_count: 이번에 제출할 작업 수)
+
+        프로세스 워커가 처리한 작업이 워커당 _WORKER_MAX_TASKS를 넘으면 병렬 단계 사이에서 풀을 새로 만든다.
+        """
+        pool = self._pool
+        if (pool is not None and type(pool) is not ThreadPoolExecutor                           # 스레드 워커는 교체 불필요 (메모리 공유)
+                and self._pool_tasks >= _WORKER_MAX_TASKS * (self.options.max_workers or 1)):
+            self._pool = None
+            pool.shutdown(wait=True)                                                            # 이전 단계 작업은 모두 끝났으므로 바로 종료
+        if self._pool is None:                                                                  # 아직 생성되지 않았으면
+            self._pool = self._create_worker_pool(self.options)                                 # 워커 풀 생성
+            self._pool_tasks = 0
+        self._pool_tasks += task_count
+        return self._pool
 
-                completed_files += 1                                                            # 완료 카운터 증가
-                # 진행률 업데이트 (30%에서 시작해서 65%까지)                                   # 전체 분석 과정에서의 진행률 반영
-                progress_percentage = 30 + (35 * completed_files / total_files)
-                progress_callback.update(f"Analyzing file {completed_files}/{total_files}", progress_percentage)
+    @staticmethod
+    def _create_worker_pool(options: AnalysisOptions) -> Executor:
+        """사용 가능한 가장 가벼운 병렬 실행기 선택 (프로세스/서브인터프리터 워커는 _init_worker로 분석기 생성)
+
+        - use_processes=False 또는 PYVIEW_FORCE_THREADS=1: ThreadPoolExecutor (ast.parse의 C 구간 활용, IPC 없음)
+        - worker_start_method 지정: 해당 시작 방식의 ProcessPoolExecutor
+          ('forkserver'/'spawn'은 부모 프로세스의 힙과 실행 중인 스레드를 복제하지 않음)
+        - 지정하지 않았고 기본 방식이 fork인데 다른 스레드가 실행 중이면 forkserver(없으면 spawn)
+          (멀티스레드 프로세스의 fork는 교착 위험이 있으며 Python 3.12+에서 DeprecationWarning 발생)
+        - Python 3.14+: InterpreterPoolExecutor (서브인터프리터, 프로세스 fork 없음)
+        - 그 외: 플랫폼 기본 시작 방식의 ProcessPoolExecutor
+        """
+        max_workers = options.max_workers
+        if not options.use_processes or os.environ.get('PYVIEW_FORCE_THREADS') == '1':         # 스레드 사용 (결과 직렬화 없음)
+            return ThreadPoolExecutor(max_workers=max_workers)
 
-        return analyses                                                                         # 모든 파일 분석 결과 반환
+        worker_init = {'initializer': _init_worker, 'initargs': (options.enable_type_inference,)}  # 워커마다 분석기 1개 (작업마다 생성하지 않음)
+        interpreter_pool = getattr(concurrent.futures, 'InterpreterPoolExecutor', None)         # PEP 734 실행기 (있으면 우선 사용)
+        if interpreter_pool is not None and options.worker_start_method is None:
+            try:
+                return interpreter_pool(max_workers=max_workers, **worker_init)
+            except Exception as e:                                                              # 서브인터프리터 생성 불가시 프로세스 풀로 대체
+                logging.getLogger(__name__).debug(f"InterpreterPoolExecutor unavailable: {e}")
+
+        mp_context = multiprocessing.get_context(options.worker_start_method)                   # None이면 플랫폼 기본 컨텍스트
+        if (options.worker_start_method is None and mp_context.get_start_method() == 'fork'
+                and threading.active_count() > 1):                                              # 스레드(I/O 풀 등)가 살아 있으면 fork 대신 사용
+            mp_context = multiprocessing.get_context(
+                'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+        return ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context, **worker_init)  # 워커 프로세스 풀
     
     @staticmethod
     def _analyze_single_file(file_path: str) -> Optional[FileAnalysis]:
         """단일 파일 분석 (정적 메소드로 멀티프로세싱에서 사용)"""
         try:
-            analyzer = ASTAnalyzer()                                                            # 새 ASTAnalyzer 인스턴스 생성
-            return analyzer.analyze_file(file_path)                                             # 파일 분석 수행
+            return _WORKER_ANALYZER.analyze_file(file_path)                                     # 프로세스 공용 분석기로 파일 분석
         except Exception as e:                                                                  # 분석 실패시
             logging.getLogger(__name__).warning(f"Failed to analyze {file_path}: {e}")       # 로그 출력
             return None                                                                         # None 반환
-    
+
+    @staticmethod
+    def _analyze_file_task(file_group: Tuple[Optional[str], List[str]],
+                           ast_cache: Optional[SourceASTCache] = None,
+                           analyzer: Optional[ASTAnalyzer] = None) -> List[Tuple[str, Optional[FileAnalysis], Optional[str]]]:
+        """executor.map 작업 단위 (map은 예외를 다시 발생시키므로 오류를 결과로 반환)
+
+        analyzer가 없으면 (프로세스 워커) 워커 프로세스 공용 분석기를 사용한다.
+        """
+        digest, file_paths = file_group
+        return AnalyzerEngine._analyze_file_group(analyzer or _WORKER_ANALYZER, file_paths, ast_cache, digest=digest)
+
+    def _group_identical_files(self, project_files: List[str]) -> List[Tuple[Optional[str], List[str]]]:
+        """SHA-256이 같은 파일끼리 묶어 (다이제스트, 파일 경로들) 목록 반환 (첫 등장 순서 유지)
+
+        계산한 다이제스트는 파일별로 기록해 두어 캐시 키/메타데이터 생성 시 다시 해싱하지 않는다.
+        다이제스트 캐시가 있으면 (mtime, size)가 이전 실행과 같은 파일은 읽지 않고 저장된 해시를 쓴다.
+        읽기에 실패한 파일은 다이제스트 None으로 단독 처리한다 (오류는 분석 단계에서 보고).
+        """
+        digests: Dict[str, Optional[str]] = {}                                                  # 파일 경로 -> 내용 해시 (읽기 실패시 None)
+        to_hash = project_files
+        digest_cache = self._digest_cache
+        if digest_cache is not None:                                                            # (mtime, size)가 그대로인 파일은 저장된 해시 사용
+            file_stats = stat_files(project_files)
+            to_hash = []
+            for file_path in project_files:
+                stat = file_stats.get(file_path)
+                digest = digest_cache.lookup(file_path, stat) if stat is not None else None
+                if digest is None:
+                    to_hash.append(file_path)
+                else:
+                    digests[file_path] = digest
+
+        # 읽기와 해싱은 GIL을 해제하므로 백그라운드 스레드에서 미리 수행
+        for file_path, digest, error in self._read_ahead(to_hash, hash_file):
+            digests[file_path] = digest if error is None else None
+            if error is None and digest_cache is not None and file_path in file_stats:
+                digest_cache.store(file_path, file_stats[file_path], digest)
+
+        groups: Dict[Any, Tuple[Optional[str], List[str]]] = {}                                 # 내용 해시 -> (해시, 파일 경로들)
+        for file_path in project_files:
+            digest = digests[file_path]
+            if digest is not None:
+                self._file_digests[file_path] = digest
+                groups.setdefault(digest, (digest, []))[1].append(file_path)
+            else:
+                groups[file_path] = (None, [file_path])
+        return list(groups.values())
+
+    @staticmethod
+    def _read_file_bytes(file_path: str) -> bytes:
+        """파일 내용을 바이트로 읽기"""
+        return read_file_bytes(file_path)                                                       # 버퍼링 없이 한 번에 읽기
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """선행 읽기용 I/O 스레드 풀을 지연 생성하여 재사용 (스레드 수는 max_workers와 8 중 작은 값)"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=min(8, self.options.max_workers or 1),
+                                               thread_name_prefix="pyview-io")
+        return self._io_pool
+
+    def _read_ahead(self, items: List[Any], read: Callable[[Any], Any],
+                    window: int = 32) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+        """최대 window개 항목을 백그라운드 스레드로 미리 읽으며 입력 순서대로 (항목, 결과, 오류) 생성
+
+        제출 큐(스레드 풀)와 완료 큐(순서 보장 deque)를 분리하여 디스크 대기 시간을 호출자의 CPU 작업과 겹친다.
+        스레드 풀은 엔진의 I/O 풀을 재사용한다 (호출마다 생성하지 않음).
+        """
+        def resolve(item, future):
+            try:
+                return item, future.result(), None
+            except Exception as e:                                                              # 읽기 실패는 호출자에게 전달
+                return item, None, e
+
+        reader = self._get_io_pool()                                                            # I/O 전용 스레드
+        pending = deque()                                                                       # 제출 순서대로 대기 중인 작업
+        try:
+            for item in items:
+                pending.append((item, reader.submit(read, item)))
+                if len(pending) >= window:                                                      # 선행 읽기 한도 도달시 가장 오래된 결과부터 소비
+                    yield resolve(*pending.popleft())
+            while pending:
+                yield resolve(*pending.popleft())
+        finally:
+            for _, future in pending:                                                           # 중단된 경우 아직 시작하지 않은 읽기 취소
+                future.cancel()
+
+    @staticmethod
+    def _analyze_file_group(analyzer: ASTAnalyzer, file_group: List[str],
+                            ast_cache: Optional[SourceASTCache],
+                            content: Optional[bytes] = None,
+                            digest: Optional[str] = None) -> List[Tuple[str, Optional[FileAnalysis], Optional[str]]]:
+        """내용이 동일한 파일 묶음 분석 (파싱은 한 번, 심볼 수집은 경로별)
+
+        모듈 이름과 엔티티 ID는 파일 경로에서 만들어지므로 분석 결과 자체는 경로마다 생성하고,
+        경로와 무관한 AST만 공유한다. 디스크 캐시가 있으면 경로별로 먼저 조회한다.
+        digest는 그룹화 단계에서 계산한 내용 SHA-256이며, 없을 때만 여기서 해싱한다.
+        """
+        if content is None:                                                                     # 미리 읽은 내용이 없으면 직접 읽기
+            try:
+                content = AnalyzerEngine._read_file_bytes(file_group[0])                        # 해싱과 파싱에 같은 바이트 사용
+            except (OSError, IOError) as e:
+                return [(file_path, None, str(e)) for file_path in file_group]
+
+        if ast_cache is not None and digest is None:                                            # 그룹화 없이 호출된 경우에만 해싱
+            digest = hash_bytes(content)
+
+        results = []
+        tree = None                                                                             # 묶음 내 공유 AST (첫 캐시 미스에서 파싱)
+        parsed = False
+        for file_path in file_group:
+            try:
+                key = (ast_cache.make_key(file_path, digest, analyzer.cache_tag)                # 소스 해시 + 경로 + 버전 + 분석기 옵션
+                       if ast_cache is not None else None)
+                analysis = ast_cache.load(key) if key is not None else None
+                if analysis is None:                                                            # 캐시 미스: 분석 후 저장
+                    if not parsed and len(file_group) > 1:                                      # 중복 파일이 있을 때만 미리 파싱
+                        parsed = True
+                        try:
+                            tree = parse_source(content, file_path)
+                        except SyntaxError:
+                            tree = None                                                         # 경로별로 다시 파싱하며 오류 보고
+                    analysis = analyzer.analyze_source(file_path, content, tree=tree)
+                    if analysis is not None and key is not None:
+                        ast_cache.store(key, analysis)
+                results.append((file_path, analysis, None))                                     # (경로, 분석 결과, 오류 없음)
+            except Exception as e:                                                              # 분석 실패시
+                results.append((file_path, None, str(e)))                                       # (경로, 결과 없음, 오류 메시지)
+        return results
+
     def _integrate_analyses(self, pydeps_result: Dict, ast_analyses: List[FileAnalysis],
                            progress_callback: ProgressCallback) -> Dict:
-        """pydeps와 AST 분석 결과를 통합하여 완전한 5단계 의존성 그래프 생성"""
+        """pydeps와 AST 분석 결과를 통합하여 완전한 5단계 의존성 그래프 생성
+
+        입력이 같으면 이전 통합 결과를 재사용한다. 캐시에는 피클로 직렬화한 사본을 보관하고
+        적중할 때마다 새로 복원하므로, 호출자가 반환값을 수정해도 캐시나 다른 결과에 영향이 없다.
+        """
+        # 입력이 이전 분석과 같으면 (모든 파일 내용 + pydeps 결과 동일) 통합/순환 탐지 전체 생략
+        fingerprint = self._integration_fingerprint(pydeps_result, ast_analyses)
+        cached = self._integration_cache.get(fingerprint) if fingerprint is not None else None
+        if cached is not None:
+            self._integration_cache.move_to_end(fingerprint)                                    # LRU 갱신
+            self.logger.info("Inputs unchanged, reusing integrated analysis results")
+            return pickle.loads(cached)                                                         # 호출마다 독립된 사본 복원
 
         # 1단계: pydeps와 AST 결과 통합 (모듈-클래스-메소드-필드 계층 구조 완성)             # 1단계(모듈)와 2-5단계(클래스/메소드/필드) 연결
         packages, modules, relationships = self.legacy_bridge.merge_with_ast_analysis(
@@ -428,30 +987,34 @@ class AnalyzerEngine:
         )
 
         # 2단계: AST 분석 결과에서 엔티티 추출 (클래스, 메소드, 필드)                         # AST에서 추출한 상세 정보를 표준 모델로 변환
-        all_classes = []                                                                        # 클래스 정보 리스트
-        all_methods = []                                                                        # 메소드 정보 리스트
-        all_fields = []                                                                         # 필드 정보 리스트
-
-        for analysis in ast_analyses:                                                           # 각 파일의 분석 결과 처리
-            if analysis:                                                                        # 분석 결과가 있으면
-                all_classes.extend(analysis.classes)                                           # 클래스들을 전체 리스트에 추가
-                all_methods.extend(analysis.methods)                                           # 메소드들을 전체 리스트에 추가
-                all_fields.extend(analysis.fields)                                             # 필드들을 전체 리스트에 추가
-
-        # 3단계: 상세한 순환 참조 탐지 (클래스/메소드 레벨까지)                                # pydeps 모듈 레벨 순환 참조에 더해 상세 레벨 순환 참조 탐지
-        additional_cycles = self._detect_detailed_cycles(all_classes, all_methods, relationships)
-        # pydeps 실패시 AST 분석으로부터 import 순환 참조 추가 탐
-        ast_import_cycles = self._detect_import_cycles_from_ast(ast_analyses)
-        
-        # 집계된 ModuleInfo.imports로 구축한 모듈 레벨 import 순환으로 보강 
-        module_import_cycles = self._detect_import_cycles_from_modules(modules)
-        all_cycles = pydeps_result['cycles'] + additional_cycles + ast_import_cycles + module_import_cycles                              # 모든 레벨의 순환 참조 통합
+        # 파일별 리스트를 C 레벨에서 한 번에 연결 (중간 extend 반복 없음)
+        valid_analyses = [analysis for analysis in ast_analyses if analysis]                   # 분석 결과가 있는 파일만
+        all_classes = list(chain.from_iterable(a.classes for a in valid_analyses))             # 클래스 정보 리스트
+        all_methods = list(chain.from_iterable(a.methods for a in valid_analyses))             # 메소드 정보 리스트
+        all_fields = list(chain.from_iterable(a.fields for a in valid_analyses))               # 필드 정보 리스트
+
+        # 3단계: 상세한 순환 참조 탐지 (클래스/메소드 레벨 + AST/ModuleInfo 기반 import 순환)   # pydeps 모듈 레벨 순환 참조에 더해 상세 레벨 순환 참조 탐지
+        cycle_detection = 'full'                                                                # 결과 메트릭에 기록할 탐지 범위
+        if self.options.cycle_algorithm == 'dfs':                                               # 기존 방식: 탐지기별로 그래프 구축 및 SCC 실행
+            additional_cycles = self._detect_detailed_cycles(all_classes, all_methods, relationships)
+            ast_import_cycles = self._detect_import_cycles_from_ast(ast_analyses)               # pydeps 실패시 AST 분석으로부터 import 순환 참조 추가 탐지
+            module_import_cycles = self._detect_import_cycles_from_modules(modules)             # 집계된 ModuleInfo.imports 기반 import 순환으로 보강
+            detected_cycles = additional_cycles + ast_import_cycles + module_import_cycles
+        elif len(ast_analyses) > self._FULL_CYCLE_DETECTION_LIMIT:                             # 매우 큰 입력: 전체 SCC 대신 상호 참조 쌍만 탐지
+            self.logger.warning(f"{len(ast_analyses)} files exceed {self._FULL_CYCLE_DETECTION_LIMIT}, "
+                                "reporting only direct mutual dependencies as cycles; longer cycles are not detected")
+            detected_cycles = self._detect_mutual_cycles(relationships, ast_analyses, modules)
+            cycle_detection = 'mutual_only'                                                     # 길이 2 순환만 탐지됨
+        else:                                                                                   # 세 계층을 하나의 그래프로 묶어 SCC 1회 실행
+            detected_cycles = self._detect_cycles_fused(relationships, ast_analyses, modules)
+        all_cycles = pydeps_result['cycles'] + detected_cycles                                  # 모든 레벨의 순환 참조 통합
 
         # 4단계: 향상된 메트릭 계산 (모든 엔티티에 대한 품질 지표)                             # 통합된 데이터로 포괄적인 품질 메트릭 계산
         enhanced_metrics = self._calculate_enhanced_metrics(
             packages, modules, all_classes, all_methods, relationships                         # 모든 레벨의 엔티티와 관계 정보
         )
-        return {
+        enhanced_metrics['cycle_detection'] = cycle_detection                                   # 순환 탐지가 부분적이었는지 표시
+        integrated = {
             'packages': packages,                                                               # 통합된 패키지 정보
             'modules': modules,                                                                 # 통합된 모듈 정보
             'classes': all_classes,                                                             # AST에서 추출한 클래스 정보
@@ -461,360 +1024,357 @@ class AnalyzerEngine:
             'cycles': all_cycles,                                                               # 모든 레벨의 순환 참조
             'metrics': enhanced_metrics                                                         # 계산된 품질 메트릭
         }
+
+        if fingerprint is not None:                                                             # 통합 결과 저장
+            self._integration_cache[fingerprint] = pickle.dumps(integrated, protocol=pickle.HIGHEST_PROTOCOL)  # 반환값과 분리된 고정 사본
+            if len(self._integration_cache) > self._integration_cache_size:                     # 캐시 크기 제한 초과 시
+                self._integration_cache.popitem(last=False)                                     # 가장 오래된 항목 제거
+        return integrated
+
+    def _integration_fingerprint(self, pydeps_result: Dict, ast_analyses: List[FileAnalysis]) -> Optional[bytes]:
+        """통합 입력에 대한 BLAKE2b 지문 (AST 쪽은 파일별 내용 SHA-256 사용, 모르는 파일이 있으면 None)"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{self.options.cycle_algorithm}\n".encode())                                  # 순환 탐지 방식
+
+        for analysis in ast_analyses:                                                           # AST 결과는 (경로, 내용)으로 결정됨
+            if analysis is None:
+                h.update(b"\n")
+                continue
+            digest = self._file_digests.get(analysis.file_path)
+            if digest is None:                                                                  # 내용 해시를 모르면 지문 계산 불가
+                return None
+            h.update(f"{analysis.file_path}\0{digest}\n".encode())
+
+        for package in pydeps_result['packages']:                                               # pydeps 결과 (모듈 수준이므로 작음)
+            h.update(f"{package.id}\n".encode())
+        for module in pydeps_result['modules']:
+            h.update(f"{module.id}\0{module.name}\0{module.file_path}\n".encode())
+        for rel in pydeps_result['relationships']:
+            h.update(f"{rel.from_entity}\0{rel.to_entity}\0{rel.relationship_type}\n".encode())
+        for cycle in pydeps_result['cycles']:
+            h.update(f"{cycle!r}\n".encode())
+        return h.digest()
     
+    def _get_edge_index(self, relationships: List[Relationship]) -> EdgeIndex:
+        """관계 목록의 소스/타겟 열 인덱스 (같은 관계 목록이면 한 번만 생성)"""
+        if (self._edge_index is None or self._edge_index_source is not relationships
+                or len(self._edge_index) != len(relationships)):
+            self._edge_index = EdgeIndex.from_objects(relationships)                            # 관계 목록을 한 번만 순회
+            self._edge_index_source = relationships
+        return self._edge_index
+
+    # 통합 그래프의 계층 태그 (노드 키 = (계층, 이름)으로 계층 간 노드가 섞이지 않음)
+    _LAYER_DETAILED = 0                                                                         # 클래스/메소드 관계
+    _LAYER_AST_IMPORT = 1                                                                       # AST import 그래프
+    _LAYER_MODULE_IMPORT = 2                                                                    # ModuleInfo.imports 그래프
+
+    # 이 파일 수를 넘으면 전체 SCC 탐지 대신 상호 참조 쌍(길이 2 순환)만 보고
+    _FULL_CYCLE_DETECTION_LIMIT = 10000
+
+    def _detect_mutual_cycles(self, relationships: List[Relationship], ast_analyses: List[FileAnalysis],
+                              modules: List[ModuleInfo]) -> List[CycleRecord]:
+        """서로를 직접 참조하는 쌍만 순환으로 보고 (간선 해시 조회만 사용, 그래프 구축/SCC 없음)
+
+        결과 형식과 계층 순서(상세 -> AST import -> 모듈 import)는 전체 탐지와 같다.
+        """
+        detailed_pairs = mutual_edge_pairs(self._get_edge_index(relationships).edges())
+        ast_pairs = mutual_edge_pairs(iter_adjacency_edges(self._build_ast_import_graph(ast_analyses)))
+        module_pairs = mutual_edge_pairs(iter_adjacency_edges(self._build_module_import_graph(modules)))
+
+        return ([self._make_detailed_cycle(i, [u, v, u]) for i, (u, v) in enumerate(detailed_pairs)] +
+                [self._make_import_cycle(i, [u, v], [(u, v), (v, u)], 'ast') for i, (u, v) in enumerate(ast_pairs)] +
+                [self._make_import_cycle(i, [u, v], [(u, v), (v, u)], 'module_list') for i, (u, v) in enumerate(module_pairs)])
+
+    def _detect_cycles_fused(self, relationships: List[Relationship], ast_analyses: List[FileAnalysis],
+                             modules: List[ModuleInfo]) -> List[CycleRecord]:
+        """상세/AST import/모듈 import 세 계층을 하나의 CSR 그래프로 만들어 Tarjan을 한 번만 실행"""
+        ast_import_graph = self._build_ast_import_graph(ast_analyses)                           # AST 기반 모듈 import 그래프
+        module_import_graph = self._build_module_import_graph(modules)                          # ModuleInfo 기반 import 그래프
+
+        # 엔티티 ID는 계층별 사전에서 정수로 한 번만 변환 (간선마다 (계층, ID) 튜플을 만들고 해싱하지 않음)
+        # 세 사전이 같은 카운터를 공유하므로 노드 번호는 계층 순서 -> 계층 내 첫 등장 순서
+        next_node = count().__next__
+        layer_nodes = {layer: defaultdict(next_node) for layer in
+                       (self._LAYER_DETAILED, self._LAYER_AST_IMPORT, self._LAYER_MODULE_IMPORT)}
+        endpoints = array('i', chain(
+            map(layer_nodes[self._LAYER_DETAILED].__getitem__,                                   # 관계 간선 (공유 열에서 C 레벨로 변환)
+                chain.from_iterable(self._get_edge_index(relationships).edges())),
+            map(layer_nodes[self._LAYER_AST_IMPORT].__getitem__,
+                chain.from_iterable(iter_adjacency_edges(ast_import_graph))),
+            map(layer_nodes[self._LAYER_MODULE_IMPORT].__getitem__,
+                chain.from_iterable(iter_adjacency_edges(module_import_graph))),
+        ))
+        node_ids = list(chain.from_iterable(zip(repeat(layer), nodes) for layer, nodes in layer_nodes.items()))  # 노드 -> (계층, ID)
+        graph = CSRGraph.from_index_edges(node_ids, endpoints[0::2], endpoints[1::2])
+
+        # 계층별로 순환을 분리 (기존 탐지기와 같은 순서/형식으로 반환)
+        layer_cycles: Dict[int, List[CycleRecord]] = {
+            self._LAYER_DETAILED: [], self._LAYER_AST_IMPORT: [], self._LAYER_MODULE_IMPORT: []
+        }
+        for component in tarjan_scc(graph, skip_sinks=True):
+            layer = graph.ids[component[0]][0]                                                  # 계층 간 간선이 없으므로 SCC는 한 계층에 속함
+            cycles = layer_cycles[layer]
+            if layer == self._LAYER_DETAILED:
+                cycle_path = find_cycle_in_component(graph, component)                          # SCC 내부의 대표 순환 경로
+                if cycle_path:
+                    cycles.append(self._make_detailed_cycle(len(cycles), [graph.ids[i][1] for i in cycle_path]))
+                continue
+
+            names = [graph.ids[i][1] for i in component]
+            import_graph = ast_import_graph if layer == self._LAYER_AST_IMPORT else module_import_graph
+            internal_edges = self._component_import_edges(import_graph, names)                  # SCC 내부 간선
+            if layer == self._LAYER_AST_IMPORT:
+                if len(component) >= 2 or internal_edges:                                       # 2개 이상 또는 자기 자신 import
+                    cycles.append(self._make_import_cycle(len(cycles), names, internal_edges, 'ast'))
+            elif len(component) >= 2:
+                cycles.append(self._make_import_cycle(len(cycles), names, internal_edges, 'module_list'))
+
+        return (layer_cycles[self._LAYER_DETAILED] + layer_cycles[self._LAYER_AST_IMPORT] +
+                layer_cycles[self._LAYER_MODULE_IMPORT])
+
+    @staticmethod
+    def _make_detailed_cycle(index: int, cycle: List[str]) -> CycleRecord:
+        """상세(클래스/메소드) 순환 정보 생성"""
+        return CycleRecord(
+            id=f"detailed_cycle_{index}",                                                       # 고유 순환 ID
+            entities=cycle,                                                                     # 순환에 참여하는 엔티티들
+            cycle_type='call',  # 대부분의 상세 순환은 메소드 호출                              # 순환 타입
+            severity='low' if len(cycle) <= 2 else 'medium',                                   # 심각도 (길이에 따라)
+            description=f"Call cycle involving {len(cycle)} entities",                         # 순환 설명
+            paths=[],                                                                           # 경로 정보 없음
+            metrics=None
+        )
+
+    @staticmethod
+    def _make_import_cycle(index: int, component: List[str], edges: List[Tuple[str, str]],
+                           detection_method: str) -> CycleRecord:
+        """모듈 import 순환 정보 생성 (detection_method: 'ast' 또는 'module_list')"""
+        id_of = dict(zip(component, map(create_module_id, component)))                         # 모듈 ID는 멤버당 한 번만 생성 (간선 끝점은 모두 멤버)
+        paths = _LazyPaths(lambda: [{                                                           # 경로 딕셔너리는 첫 접근 시 생성
+            'from': id_of[u],
+            'to': id_of[v],
+            'relationship_type': 'import',
+            'strength': 1.0
+        } for u, v in edges], len(edges))
+
+        if detection_method == 'ast':
+            cycle_id = f"ast_import_cycle_{index}"
+            if len(component) == 1:
+                description = "AST-detected self import cycle"
+            else:
+                description = f"AST-detected import cycle involving {len(component)} modules"
+        else:
+            cycle_id = f"mod_import_cycle_{index}"
+            description = f"Module import cycle involving {len(component)} modules"
+
+        return CycleRecord(
+            id=cycle_id,
+            entities=list(id_of.values()),
+            cycle_type='import',
+            severity='high' if len(component) > 3 else 'medium',
+            description=description,
+            paths=paths,
+            metrics={
+                'length': len(component),
+                'detection_method': detection_method
+            }
+        )
+
+    def _build_module_import_graph(self, modules: List[ModuleInfo]) -> Dict[str, Set[str]]:
+        """ModuleInfo.imports로 모듈 import 그래프 구축 (module_name -> imported module names)"""
+        graph: DefaultDict[str, Set[str]] = defaultdict(set)
+        module_of = attrgetter('module')
+        for m in modules or []:
+            graph[m.name].update(filter(None, map(module_of, getattr(m, 'imports', []) or [])))  # 모듈당 키 조회 1회
+        return graph
+
+    def _build_ast_import_graph(self, ast_analyses: List[FileAnalysis]) -> Dict[str, Set[str]]:
+        """AST 분석 결과의 import 정보로 모듈 import 그래프 구축"""
+        import_graph: DefaultDict[str, Set[str]] = defaultdict(set)
+        import_module_of = attrgetter('module')
+        for analysis in ast_analyses or []:
+            if not analysis or not analysis.file_path:
+                continue
+
+            module_name = self._file_path_to_module_name(analysis.file_path)
+            # Extract imports from AST analysis (relative imports resolved best-effort, in one C-level pass)
+            import_graph[module_name].update(filter(None, map(_resolve_import_name, map(import_module_of, analysis.imports))))
+        return import_graph
+
     def _detect_detailed_cycles(self, classes: List[ClassInfo], methods: List[MethodInfo],
-                              relationships: List[Relationship]) -> List[Dict]:
+                              relationships: List[Relationship]) -> List[CycleRecord]:
         """클래스와 메소드 레벨의 상세한 순환 참조 탐지"""
+        if self.options.cycle_algorithm == 'dfs':                                               # 기존 경로 DFS 방식 (비교용)
+            return self._detect_detailed_cycles_dfs(relationships)
+
+        # 엔티티 ID를 정수로 변환한 CSR 그래프에서 Tarjan SCC 실행                             # 해시 조회 없는 정수 배열 순회
+        graph = CSRGraph.from_edges(self._get_edge_index(relationships).edges())                  # 공유 열에서 (from, to) 간선 생성
+        cycles = []                                                                             # 탐지된 순환 참조 리스트
+
+        for component in tarjan_scc(graph, skip_sinks=True):                                    # 각 강한 연결 요소에 대해 (말단 노드 제외)
+            cycle_path = find_cycle_in_component(graph, component)                              # SCC 내부의 대표 순환 경로
+            if not cycle_path:                                                                  # 순환이 없는 단일 노드는 제외
+                continue
+            cycle = [graph.ids[i] for i in cycle_path]                                          # 정수 인덱스를 엔티티 ID로 복원
+            cycles.append(self._make_detailed_cycle(len(cycles), cycle))
+
+        return cycles                                                                           # 탐지된 모든 순환 참조 반환
+
+    def _detect_detailed_cycles_dfs(self, relationships: List[Relationship]) -> List[CycleRecord]:
+        """경로 기반 DFS로 상세 순환 참조 탐지 (기존 방식)"""
         cycles = []                                                                             # 탐지된 순환 참조 리스트
 
         # 관계들로부터 인접 그래프 구축 (방향성 그래프)                                           # 의존성 관계를 그래프로 표현
-        graph = {}                                                                              # 인접 리스트 그래프
+        graph: DefaultDict[str, Set[str]] = defaultdict(set)                                   # 인접 리스트 그래프 (간선당 키 조회 1회)
         for rel in relationships:                                                               # 모든 관계에 대해
-            if rel.from_entity not in graph:                                                   # 소스 엔티티가 그래프에 없으면
-                graph[rel.from_entity] = set()                                                 # 빈 집합으로 초기화
-            graph[rel.from_entity].add(rel.to_entity)                                         # 타겟 엔티티 추가 (방향성 간선)
+            graph[rel.from_entity].add(rel.to_entity)                                           # 타겟 엔티티 추가 (방향성 간선)
 
         # 단순한 DFS 기반 순환 탐지 (각 노드에서 시작)                                          # 깊이 우선 탐색으로 순환 찾기
         visited = set()                                                                        # 전체 탐색에서 방문한 노드들
+        depth = {}                                                                             # 현재 경로상 노드 -> 경로 내 위치 (O(1) 조회용)
 
         def has_cycle(node, path):
-            """현재 경로에서 순환이 있는지 확인"""
-            if node in path:                                                                   # 현재 경로에 이미 있으면 순환 발견
-                cycle_start = path.index(node)                                                 # 순환 시작 지점 찾기
-                return path[cycle_start:] + [node]                                             # 순환 경로 반환
-
-            if node not in graph:                                                              # 더 이상 연결된 노드가 없으면
-                return None                                                                    # 순환 없음
-
+            """현재 경로에서 순환이 있는지 확인 (호출 전에 경로/그래프 확인을 마친 노드만 진입)"""
+            depth[node] = len(path)                                                            # 경로 내 위치 기록
             path.append(node)                                                                  # 현재 노드를 경로에 추가
             for neighbor in graph[node]:                                                       # 연결된 모든 이웃 노드에 대해
-                cycle = has_cycle(neighbor, path)                                              # 재귀적으로 순환 탐지
-                if cycle:                                                                      # 순환이 발견되면
-                    return cycle                                                               # 순환 경로 반환
+                if neighbor in depth:                                                          # 현재 경로에 이미 있으면 순환 발견
+                    return path[depth[neighbor]:] + [neighbor]                                 # 순환 시작 지점부터 경로 반환 (index 탐색 없음)
+                if neighbor in graph:                                                          # 나가는 간선이 있는 노드만 재귀 (호출 프레임 절약)
+                    cycle = has_cycle(neighbor, path)                                          # 재귀적으로 순환 탐지
+                    if cycle:                                                                  # 순환이 발견되면
+                        return cycle                                                           # 순환 경로 반환
             path.pop()                                                                         # 백트래킹 (현재 경로에서 노드 제거)
+            del depth[node]                                                                    # 경로 위치 정보도 함께 제거
             return None                                                                        # 이 경로에서는 순환 없음
 
         # 모든 노드에서 순환 탐지 시작                                                           # 연결되지 않은 컴포넌트도 모두 확인
         for node in graph:                                                                     # 그래프의 모든 노드에 대해
             if node not in visited:                                                            # 아직 방문하지 않은 노드면
+                depth.clear()                                                                   # 순환 발견으로 조기 반환된 이전 경로 정보 초기화
                 cycle = has_cycle(node, [])                                                     # 순환 탐지 시작
                 if cycle:                                                                       # 순환이 발견되면
-                    cycle_info = {                                                              # 순환 정보 생성
-                        'id': f"detailed_cycle_{len(cycles)}",                                 # 고유 순환 ID
-                        'entities': cycle,                                                      # 순환에 참여하는 엔티티들
-                        'cycle_type': 'call',  # 대부분의 상세 순환은 메소드 호출               # 순환 타입
-                        'severity': 'low' if len(cycle) <= 2 else 'medium',                   # 심각도 (길이에 따라)
-                        'description': f"Call cycle involving {len(cycle)} entities"           # 순환 설명
-                    }
-                    cycles.append(cycle_info)                                                   # 순환 리스트에 추가
+                    cycles.append(self._make_detailed_cycle(len(cycles), cycle))                # 순환 리스트에 추가
 
         return cycles                                                                           # 탐지된 모든 순환 참조 반환
 
-    def _detect_import_cycles_from_modules(self, modules: List[ModuleInfo]) -> List[Dict]:
+    def _detect_import_cycles_from_modules(self, modules: List[ModuleInfo]) -> List[CycleRecord]:
         """Detect import cycles using consolidated ModuleInfo.imports.
         This complements AST-based detection and helps catch cycles missed by path-based normalization."""
-        cycles: List[Dict] = []
         if not modules:
-            return cycles
+            return []
 
         # Build module import graph: module_name -> set(imported_module_name)
-        graph: Dict[str, Set[str]] = {}
-        for m in modules:
-            src = m.name
-            graph.setdefault(src, set())
-            for imp in getattr(m, 'imports', []) or []:
-                target = imp.module
-                if target:
-                    graph[src].add(target)
-
-        # Kosaraju to find SCCs
-        visited: Set[str] = set()
-        order: List[str] = []
-        def dfs1(n: str) -> None:
-            visited.add(n)
-            for nb in graph.get(n, set()):
-                if nb not in visited and nb in graph:
-                    dfs1(nb)
-            order.append(n)
-        for n in list(graph.keys()):
-            if n not in visited:
-                dfs1(n)
-        transpose: Dict[str, Set[str]] = {}
-        for u, nbrs in graph.items():
-            transpose.setdefault(u, set())
-            for v in nbrs:
-                transpose.setdefault(v, set()).add(u)
-        visited.clear()
-        def dfs2(n: str, comp: List[str]) -> None:
-            visited.add(n)
-            comp.append(n)
-            for nb in transpose.get(n, set()):
-                if nb not in visited:
-                    dfs2(nb, comp)
-        cycle_id = 0
-        for n in reversed(order):
-            if n not in visited:
-                comp: List[str] = []
-                dfs2(n, comp)
-                if len(comp) >= 2:
-                    paths = []
-                    for u in comp:
-                        for v in graph.get(u, set()):
-                            if v in comp:
-                                paths.append({
-                                    'from': create_module_id(u),
-                                    'to': create_module_id(v),
-                                    'relationship_type': 'import',
-                                    'strength': 1.0
-                                })
-                    cycles.append({
-                        'id': f"mod_import_cycle_{cycle_id}",
-                        'entities': [create_module_id(x) for x in comp],
-                        'paths': paths,
-                        'cycle_type': 'import',
-                        'severity': 'high' if len(comp) > 3 else 'medium',
-                        'description': f"Module import cycle involving {len(comp)} modules",
-                        'metrics': {
-                            'length': len(comp),
-                            'detection_method': 'module_list'
-                        }
-                    })
-                    cycle_id += 1
+        graph = self._build_module_import_graph(modules)
+        return self._detect_import_cycles_in_graph(graph, 'module_list')
+
+    @staticmethod
+    def _component_import_edges(import_graph: Dict[str, Set[str]], names: List[str]) -> List[Tuple[str, str]]:
+        """SCC 내부 import 간선 목록 (이웃 집합 & 멤버 집합을 C 레벨 집합 연산으로 계산, 외부 간선은 Python에서 보지 않음)"""
+        members = set(names)
+        return [(u, v) for u in names for v in import_graph.get(u, _NO_IMPORTS) & members]
+
+    def _detect_import_cycles_in_graph(self, import_graph: Dict[str, Set[str]],
+                                       detection_method: str) -> List[CycleRecord]:
+        """Find import cycles with a single iterative Tarjan pass over the import graph.
+
+        SCCs with two or more modules are reported; for AST detection a module
+        importing itself is reported as well.
+        """
+        graph = CSRGraph.from_adjacency(import_graph)
+        cycles: List[CycleRecord] = []
+        for component in tarjan_scc(graph, skip_sinks=True):
+            if len(component) == 1 and not (detection_method == 'ast' and has_self_loop(graph, component[0])):
+                continue
+            names = [graph.ids[i] for i in component]
+            internal_edges = self._component_import_edges(import_graph, names)
+            cycles.append(self._make_import_cycle(len(cycles), names, internal_edges, detection_method))
         return cycles
     
-    def _detect_cycles_by_type(self, relationships: List[Relationship], cycle_type: str) -> List[Dict]:
+    def _detect_cycles_by_type(self, relationships: List[Relationship], cycle_type: str) -> List[CycleRecord]:
         """Detect cycles for a specific relationship type"""
         cycles = []
         
         if not relationships:
             return cycles
-        
-        # Build adjacency graph
-        graph = {}
-        edge_info = {}  # Store relationship details
-        
-        for rel in relationships:
-            if rel.from_entity not in graph:
-                graph[rel.from_entity] = set()
-            graph[rel.from_entity].add(rel.to_entity)
-            edge_info[(rel.from_entity, rel.to_entity)] = rel
-        
-        # Find strongly connected components using DFS
-        visited = set()
-        finished = set()
-        stack = []
-        
-        def dfs1(node):
-            if node in visited:
-                return
-            visited.add(node)
-            for neighbor in graph.get(node, []):
-                dfs1(neighbor)
-            stack.append(node)
-        
-        # First DFS to get finish times
-        for node in graph:
-            dfs1(node)
-        
-        # Build reverse graph
-        reverse_graph = {}
-        for node in graph:
-            for neighbor in graph[node]:
-                if neighbor not in reverse_graph:
-                    reverse_graph[neighbor] = set()
-                reverse_graph[neighbor].add(node)
-        
-        # Second DFS on reverse graph
-        visited.clear()
-        
-        def dfs2(node, component):
-            if node in visited:
-                return
-            visited.add(node)
-            component.append(node)
-            for neighbor in reverse_graph.get(node, []):
-                dfs2(neighbor, component)
-        
-        # Find SCCs
-        while stack:
-            node = stack.pop()
-            if node not in visited:
-                component = []
-                dfs2(node, component)
-                
-                # Only consider components with cycles (size > 1)
-                if len(component) > 1:
-                    # Extract cycle path
-                    cycle_paths = []
-                    for i, entity in enumerate(component):
-                        next_entity = component[(i + 1) % len(component)]
-                        # Check if direct edge exists
-                        if entity in graph and next_entity in graph[entity]:
-                            rel = edge_info.get((entity, next_entity))
-                            if rel:
-                                cycle_paths.append({
-                                    'from': entity,
-                                    'to': next_entity,
-                                    'relationship_type': cycle_type,
-                                    'strength': rel.strength if hasattr(rel, 'strength') else 1.0,
-                                    'line_number': rel.line_number,
-                                    'file_path': rel.file_path
-                                })
-                    
-                    # Calculate severity based on cycle type and length
-                    if cycle_type == 'import':
-                        severity = 'high' if len(component) > 3 else 'medium'
-                    else:
-                        severity = 'low' if len(component) <= 2 else 'medium'
-                    
-                    cycle_info = {
-                        'id': f"{cycle_type}_cycle_{len(cycles)}",
-                        'entities': component,
-                        'paths': cycle_paths,
-                        'cycle_type': cycle_type,
-                        'severity': severity,
-                        'metrics': {
-                            'length': len(component),
-                            'edge_count': len(cycle_paths)
-                        },
-                        'description': f"{cycle_type.title()} cycle involving {len(component)} entities"
-                    }
-                    cycles.append(cycle_info)
-
-        # 모든 노드에서 시작하여 순환 확인                                                      # 모든 연결 컴포넌트 확인
-        for node in graph:                                                                      # 그래프의 모든 노드에 대해
-            if node not in visited:                                                             # 아직 방문하지 않은 노드만
-                cycle = has_cycle(node, [])                                                     # 순환 탐지 시작
-                if cycle:                                                                       # 순환이 발견되면
-                    cycle_info = {                                                              # 순환 정보 생성
-                        'id': f"detailed_cycle_{len(cycles)}",                                 # 고유 순환 ID
-                        'entities': cycle,                                                      # 순환에 참여하는 엔티티들
-                        'cycle_type': 'call',  # 대부분의 상세 순환은 메소드 호출               # 순환 타입
-                        'severity': 'low' if len(cycle) <= 2 else 'medium',                   # 심각도 (길이에 따라)
-                        'description': f"Call cycle involving {len(cycle)} entities"           # 순환 설명
-                    }
-                    cycles.append(cycle_info)                                                   # 순환 리스트에 추가
 
-        return cycles                                                                           # 탐지된 모든 순환 참조 반환
-    
-    def _detect_import_cycles_from_ast(self, ast_analyses: List[FileAnalysis]) -> List[Dict]:
-        """Detect import cycles from AST analysis when pydeps fails"""
-        cycles = []
+        # One canonical type string shared by every record and path dict, even if the caller built it dynamically
+        cycle_type = sys.intern(cycle_type)
         
-        if not ast_analyses:
+        # Build adjacency graph (integer CSR); edges stay as int32 source/target columns parallel to relationships
+        node_index = defaultdict(count().__next__)          # entity ID -> node index, in first-seen order
+        endpoints = array('i', map(node_index.__getitem__, chain.from_iterable(self._get_edge_index(relationships).edges())))
+        srcs, dsts = endpoints[0::2], endpoints[1::2]
+        graph = CSRGraph.from_index_edges(list(node_index), srcs, dsts)
+
+        # Find strongly connected components with one iterative Tarjan pass (only those with cycles: size > 1)
+        components = [component for component in tarjan_scc(graph, skip_sinks=True) if len(component) > 1]
+        if not components:
             return cycles
-        
-        # Build import graph from AST analysis
-        import_graph: Dict[str, Set[str]] = {}
-        file_to_module: Dict[str, str] = {}
-        
-        for analysis in ast_analyses:
-            if not analysis or not analysis.file_path:
-                continue
+
+        # Map the consecutive-member edges of each cycle back to relationships (last duplicate wins)
+        n = graph.num_nodes
+        edge_rel = {component[i] * n + component[(i + 1) % len(component)]: None
+                    for component in components for i in range(len(component))}
+        for rel_index, code in enumerate(map(add, map(mul, srcs, repeat(n)), dsts)):
+            if code in edge_rel:
+                edge_rel[code] = relationships[rel_index]
+
+        for component_idx in components:
+            component = [graph.ids[i] for i in component_idx]
             
-            module_name = self._file_path_to_module_name(analysis.file_path)
-            file_to_module[analysis.file_path] = module_name
-            import_graph.setdefault(module_name, set())
+            # Extract cycle path (direct edges between consecutive members; dicts are built on first access)
+            cycle_edges = []
+            for i, entity in enumerate(component):
+                next_entity = component[(i + 1) % len(component)]
+                # Check if direct edge exists
+                rel = edge_rel[component_idx[i] * n + component_idx[(i + 1) % len(component)]]
+                if rel is not None:
+                    cycle_edges.append((entity, next_entity, rel))
+            cycle_paths = _LazyPaths(partial(self._relationship_paths, cycle_edges, cycle_type), len(cycle_edges))
             
-            # Extract imports from AST analysis
-            for import_info in analysis.imports:
-                # Convert relative imports to absolute module names (best-effort)
-                imported_module = self._resolve_import_name(
-                    import_info.module, analysis.file_path
-                )
-                if imported_module:
-                    import_graph[module_name].add(imported_module)
-
-        # Use Kosaraju's algorithm to find all strongly connected components
-        # Step 1: Order vertices by finish time
-        visited: Set[str] = set()
-        order: List[str] = []
-
-        def dfs1(node: str) -> None:
-            visited.add(node)
-            for neighbor in import_graph.get(node, set()):
-                if neighbor not in visited and neighbor in import_graph:
-                    dfs1(neighbor)
-            order.append(node)
-
-        for node in list(import_graph.keys()):
-            if node not in visited:
-                dfs1(node)
-
-        # Step 2: Transpose graph
-        transpose: Dict[str, Set[str]] = {}
-        for u, neighbors in import_graph.items():
-            transpose.setdefault(u, set())
-            for v in neighbors:
-                transpose.setdefault(v, set()).add(u)
-
-        # Step 3: DFS on transposed graph to get SCCs
-        visited.clear()
-
-        def dfs2(node: str, component: List[str]) -> None:
-            visited.add(node)
-            component.append(node)
-            for neighbor in transpose.get(node, set()):
-                if neighbor not in visited:
-                    dfs2(neighbor, component)
-
-        cycle_id = 0
-        for node in reversed(order):
-            if node not in visited:
-                component: List[str] = []
-                dfs2(node, component)
-
-                # Emit cycles for SCCs with size >= 2
-                if len(component) >= 2:
-                    cycle_paths: List[Dict] = []
-                    # Add edges within the component as cycle paths
-                    for u in component:
-                        for v in import_graph.get(u, set()):
-                            if v in component:
-                                cycle_paths.append({
-                                    'from': create_module_id(u),
-                                    'to': create_module_id(v),
-                                    'relationship_type': 'import',
-                                    'strength': 1.0
-                                })
-                    cycles.append({
-                        'id': f"ast_import_cycle_{cycle_id}",
-                        'entities': [create_module_id(x) for x in component],
-                        'paths': cycle_paths,
-                        'cycle_type': 'import',
-                        'severity': 'high' if len(component) > 3 else 'medium',
-                        'description': f"AST-detected import cycle involving {len(component)} modules",
-                        'metrics': {
-                            'length': len(component),
-                            'detection_method': 'ast'
-                        }
-                    })
-                    cycle_id += 1
-                # Handle self-loop (module importing itself)
-                elif len(component) == 1:
-                    u = component[0]
-                    if u in import_graph.get(u, set()):
-                        cycles.append({
-                            'id': f"ast_import_cycle_{cycle_id}",
-                            'entities': [create_module_id(u)],
-                            'paths': [{
-                                'from': create_module_id(u),
-                                'to': create_module_id(u),
-                                'relationship_type': 'import',
-                                'strength': 1.0
-                            }],
-                            'cycle_type': 'import',
-                            'severity': 'medium',
-                            'description': "AST-detected self import cycle",
-                            'metrics': {
-                                'length': 1,
-                                'detection_method': 'ast'
-                            }
-                        })
-                        cycle_id += 1
+            # Calculate severity based on cycle type and length
+            if cycle_type == 'import':
+                severity = 'high' if len(component) > 3 else 'medium'
+            else:
+                severity = 'low' if len(component) <= 2 else 'medium'
+            
+            cycles.append(CycleRecord(
+                id=f"{cycle_type}_cycle_{len(cycles)}",
+                entities=component,
+                cycle_type=cycle_type,
+                severity=severity,
+                description=f"{cycle_type.title()} cycle involving {len(component)} entities",
+                paths=cycle_paths,
+                metrics={
+                    'length': len(component),
+                    'edge_count': len(cycle_paths)
+                }
+            ))
 
         return cycles
     
+    @staticmethod
+    def _relationship_paths(cycle_edges: List[Tuple[str, str, Relationship]], cycle_type: str) -> List[Dict]:
+        """Build path dicts for the direct relationship edges of a cycle"""
+        return [{
+            'from': entity,
+            'to': next_entity,
+            'relationship_type': cycle_type,
+            'strength': getattr(rel, 'strength', 1.0),
+            'line_number': rel.line_number,
+            'file_path': rel.file_path
+        } for entity, next_entity, rel in cycle_edges]
+
+    def _detect_import_cycles_from_ast(self, ast_analyses: List[FileAnalysis]) -> List[CycleRecord]:
+        """Detect import cycles from AST analysis when pydeps fails"""
+        if not ast_analyses:
+            return []
+        
+        # Build import graph from AST analysis
+        import_graph = self._build_ast_import_graph(ast_analyses)
+        return self._detect_import_cycles_in_graph(import_graph, 'ast')
+
     def _file_path_to_module_name(self, file_path: str) -> str:
         """Convert file path to module name"""
         # Simple conversion: remove .py extension and convert path separators to dots
@@ -828,20 +1388,16 @@ class AnalyzerEngine:
         module_name = os.path.basename(module_path)
         return module_name
     
-    def _resolve_import_name(self, import_name: str, current_file: str) -> Optional[str]:
-        """Resolve import name to absolute module name"""
-        # For now, return the import name as is
-        # In a full implementation, this would handle relative imports properly
-        if import_name.startswith('.'):
-            # Relative import - for now, just strip the dot
-            return import_name.lstrip('.')
-        return import_name
-    
     def _calculate_enhanced_metrics(self, packages: List[PackageInfo], modules: List[ModuleInfo],
                                   classes: List[ClassInfo], methods: List[MethodInfo],
                                   relationships: List[Relationship]) -> Dict:
         """5단계 모든 레벨을 포함한 향상된 메트릭 계산"""
 
+        # 객체 리스트를 필요한 속성 열(column)로 한 번만 분해                                # 이후 단계는 열 단위로만 순회 (속성 조회 반복 없음)
+        method_ids = [method.id for method in methods]                                          # 메소드 ID 열
+        complexities = [method.complexity for method in methods]                                # 메소드 복잡도 열
+        edge_index = self._get_edge_index(relationships)                                        # 순환 탐지에서 만든 관계 열 재사용
+
         metrics = {
             'entity_counts': {                                                              # 엔티티 개수 통계
                 'packages': len(packages),                                                  # 패키지 개수
@@ -855,124 +1411,141 @@ class AnalyzerEngine:
             'quality_metrics': {}                                                           # 품질 메트릭들
         }
         # 복잡도 메트릭 계산                                                                     # 각 메소드의 순환 복잡도 수집
-        for method in methods:                                                                  # 모든 메소드에 대해
-            if method.complexity:                                                               # 복잡도 정보가 있으면
-                metrics['complexity_metrics'][method.id] = method.complexity                   # 메소드 ID와 복잡도 매핑
+        metrics['complexity_metrics'] = {                                                       # 메소드 ID와 복잡도 매핑 (복잡도 정보가 있는 것만)
+            method_id: complexity
+            for method_id, complexity in zip(method_ids, complexities) if complexity
+        }
 
         # 결합도 메트릭 계산                                                                     # 엔티티 간 의존성 강도 측정
-        in_degree = {}                                                                          # 들어오는 의존성 개수 (afferent coupling)
-        out_degree = {}                                                                         # 나가는 의존성 개수 (efferent coupling)
-
-        for rel in relationships:                                                               # 모든 관계에 대해
-            # 들어오는 관계 카운트 (다른 엔티티가 이 엔티티에 의존)                             # 해당 엔티티를 사용하는 다른 엔티티 수
-            if rel.to_entity not in in_degree:                                                 # 타겟 엔티티가 딕셔너리에 없으면
-                in_degree[rel.to_entity] = 0                                                   # 0으로 초기화
-            in_degree[rel.to_entity] += 1                                                      # 들어오는 의존성 카운트 증가
-
-            # 나가는 관계 카운트 (이 엔티티가 다른 엔티티에 의존)                               # 해당 엔티티가 사용하는 다른 엔티티 수
-            if rel.from_entity not in out_degree:                                              # 소스 엔티티가 딕셔너리에 없으면
-                out_degree[rel.from_entity] = 0                                                # 0으로 초기화
-            out_degree[rel.from_entity] += 1                                                   # 나가는 의존성 카운트 증가
+        in_degree = edge_index.in_degree                                                        # 들어오는 의존성 개수 (afferent coupling)
+        out_degree = edge_index.out_degree                                                      # 나가는 의존성 개수 (efferent coupling)
 
         # 각 엔티티의 불안정성 계산 (instability = Ce / (Ca + Ce))                            # 불안정성은 변경에 대한 민감도를 나타냄
-        all_entities = set(in_degree.keys()) | set(out_degree.keys())                         # 모든 엔티티 집합
-        for entity in all_entities:                                                            # 각 엔티티에 대해
-            ca = in_degree.get(entity, 0)  # Afferent coupling (들어오는 의존성)                # 이 엔티티에 의존하는 다른 엔티티 수
-            ce = out_degree.get(entity, 0)  # Efferent coupling (나가는 의존성)                # 이 엔티티가 의존하는 다른 엔티티 수
-
-            instability = ce / (ca + ce) if (ca + ce) > 0 else 0.0                           # 불안정성 지수 계산 (0~1, 1에 가까울수록 불안정)
-            metrics['coupling_metrics'][entity] = {                                            # 엔티티별 결합도 메트릭 저장
-                'afferent_coupling': ca,                                                       # 들어오는 결합도
-                'efferent_coupling': ce,                                                       # 나가는 결합도
-                'instability': instability                                                     # 불안정성 지수
+        # 차수 열은 map으로 C 레벨에서 조회, 모든 엔티티는 간선이 하나 이상이므로 Ca + Ce > 0
+        all_entities = in_degree.keys() | out_degree.keys()                                    # 모든 엔티티 집합
+        metrics['coupling_metrics'] = {                                                         # 엔티티별 결합도 메트릭
+            entity: {
+                'afferent_coupling': ca,                                                        # 들어오는 결합도 (이 엔티티에 의존하는 수)
+                'efferent_coupling': ce,                                                        # 나가는 결합도 (이 엔티티가 의존하는 수)
+                'instability': ce / (ca + ce)                                                   # 불안정성 지수 (0~1, 1에 가까울수록 불안정)
             }
+            for entity, ca, ce in zip(all_entities,
+                                      map(in_degree.get, all_entities, repeat(0)),
+                                      map(out_degree.get, all_entities, repeat(0)))
+        }
         return metrics                                                                          # 계산된 모든 메트릭 반환
     
     def _calculate_quality_metrics(self, integrated_data: Dict, project_files: List[str],
                                   progress_callback: ProgressCallback) -> List[QualityMetrics]:
-        """모든 엔티티에 대한 코드 품질 메트릭 계산"""
-        quality_metrics = []                                                                    # 품질 메트릭 결과 리스트
+        """모든 엔티티에 대한 코드 품질 메트릭 계산
 
+        엔티티를 소스 파일별로 묶어 파일당 한 번만 읽고, 설정된 메트릭 엔진으로
+        모듈 -> 클래스 순서의 결과를 반환한다.
+        """
         if not self.metrics_engine:                                                             # 메트릭 엔진이 없으면
-            return quality_metrics                                                              # 빈 리스트 반환
-            
-        from .models import EntityType                                                          # EntityType 임포트
-
-        # 분석을 위한 소스 파일 읽기                                                             # 품질 메트릭 계산을 위해 원본 소스 코드 필요
-        source_cache = {}                                                                       # 파일 경로별 소스 코드 캐시
-        for file_path in project_files:                                                        # 모든 프로젝트 파일에 대해
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:                              # UTF-8로 파일 열기
-                    source_cache[file_path] = f.read()                                         # 파일 내용을 캐시에 저장
-            except:                                                                             # 파일 읽기 실패시
-                continue                                                                        # 해당 파일은 건너뛰고 계속
+            return []                                                                           # 빈 리스트 반환
+
+        # 엔티티를 파일별로 묶기 (분석 대상 파일만, 결과 순서 복원을 위해 인덱스 보관)
+        readable_files = frozenset(project_files)                                               # 분석 대상 파일만 읽음
+        entities = list(chain(integrated_data.get('modules', []), integrated_data.get('classes', [])))
+        total_entities = len(entities)                                                          # 총 엔티티 수 (진행률 표시용)
+        groups: Dict[str, List[Tuple[int, Any]]] = {}                                           # 파일 경로 -> [(인덱스, 엔티티)]
+        for index, entity in enumerate(entities):
+            if entity.file_path in readable_files:
+                groups.setdefault(entity.file_path, []).append((index, entity))
+
+        slots: List[Optional[QualityMetrics]] = [None] * total_entities                         # 엔티티 순서대로 결과 저장
+        task = partial(self._quality_metrics_task, metrics_engine=self.metrics_engine)          # 설정된 메트릭 엔진 사용
+        self._collect_quality_metrics(map(task, groups.items()), slots, total_entities, progress_callback)
+
+        quality_metrics = [metric for metric in slots if metric is not None]                    # 계산된 메트릭만
+        self.logger.info(f"Calculated quality metrics for {len(quality_metrics)} entities")  # 계산된 메트릭 수 로그 출력
+        return quality_metrics                                                                  # 계산된 모든 품질 메트릭 반환
 
-        total_entities = (len(integrated_data.get('modules', [])) +                            # 총 엔티티 수 계산 (진행률 표시용)
-                         len(integrated_data.get('classes', [])))                             # 모듈과 클래스 수의 합
+    @staticmethod
+    def _collect_quality_metrics(results: Iterator[List[Tuple[int, QualityMetrics]]],
+                                 slots: List[Optional[QualityMetrics]], total_entities: int,
+                                 progress_callback: ProgressCallback):
+        """파일 묶음별 결과를 원래 엔티티 위치에 배치하며 진행률 보고 (85%~95%)"""
         processed = 0                                                                           # 처리된 엔티티 수
+        for group_results in results:
+            for index, metric in group_results:
+                slots[index] = metric
+            processed += len(group_results)
+            if progress_callback.should_update(processed, total_entities):
+                progress = 85 + (processed / total_entities) * 10                               # 진행률 계산 (85%~95%)
+                progress_callback.update(f"Quality metrics: {processed}/{total_entities}", progress)  # 진행률 업데이트
 
-        # 모듈에 대한 메트릭 계산                                                               # 모듈 레벨 품질 분석
-        for module in integrated_data.get('modules', []):                                      # 모든 모듈에 대해
-            source_code = source_cache.get(module.file_path, "")                              # 해당 모듈의 소스 코드 가져오기
-            if source_code:                                                                     # 소스 코드가 있으면
-                module_metrics = self.metrics_engine.analyze_module_quality(module, source_code)  # 모듈 품질 분석 수행
-
-                quality_metric = QualityMetrics(                                               # 품질 메트릭 객체 생성
-                    entity_id=module.id,                                                       # 모듈 ID
-                    entity_type=EntityType.MODULE,                                            # 엔티티 타입 (모듈)
-                    cyclomatic_complexity=module_metrics.complexity.cyclomatic_complexity,    # 순환 복잡도
-                    cognitive_complexity=module_metrics.complexity.cognitive_complexity,      # 인지 복잡도
-                    nesting_depth=module_metrics.complexity.nesting_depth,                    # 중첩 깊이
-                    lines_of_code=len(source_code.split('\n')),                               # 코드 라인 수
-                    afferent_coupling=module_metrics.coupling.afferent_coupling,              # 들어오는 결합도
-                    efferent_coupling=module_metrics.coupling.efferent_coupling,              # 나가는 결합도
-                    instability=module_metrics.coupling.instability,                          # 불안정성 지수
-                    maintainability_index=module_metrics.maintainability_index,               # 유지보수성 지수
-                    technical_debt_ratio=module_metrics.technical_debt_ratio,                 # 기술 부채 비율
-                    quality_grade=self.metrics_engine.get_quality_rating(module_metrics)      # 품질 등급
-                )
-                quality_metrics.append(quality_metric)                                        # 품질 메트릭 리스트에 추가
+    @staticmethod
+    def _quality_metrics_task(file_group: Tuple[str, List[Tuple[int, Any]]],
+                              metrics_engine) -> List[Tuple[int, QualityMetrics]]:
+        """한 파일의 모듈/클래스 메트릭 계산"""
+        file_path, indexed_entities = file_group
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:                                  # UTF-8로 파일 열기
+                size = os.fstat(f.fileno()).st_size                                             # 읽기 전에 크기 확인 (열린 파일 기준)
+                if size > _MAX_METRICS_SOURCE_BYTES:                                            # 생성/벤더링 코드로 보이는 큰 파일은
+                    logging.getLogger(__name__).warning(
+                        f"Skipping quality metrics for {file_path}: {size} bytes exceeds {_MAX_METRICS_SOURCE_BYTES}")
+                    return []                                                                   # 읽지 않고 건너뜀
+                source_code = f.read()                                                          # 파일 내용 읽기
+        except (OSError, UnicodeDecodeError):                                                   # 파일 읽기 실패시
+            return []                                                                           # 해당 파일은 건너뜀
+        if not source_code:                                                                     # 빈 파일은 메트릭 없음
+            return []
+
+        return [(index, AnalyzerEngine._entity_quality_metric(metrics_engine, entity, source_code))
+                for index, entity in indexed_entities]
 
-            processed += 1                                                                     # 처리된 엔티티 수 증가
-            if processed % 10 == 0:                                                            # 10개마다 진행률 업데이트
-                progress = 85 + (processed / total_entities) * 10                             # 진행률 계산 (85%~95%)
-                progress_callback.update(f"Quality metrics: {processed}/{total_entities}", progress)  # 진행률 업데이트
-        # 클래스에 대한 메트릭 계산                                                             # 클래스 레벨 품질 분석
-        for class_info in integrated_data.get('classes', []):                                  # 모든 클래스에 대해
-            source_code = source_cache.get(class_info.file_path, "")                          # 해당 클래스의 소스 코드 가져오기
-            if source_code:                                                                     # 소스 코드가 있으면
-                class_metrics = self.metrics_engine.analyze_class_quality(class_info, source_code)  # 클래스 품질 분석 수행
-
-                quality_metric = QualityMetrics(                                               # 품질 메트릭 객체 생성
-                    entity_id=class_info.id,                                                   # 클래스 ID
-                    entity_type=EntityType.CLASS,                                             # 엔티티 타입 (클래스)
-                    cyclomatic_complexity=class_metrics.complexity.cyclomatic_complexity,     # 순환 복잡도
-                    cognitive_complexity=class_metrics.complexity.cognitive_complexity,       # 인지 복잡도
-                    nesting_depth=class_metrics.complexity.nesting_depth,                     # 중첩 깊이
-                    lines_of_code=sum(len(m.body_text.split('\n')) for m in class_info.methods),  # 클래스 내 모든 메소드의 라인 수 합계
-                    afferent_coupling=class_metrics.coupling.afferent_coupling,               # 들어오는 결합도
-                    efferent_coupling=class_metrics.coupling.efferent_coupling,               # 나가는 결합도
-                    instability=class_metrics.coupling.instability,                           # 불안정성 지수
-                    maintainability_index=class_metrics.maintainability_index,                # 유지보수성 지수
-                    technical_debt_ratio=class_metrics.technical_debt_ratio,                  # 기술 부채 비율
-                    quality_grade=self.metrics_engine.get_quality_rating(class_metrics)       # 품질 등급
-                )
-                quality_metrics.append(quality_metric)                                        # 품질 메트릭 리스트에 추가
+    @staticmethod
+    def _entity_quality_metric(metrics_engine, entity: Any, source_code: str) -> QualityMetrics:
+        """모듈 또는 클래스 하나의 품질 메트릭 생성"""
+        if isinstance(entity, ModuleInfo):                                                      # 모듈 레벨 품질 분석
+            metrics = metrics_engine.analyze_module_quality(entity, source_code)
+            entity_type = EntityType.MODULE
+            lines_of_code = source_code.count('\n') + 1                                         # 코드 라인 수 (리스트 할당 없이 개행 수로 계산)
+        else:                                                                                   # 클래스 레벨 품질 분석
+            metrics = metrics_engine.analyze_class_quality(entity, source_code)
+            entity_type = EntityType.CLASS
+            lines_of_code = sum(m.body_text.count('\n') + 1 for m in entity.methods)           # 클래스 내 모든 메소드의 라인 수 합계
+
+        return QualityMetrics(                                                                  # 품질 메트릭 객체 생성
+            entity_id=entity.id,                                                                # 엔티티 ID
+            entity_type=entity_type,                                                            # 엔티티 타입
+            cyclomatic_complexity=metrics.complexity.cyclomatic_complexity,                     # 순환 복잡도
+            cognitive_complexity=metrics.complexity.cognitive_complexity,                       # 인지 복잡도
+            nesting_depth=metrics.complexity.nesting_depth,                                     # 중첩 깊이
+            lines_of_code=lines_of_code,                                                        # 코드 라인 수
+            afferent_coupling=metrics.coupling.afferent_coupling,                               # 들어오는 결합도
+            efferent_coupling=metrics.coupling.efferent_coupling,                               # 나가는 결합도
+            instability=metrics.coupling.instability,                                           # 불안정성 지수
+            maintainability_index=metrics.maintainability_index,                                # 유지보수성 지수
+            technical_debt_ratio=metrics.technical_debt_ratio,                                  # 기술 부채 비율
+            quality_grade=metrics_engine.get_quality_rating(metrics)                            # 품질 등급
+        )
+
+    @staticmethod
+    def _to_cyclic_dependencies(cycle_records: List[CycleRecord]) -> List[CyclicDependency]:
+        """순환 레코드를 결과용 CyclicDependency 객체로 변환"""
+        cycles = []                                           # 순환 의존성 객체 목록
+        for cycle_dict in cycle_records:                      # 각 순환 의존성에 대해
+            cycle = CyclicDependency(
+                id=cycle_dict['id'],                         # 순환 의존성 고유 ID
+                entities=cycle_dict['entities'],             # 순환에 포함된 엔티티들
+                cycle_type=cycle_dict['cycle_type'],         # 순환 타입 (module/class/method)
+                severity=cycle_dict['severity'],             # 심각도 수준
+                description=cycle_dict.get('description')    # 순환 의존성 설명
+            )
+            cycles.append(cycle)                              # 리스트에 추가
+        return cycles
 
-            processed += 1                                                                     # 처리된 엔티티 수 증가
-            if processed % 10 == 0:                                                            # 10개마다 진행률 업데이트
-                progress = 85 + (processed / total_entities) * 10                             # 진행률 계산 (85%~95%)
-                progress_callback.update(f"Quality metrics: {processed}/{total_entities}", progress)  # 진행률 업데이트
-        self.logger.info(f"Calculated quality metrics for {len(quality_metrics)} entities")  # 계산된 메트릭 수 로그 출력
-        return quality_metrics                                                                  # 계산된 모든 품질 메트릭 반환
-    
     def _assemble_result(self, project_path: str, integrated_data: Dict,
                         quality_metrics: List[QualityMetrics],
                         start_time: float, progress_callback: ProgressCallback) -> AnalysisResult:
         """최종 분석 결과를 조립하여 AnalysisResult 객체 생성"""
         # 분석 완료 시간 계산 및 프로젝트 정보 생성
 
-        end_time = time.time()                                # 분석 종료 시간 기록
+        end_time = time.perf_counter()                        # 분석 종료 시간 기록
         duration = end_time - start_time                     # 총 분석 소요 시간 계산
 
         # 프로젝트 정보 객체 생성
@@ -996,16 +1569,7 @@ class AnalyzerEngine:
         )
 
         # 순환 의존성 딕셔너리를 CyclicDependency 객체로 변환
-        cycles = []                                           # 순환 의존성 객체 목록
-        for cycle_dict in integrated_data['cycles']:         # 각 순환 의존성에 대해
-            cycle = CyclicDependency(
-                id=cycle_dict['id'],                         # 순환 의존성 고유 ID
-                entities=cycle_dict['entities'],             # 순환에 포함된 엔티티들
-                cycle_type=cycle_dict['cycle_type'],         # 순환 타입 (module/class/method)
-                severity=cycle_dict['severity'],             # 심각도 수준
-                description=cycle_dict.get('description')    # 순환 의존성 설명
-            )
-            cycles.append(cycle)                              # 리스트에 추가
+        cycles = self._to_cyclic_dependencies(integrated_data['cycles'])
 
         # 최종 분석 결과 객체 생성
         result = AnalysisResult(
@@ -1028,6 +1592,9 @@ class AnalyzerEngine:
 
     # === 대규모 프로젝트 분석 경로 (>= 1000 파일) ===
 
+    # 대규모 프로젝트 결과에 포함하는 엔티티 수 상한 (메모리 사용량 제한)
+    _LARGE_RESULT_LIMITS = {'modules': 1000, 'classes': 2000, 'methods': 5000, 'fields': 5000, 'relationships': 1000}
+
     def _analyze_large_project(self, project_path: str, project_files: List[str],
                               progress_callback: ProgressCallback, start_time: float) -> AnalysisResult:
         """대규모 프로젝트(>=1000파일)에 최적화된 분석 전략 사용"""
@@ -1040,46 +1607,60 @@ class AnalyzerEngine:
         progress_callback.update("Initializing large project analysis", 12)  # 대규모 프로젝트 분석 초기화
 
         # 스트리밍을 위한 최적화된 분석 함수 생성
-        def optimized_ast_analysis(file_batch: List[str]):    # 배치 단위 AST 분석 함수
-            batch_results = []                                # 배치 분석 결과 저장
-            for file_path in file_batch:                      # 배치 내 각 파일에 대해
-                try:
-                    analysis = self.ast_analyzer.analyze_file(file_path)  # AST 분석 수행
-                    if analysis:                              # 분석 결과가 있으면
-                        batch_results.append(analysis)       # 결과에 추가
-                except Exception as e:                        # 분석 실패 시
-                    self.logger.warning(f"Failed to analyze {file_path}: {e}")  # 경고 로그
-            return batch_results                              # 배치 분석 결과 반환
-
-        # 스트리밍 분석 결과 처리
-        all_analyses = []                                     # 전체 분석 결과 누적
-        total_processed = 0                                   # 처리된 총 파일 수
-
-        for batch_result in self.large_project_analyzer.analyze_large_project(  # 대규모 프로젝트 분석기 실행
-            project_path, optimized_ast_analysis,             # 프로젝트 경로와 분석 함수
-            lambda msg, prog: progress_callback.update(f"Large project: {msg}", 15 + (prog * 0.6))  # 진행률 콜백
-        ):
-            all_analyses.extend(batch_result)                 # 배치 결과를 전체 결과에 합병
-            total_processed += len(batch_result)              # 처리된 파일 수 누적
-
-            # 주기적 진행률 업데이트
-            if total_processed % 500 == 0:                    # 500파일마다
-                progress_callback.update(f"Processed {total_processed}/{len(project_files)} files",  # 진행 상황 업데이트
-                                       15 + (total_processed / len(project_files)) * 60)
+        # 배치 안의 파일은 서로 독립이므로 세션 워커 풀에 나눠 파싱 (표준 경로와 같은 작업 단위/캐시 사용)
+        parallel = bool(self.options.max_workers and self.options.max_workers > 1)  # 병렬 처리 가능 여부
+        batch_progress = ProgressCallback(lambda data: None)  # 배치 내부 진행률은 보고하지 않음 (배치 단위로 보고)
 
-        progress_callback.update("Completing large project analysis", 80)  # 대규모 프로젝트 분석 완료
-
-        # 대규모 프로젝트를 위한 단순화된 통합 사용
-        integrated_data = self._integrate_large_project_data(all_analyses, progress_callback)
+        def optimized_ast_analysis(file_batch: List[str]):    # 배치 단위 AST 분석 함수
+            if parallel and len(file_batch) > 1:              # 워커 풀로 병렬 분석 (실패 파일은 경고 후 제외)
+                return self._run_parallel_ast_analysis(file_batch, batch_progress)
+            return self._run_sequential_ast_analysis(file_batch, batch_progress)  # 단일 워커 설정이면 현재 프로세스에서 분석
 
-        # 메모리 절약을 위해 매우 큰 프로젝트는 품질 메트릭 건너뛰기
-        quality_metrics = []                                  # 품질 메트릭 초기화
-        if self.metrics_engine and len(project_files) < 5000:  # 5천 파일 미만일 때만
-            progress_callback.update("Calculating quality metrics (subset)", 85)  # 품질 메트릭 계산 (샘플링)
-            # 품질 메트릭을 위해 샘플만 분석
-            sample_size = min(1000, len(all_analyses))        # 최대 1000개 샘플 크기
-            sample_analyses = all_analyses[:sample_size]      # 앞쪽 샘플 선택
-            quality_metrics = self._calculate_quality_metrics_sample(integrated_data, sample_analyses, progress_callback)
+        # 스트리밍 분석 결과 처리 (분석 결과는 통합 스레드로 넘기고, 품질 메트릭 샘플만 메모리에 보관)
+        total_processed = 0                                   # 처리된 총 파일 수
+        total_files = len(project_files)                      # 전체 파일 수 (루프 밖에서 한 번만 계산)
+        progress_scale = 60.0 / max(1, total_files)           # 처리 파일 수 -> 진행률(15%~75%) 환산 계수
+        next_report = 500                                     # 다음 진행률 보고 기준 (500파일 단위)
+        # 메모리 절약을 위해 매우 큰 프로젝트는 품질 메트릭 건너뛰기 (계산할 때만 앞쪽 최대 1000개 결과 보관)
+        sample_metrics = bool(self.metrics_engine) and len(project_files) < 5000  # 5천 파일 미만일 때만
+        sample_analyses: List[FileAnalysis] = []              # 품질 메트릭 샘플
+        sample_limit = 1000 if sample_metrics else 0
+
+        # 통합은 별도 스레드가 결과 큐를 소비하며 진행 (메인 스레드가 워커 결과를 기다리는 동안 GIL이 풀려 있으므로
+        # 다음 배치 파싱과 앞선 결과 통합이 겹쳐 실행되고, 분석이 끝나면 통합도 거의 끝나 있음)
+        # 큐 크기를 제한하여 통합이 밀리면 분석이 기다림 (대기 중인 결과 메모리가 프로젝트 크기가 아닌 상한에 비례)
+        pending = Queue(maxsize=self._PENDING_LIMIT)          # 통합 대기 중인 분석 결과
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyview-integrate") as integrator:
+            integration = integrator.submit(self._integrate_large_project_data, self._drain_queue(pending), progress_callback)
+            try:
+                for analysis in self.large_project_analyzer.analyze_large_project(  # 대규모 프로젝트 분석기 실행 (파일별 결과 스트림)
+                    project_path, optimized_ast_analysis,     # 프로젝트 경로와 분석 함수
+                    lambda msg, prog: progress_callback.update(f"Large project: {msg}", 15 + (prog * 0.6)),  # 진행률 콜백
+                    file_paths=project_files                  # 이미 탐색한 파일 목록 사용 (디렉토리 재탐색 없음, 제외 패턴 동일 적용)
+                ):
+                    self._put_pending(pending, analysis, integration)  # 통합 스레드로 전달 (가득 차면 대기)
+                    if len(sample_analyses) < sample_limit:   # 품질 메트릭을 계산할 때만 샘플 보관
+                        sample_analyses.append(analysis)
+                    total_processed += 1                      # 처리된 파일 수 누적
+
+                    # 주기적 진행률 업데이트
+                    if total_processed >= next_report:        # 500파일마다 (배치 크기와 무관하게 기준을 넘으면 보고)
+                        progress_callback.update(f"Processed {total_processed}/{total_files} files",  # 진행 상황 업데이트
+                                               15 + total_processed * progress_scale)
+                        next_report += 500
+            finally:
+                if not integration.done():                    # 분석이 실패해도 통합 스레드 종료
+                    self._put_pending(pending, self._QUEUE_END, integration)
+
+            progress_callback.update("Completing large project analysis", 80)  # 대규모 프로젝트 분석 완료
+
+            # 대규모 프로젝트를 위한 단순화된 통합 결과 (남은 결과 통합이 끝날 때까지 대기)
+            integrated_data = integration.result()
+
+            quality_metrics = []                              # 품질 메트릭 초기화
+            if sample_metrics:
+                progress_callback.update("Calculating quality metrics (subset)", 85)  # 품질 메트릭 계산 (샘플링)
+                quality_metrics = self._calculate_quality_metrics_sample(integrated_data, sample_analyses, progress_callback)
 
         # 페이지네이션 지원으로 최종 결과 조립
         progress_callback.update("Assembling results with pagination", 95)  # 페이지네이션으로 결과 조립
@@ -1089,54 +1670,147 @@ class AnalyzerEngine:
 
         return analysis_result                                # 대규모 프로젝트 분석 결과 반환
 
-    def _integrate_large_project_data(self, all_analyses: List[FileAnalysis],
-                                     progress_callback: ProgressCallback) -> Dict:
-        """대규모 프로젝트를 위한 단순화된 데이터 통합"""
-        # 메모리 효율성을 위해 복잡한 관계 분석과 순환 검출 생략
+    _QUEUE_END = object()                                     # 결과 큐 종료 표시
+    _PENDING_LIMIT = 1000                                     # 통합 대기 결과 수 상한
+
+    @staticmethod
+    def _put_pending(queue: Queue, item: Any, integration: concurrent.futures.Future):
+        """큐가 빌 때까지 기다리며 항목 추가 (통합 스레드가 실패로 끝났으면 그 예외를 다시 발생)"""
+        while True:
+            try:
+                queue.put(item, timeout=0.5)
+                return
+            except Full:
+                if integration.done():                        # 소비자가 없으므로 더 기다리지 않음
+                    integration.result()
+                    return
+
+    @classmethod
+    def _drain_queue(cls, queue: Queue) -> Iterator[FileAnalysis]:
+        """종료 표시가 나올 때까지 큐의 분석 결과를 넣은 순서대로 반환"""
+        while True:
+            item = queue.get()
+            if item is cls._QUEUE_END:
+                return
+            yield item
+
+    def _integrate_large_project_data(self, all_analyses: Iterable[FileAnalysis],
+                                     progress_callback: ProgressCallback,
+                                     detail_level: str = 'sample') -> Dict:
+        """대규모 프로젝트를 위한 단순화된 데이터 통합
+
+        모듈은 열 단위(ModuleColumns)로, 관계는 정수 간선 열(EdgeColumns)로 모으고, 클래스/메서드/필드는
+        결과에 포함될 일부만 보관하고 나머지는 개수만 센다 (결과 조립 시 _LARGE_RESULT_LIMITS로 잘라내므로).
+        모듈은 코드 라인 수, 클래스는 메서드 수 기준 상위 항목을 최소 힙으로 남기고, 메서드/필드는 앞쪽부터 보관한다.
+
+        Args:
+            detail_level: 'sample'이면 위와 같이 통합, 'counts'이면 엔티티 개수와 코드 라인 수만 집계
+                (목록/열/간선/순환을 만들지 않으므로 요약 통계만 필요한 호출자용)
+        """
+        if detail_level == 'counts':                          # 개수만 필요하면 엔티티 객체를 보관하지 않음
+            return self._count_large_project_entities(all_analyses)
+        if detail_level != 'sample':
+            raise ValueError(f"Unknown detail level: {detail_level}")
+
+        # 메모리 효율성을 위해 복잡한 관계 분석 생략 (순환은 옵션을 켠 경우 관계 간선 열에서만 탐지)
+        limits = self._LARGE_RESULT_LIMITS                    # 결과에 포함되는 엔티티 수 상한
 
         packages = {}                                         # 패키지 정보 딕셔너리
-        modules = []                                          # 모듈 정보 리스트
-        classes = []                                          # 클래스 정보 리스트
-        methods = []                                          # 메서드 정보 리스트
-        fields = []                                           # 필드 정보 리스트
-        relationships = []                                    # 관계 정보 리스트 (단순화)
+        modules = ModuleColumns(detail_limit=limits['modules'])  # 모듈 정보 열 저장소
+        top_classes = []                                      # (메서드 수, -순번, 클래스) 최소 힙 (메서드가 많은 클래스 상위 일부)
+        class_limit = limits['classes']                       # 보관할 클래스 수
+        method_lists = []                                     # 앞쪽 파일들의 메서드 리스트 참조 (복사 없음)
+        field_lists = []                                      # 앞쪽 파일들의 필드 리스트 참조 (복사 없음)
+        relationships = EdgeColumns(detail_limit=limits['relationships'])  # 관계 간선 열 저장소
+        class_count = method_count = field_count = 0          # 전체 엔티티 수
 
         for analysis in all_analyses:                         # 각 파일 분석 결과에 대해
-            # 분석 결과를 데이터 구조로 변환 (단순화)
-            module_info = ModuleInfo(
-                id=create_module_id(analysis.file_path),      # 모듈 고유 ID 생성
-                name=Path(analysis.file_path).stem,           # 파일명에서 모듈명 추출
-                file_path=analysis.file_path,                 # 파일 전체 경로
-                classes=analysis.classes,                     # 클래스 목록 (이미 변환됨)
-                functions=analysis.functions,                 # 함수 목록
-                imports=analysis.imports,                     # 임포트 목록
-                loc=analysis.lines_of_code                    # 코드 라인 수
-            )
-            modules.append(module_info)                       # 모듈 목록에 추가
-
-            # 클래스와 메서드 추가 (단순화)
-            classes.extend(analysis.classes)                 # 클래스 목록 확장
-            methods.extend(analysis.methods)                 # 메서드 목록 확장
-            fields.extend(analysis.fields)                   # 필드 목록 확장
+            modules.append(analysis)                          # 모듈 정보를 열에 추가 (ModuleInfo 생성 없음)
+            relationships.extend(analysis.relationships)      # 관계를 정수 간선으로 추가 (앞쪽만 객체 보관)
+
+            # 클래스는 메서드 수 상위만, 메서드/필드는 상한까지만 보관 (단순화)
+            for cls in analysis.classes:
+                entry = (len(cls.methods), -class_count, cls)  # 같은 메서드 수면 먼저 온 클래스 유지 (순번은 고유하므로 클래스 비교 없음)
+                class_count += 1
+                if len(top_classes) < class_limit:
+                    heappush(top_classes, entry)
+                elif entry > top_classes[0]:                  # 현재 최소보다 메서드가 많으면 교체
+                    heapreplace(top_classes, entry)
+            if method_count < limits['methods']:              # 상한에 닿을 때까지 파일별 리스트를 그대로 참조
+                method_lists.append(analysis.methods)
+            if field_count < limits['fields']:
+                field_lists.append(analysis.fields)
+            method_count += len(analysis.methods)
+            field_count += len(analysis.fields)
 
         return {
             'packages': list(packages.values()),             # 패키지 목록
-            'modules': modules,                               # 모듈 목록
-            'classes': classes,                               # 클래스 목록
-            'methods': methods,                               # 메서드 목록
-            'fields': fields,                                 # 필드 목록
-            'relationships': relationships,                   # 관계 목록 (단순화됨)
-            'cycles': [],                                     # 대규모 프로젝트는 순환 검출 생략
+            'modules': modules,                               # 모듈 정보 열
+            'classes': [cls for _, _, cls in sorted(top_classes, reverse=True)],  # 클래스 목록 (메서드 수 내림차순)
+            'methods': list(islice(chain.from_iterable(method_lists), limits['methods'])),  # 메서드 목록 (앞쪽 상한까지)
+            'fields': list(islice(chain.from_iterable(field_lists), limits['fields'])),  # 필드 목록 (앞쪽 상한까지)
+            'relationships': relationships,                   # 관계 간선 열
+            'cycles': (self._detect_edge_column_cycles(relationships)  # 옵션을 켠 경우만 정수 간선 열에서 관계 순환 탐지
+                       if self.options.large_project_cycles else []),  # 기본값: 대규모 프로젝트는 순환 검출 생략
             'metrics': {                                      # 기본 메트릭 정보
                 'entity_counts': {                            # 엔티티 개수 통계
                     'modules': len(modules),                  # 모듈 수
-                    'classes': len(classes),                  # 클래스 수
-                    'methods': len(methods),                  # 메서드 수
-                    'fields': len(fields)                     # 필드 수
-                }
+                    'classes': class_count,                   # 클래스 수
+                    'methods': method_count,                  # 메서드 수
+                    'fields': field_count,                    # 필드 수
+                    'relationships': len(relationships)       # 관계 수
+                },
+                'lines_of_code': sum(modules.loc)             # 전체 코드 라인 수 (정수 array를 C 레벨에서 합산)
+            }
+        }
+
+    @staticmethod
+    def _count_large_project_entities(all_analyses: Iterable[FileAnalysis]) -> Dict:
+        """엔티티 개수와 코드 라인 수만 집계 (통합 결과와 같은 키, 목록과 열은 비어 있음)"""
+        module_count = class_count = method_count = field_count = relationship_count = lines_of_code = 0
+        for analysis in all_analyses:                         # 각 파일 분석 결과의 개수만 누적
+            module_count += 1
+            class_count += len(analysis.classes)
+            method_count += len(analysis.methods)
+            field_count += len(analysis.fields)
+            relationship_count += len(analysis.relationships)
+            lines_of_code += analysis.module_info.loc
+
+        return {
+            'packages': [],
+            'modules': ModuleColumns(detail_limit=0),         # 빈 모듈 열 (결과 조립과 호환)
+            'classes': [],
+            'methods': [],
+            'fields': [],
+            'relationships': EdgeColumns(detail_limit=0),     # 빈 간선 열
+            'cycles': [],                                     # 순환 탐지 생략
+            'metrics': {
+                'entity_counts': {
+                    'modules': module_count,
+                    'classes': class_count,
+                    'methods': method_count,
+                    'fields': field_count,
+                    'relationships': relationship_count
+                },
+                'lines_of_code': lines_of_code
             }
         }
 
+    def _detect_edge_column_cycles(self, edges: EdgeColumns) -> List[CycleRecord]:
+        """정수 간선 열로 관계 순환 탐지 (전체 탐지의 상세 계층과 같은 형식)
+
+        간선이 이미 정수 인덱스이므로 문자열 ID 변환 없이 CSR 그래프를 만들고 반복 Tarjan을 실행한다.
+        엔티티 ID 문자열과 CycleRecord는 순환에 속하는 노드에 대해서만 만든다.
+        """
+        node_ids = edges.node_ids
+        graph = CSRGraph.from_index_edges(node_ids, edges.src, edges.dst)                       # 중복 간선 제거된 CSR 그래프
+        cycles = []
+        for component in tarjan_scc(graph, skip_sinks=True):                                    # 말단 노드는 탐색에서 제외
+            cycle_path = find_cycle_in_component(graph, component)                              # SCC 내부의 대표 순환 경로
+            if cycle_path:
+                cycles.append(self._make_detailed_cycle(len(cycles), [node_ids[i] for i in cycle_path]))
+        return cycles
+
     def _calculate_quality_metrics_sample(self, integrated_data: Dict,
                                         sample_analyses: List[FileAnalysis],
                                         progress_callback: ProgressCallback) -> List[QualityMetrics]:
@@ -1148,21 +1822,22 @@ class AnalyzerEngine:
 
         sample_metrics = []                                   # 샘플 메트릭 결과 저장
 
-        # 메모리와 시간 절약을 위해 하위 집합만 분석
-        for i, module in enumerate(integrated_data.get('modules', [])[:100]):  # 최대 100개 모듈만
+        # 메모리와 시간 절약을 위해 하위 집합만 분석 (모듈 열에서 ID와 라인 수만 읽음)
+        modules: ModuleColumns = integrated_data['modules']
+        for module_id, loc in islice(zip(modules.ids, modules.loc), 100):  # 최대 100개 모듈만 (열 복사 없음)
             try:
                 # 단순화된 품질 분석 수행
                 quality_metric = QualityMetrics(
-                    entity_id=module.id,                     # 모듈 고유 ID
+                    entity_id=module_id,                     # 모듈 고유 ID
                     entity_type=EntityType.MODULE,           # 엔티티 타입 (모듈)
                     cyclomatic_complexity=5,                 # 순환 복잡도 (단순화됨)
-                    lines_of_code=module.loc,                # 코드 라인 수
+                    lines_of_code=loc,                       # 코드 라인 수
                     quality_grade="B"                        # 기본 품질 등급
                 )
                 sample_metrics.append(quality_metric)        # 메트릭 목록에 추가
 
             except Exception as e:                            # 메트릭 계산 실패 시
-                self.logger.warning(f"Failed to calculate metrics for {module.id}: {e}")  # 경고 로그
+                self.logger.warning(f"Failed to calculate metrics for {module_id}: {e}")  # 경고 로그
                 continue                                      # 다음 모듈로 계속
 
         return sample_metrics                                 # 계산된 샘플 메트릭 반환
@@ -1173,7 +1848,7 @@ class AnalyzerEngine:
         """페이지네이션을 지원하는 대규모 프로젝트 결과 조립"""
         # 메모리 사용량 제한을 위해 결과 데이터에 제한을 두어 조립
 
-        end_time = time.time()                                # 분석 종료 시간 기록
+        end_time = time.perf_counter()                        # 분석 종료 시간 기록
         duration = end_time - start_time                     # 총 분석 소요 시간 계산
 
         # 프로젝트 정보 생성
@@ -1187,13 +1862,13 @@ class AnalyzerEngine:
             analysis_options=vars(self.options)              # 분석 옵션 설정값들
         )
 
-        # 페이지네이션 정보를 포함한 의존성 그래프 생성
+        # 페이지네이션 정보를 포함한 의존성 그래프 생성 (통합 단계에서 이미 상한까지만 모았으므로 복사 없이 참조)
         dependency_graph = DependencyGraph(
             packages=integrated_data['packages'],            # 패키지 목록 (제한 없음)
-            modules=integrated_data['modules'][:1000],       # 모듈을 메모리에서 제한 (최대 1000개)
-            classes=integrated_data['classes'][:2000],       # 클래스 제한 (최대 2000개)
-            methods=integrated_data['methods'][:5000],       # 메서드 제한 (최대 5000개)
-            fields=integrated_data['fields'][:5000]          # 필드 제한 (최대 5000개)
+            modules=integrated_data['modules'].to_module_infos(),  # 결과에 포함될 모듈만 ModuleInfo로 생성 (라인 수 상위 최대 1000개)
+            classes=integrated_data['classes'],              # 클래스 (메서드 수 상위 최대 2000개)
+            methods=integrated_data['methods'],              # 메서드 (최대 5000개)
+            fields=integrated_data['fields']                 # 필드 (최대 5000개)
         )
 
         # 최종 결과 생성
@@ -1201,16 +1876,17 @@ class AnalyzerEngine:
             analysis_id=self.current_analysis_id,            # 고유 분석 ID
             project_info=project_info,                       # 프로젝트 기본 정보
             dependency_graph=dependency_graph,               # 제한된 의존성 그래프
-            relationships=integrated_data['relationships'][:1000],  # 관계 제한 (최대 1000개)
+            relationships=integrated_data['relationships'].details,  # 관계 (최대 1000개만 객체로)
             quality_metrics=quality_metrics,                 # 품질 메트릭 (샘플링됨)
             metrics=integrated_data['metrics'],              # 기본 메트릭 정보
-            cycles=integrated_data['cycles']                  # 순환 의존성 (대규모에서는 빈 목록)
+            cycles=self._to_cyclic_dependencies(integrated_data['cycles'])  # 관계 순환 (상세 계층만)
         )
 
         # 대규모 프로젝트 분석 완료 로그
         self.logger.info(f"Large project analysis completed in {duration:.2f} seconds")  # 분석 소요 시간
-        self.logger.info(f"Analyzed {len(integrated_data['modules'])} modules, "          # 전체 분석된 요소 수
-                        f"{len(integrated_data['classes'])} classes")
+        entity_counts = integrated_data['metrics']['entity_counts']
+        self.logger.info(f"Analyzed {entity_counts['modules']} modules, "                # 전체 분석된 요소 수
+                        f"{entity_counts['classes']} classes")
 
         return result                                         # 대규모 프로젝트 분석 결과 반환
     
@@ -1223,18 +1899,20 @@ class AnalyzerEngine:
         try:
             cache_id = self.cache_manager.generate_cache_key(project_path, vars(self.options))  # 고유 캐시 키 생성
 
-            # 분석된 모든 파일의 메타데이터 생성
-            file_metadata = {}                                # 파일 메타데이터 딕셔너리
-            for file_path in project_files:                  # 각 분석된 파일에 대해
-                if os.path.exists(file_path):                 # 파일이 존재하면
-                    file_metadata[file_path] = FileMetadata.from_file(file_path)  # 메타데이터 생성
+            # 분석된 모든 파일의 메타데이터 생성 (stat은 디렉토리별 scandir로 한 번에 수집, 없는 파일은 제외)
+            file_stats = stat_files(project_files)            # 파일 경로 -> stat 결과
+            file_metadata = {                                 # 파일 메타데이터 딕셔너리 (계산된 해시 재사용)
+                file_path: FileMetadata.from_file(file_path, self._file_digests.get(file_path), file_stats[file_path])
+                for file_path in project_files if file_path in file_stats
+            }
 
-            # 캐시 엔트리 생성
+            # 캐시 엔트리 생성 (생성/만료 시각은 같은 현재 시각 기준)
+            now = datetime.now()                              # 현재 시각 (한 번만 조회)
             cache = AnalysisCache(
                 cache_id=cache_id,                            # 고유 캐시 ID
                 project_path=project_path,                    # 프로젝트 경로
-                created_at=datetime.now(),                    # 캐시 생성 시간
-                expires_at=datetime.now() + timedelta(days=7),  # 캐시 만료 시간 (7일)
+                created_at=now,                               # 캐시 생성 시간
+                expires_at=now + timedelta(days=7),           # 캐시 만료 시간 (7일)
                 file_metadata=file_metadata,                  # 파일 메타데이터
                 analysis_result=analysis_result               # 분석 결과
             )
@@ -1260,5 +1938,5 @@ def analyze_project(project_path: str,
     Returns:
         완전한 분석 결과
     """
-    engine = AnalyzerEngine(options)                                                        # 분석 엔진 생성
-    return engine.analyze_project(project_path, progress_callback)                         # 프로젝트 분석 실행 및 결과 반환
\ No newline at end of file
+    with AnalyzerEngine(options) as engine:                                                 # 분석 엔진 생성 (끝나면 워커 풀 종료)
+        return engine.analyze_project(project_path, progress_callback)                     # 프로젝트 분석 실행 및 결과 반환
\ No newline at end of file
@@ -19,9 +19,21 @@ from .models import (
     create_module_id, create_class_id, create_method_id, create_field_id,
     create_relationship_id
 )
+from .io_utils import read_file_bytes
 
 logger = logging.getLogger(__name__)
 
+# 분석 결과 형식이 바뀌면 올려서 디스크 캐시를 무효화
+ANALYZER_VERSION = "1.0"
+
+# AST만 생성 (바이트코드 생성 없음, type comment 미수집, 호출 모듈의 __future__ 플래그 미상속)
+_PARSE_FLAGS = ast.PyCF_ONLY_AST
+
+
+def parse_source(source: Union[str, bytes], filename: str) -> ast.Module:
+    """Parse source into an AST, calling compile() directly without ast.parse's wrapper"""
+    return compile(source, filename, 'exec', flags=_PARSE_FLAGS, dont_inherit=True)
+
 
 @dataclass
 class FileAnalysis:
@@ -580,15 +592,34 @@ class ASTAnalyzer:
     def __init__(self, enable_type_inference: bool = True):
         self.logger = logging.getLogger(__name__)
         self.enable_type_inference = enable_type_inference
+
+    @property
+    def cache_tag(self) -> str:
+        """Analyzer version plus the options that change its output (part of every on-disk cache key)"""
+        return f"{ANALYZER_VERSION}|type_inference={int(self.enable_type_inference)}"
     
     def analyze_file(self, file_path: str) -> Optional[FileAnalysis]:
         """Analyze a single Python file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-            
+            # Binary read: the parser detects the encoding itself
+            source = read_file_bytes(file_path)
+        except Exception as e:
+            self.logger.error(f"Error analyzing {file_path}: {e}")
+            return None
+
+        return self.analyze_source(file_path, source)
+
+    def analyze_source(self, file_path: str, source: Union[str, bytes],
+                       tree: Optional[ast.Module] = None) -> Optional[FileAnalysis]:
+        """Analyze already-read source code of a Python file
+
+        A pre-parsed ``tree`` of identical source may be passed to skip parsing;
+        the visitors only read the tree, so it can be shared between files.
+        """
+        try:
             # Parse the source code
-            tree = ast.parse(source, filename=file_path)
+            if tree is None:
+                tree = parse_source(source, file_path)
             
             # Get module name from file path
             module_name = self._get_module_name(file_path)
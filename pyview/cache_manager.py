@@ -9,9 +9,12 @@ Implements intelligent caching for incremental analysis:
 """
 
 import os
+import sys
 import json
+import shutil
 import hashlib
 import pickle
+import pickletools
 import time
 from pathlib import Path
 from typing import Dict, Set, Optional, List, Any
@@ -19,6 +22,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
 from .models import AnalysisResult, ModuleInfo, ClassInfo, MethodInfo
+from .io_utils import hash_file
 
 
 @dataclass
@@ -31,14 +35,21 @@ class FileMetadata:
     analysis_version: str = "1.0"
     
     @classmethod
-    def from_file(cls, file_path: str) -> 'FileMetadata':
-        """Create metadata from file"""
-        stat = os.stat(file_path)
+    def from_file(cls, file_path: str, checksum: Optional[str] = None,
+                  stat: Optional[os.stat_result] = None) -> 'FileMetadata':
+        """Create metadata from file
+
+        ``checksum`` is the file's SHA-256 hex digest if the caller already
+        computed it while reading the file; otherwise the file is hashed here.
+        ``stat`` is the file's stat result if the caller already collected it
+        (e.g. from a directory scan); otherwise the file is stat'ed here.
+        """
+        if stat is None:
+            stat = os.stat(file_path)
         
         # Calculate checksum for content verification
-        with open(file_path, 'rb') as f:
-            content = f.read()
-            checksum = hashlib.md5(content).hexdigest()
+        if checksum is None:
+            checksum = hash_file(file_path)
         
         return cls(
             file_path=file_path,
@@ -49,9 +60,6 @@ class FileMetadata:
     
     def is_outdated(self) -> bool:
         """Check if file has been modified"""
-        if not os.path.exists(self.file_path):
-            return True
-            
         try:
             current_stat = os.stat(self.file_path)
             
@@ -61,16 +69,326 @@ class FileMetadata:
                 return True
                 
             # Deep check: content checksum
-            with open(self.file_path, 'rb') as f:
-                content = f.read()
-                current_checksum = hashlib.md5(content).hexdigest()
-                
-            return current_checksum != self.checksum
+            return hash_file(self.file_path) != self.checksum
             
         except (OSError, IOError):
             return True
 
 
+@dataclass
+class FileAnalysisEntry:
+    """Cached AST analysis result for a single file"""
+    last_modified: float
+    size: int
+    checksum: str
+    analysis: Any  # FileAnalysis
+
+
+class FileAnalysisIndex:
+    """Per-file AST analysis index used to skip unchanged files on re-analysis
+
+    The index is stored with a header of the Python version and the analyzer's
+    ``cache_tag`` (analyzer version and output-affecting options). An index
+    written under a different header is discarded as a whole, so an analyzer
+    upgrade or option change never serves stale analyses.
+    """
+
+    def __init__(self, index_file: Path, analyzer_tag: str = ""):
+        self.index_file = index_file
+        self.header = (tuple(sys.version_info[:2]), analyzer_tag)
+        self.entries: Dict[str, FileAnalysisEntry] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, FileAnalysisEntry]:
+        """Load index from disk (empty if missing, corrupted or written under another header)"""
+        if not self.index_file.exists():
+            return {}
+
+        try:
+            with open(self.index_file, 'rb') as f:
+                data = pickle.load(f)
+        except (pickle.PickleError, IOError, EOFError, AttributeError):
+            return {}
+        if not isinstance(data, dict) or data.get('header') != self.header:
+            return {}
+        entries = data.get('entries')
+        return entries if isinstance(entries, dict) else {}
+
+    def lookup(self, file_path: str) -> Optional[Any]:
+        """Return the cached analysis if the file is unchanged, else None"""
+        entry = self.entries.get(file_path)
+        if entry is None:
+            return None
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        # Fast path: same size and modification time
+        if stat.st_size != entry.size:
+            return None
+        if stat.st_mtime == entry.last_modified:
+            return entry.analysis
+
+        # Suspicious match (touched but same size): verify content hash
+        try:
+            checksum = hash_file(file_path)
+        except (OSError, IOError):
+            return None
+
+        if checksum != entry.checksum:
+            return None
+
+        entry.last_modified = stat.st_mtime
+        self._dirty = True
+        return entry.analysis
+
+    def store(self, file_path: str, analysis: Any, checksum: Optional[str] = None):
+        """Record a fresh analysis result for a file (reusing ``checksum`` if known)"""
+        try:
+            stat = os.stat(file_path)
+            if checksum is None:
+                checksum = hash_file(file_path)
+        except (OSError, IOError):
+            return
+
+        self.entries[file_path] = FileAnalysisEntry(
+            last_modified=stat.st_mtime,
+            size=stat.st_size,
+            checksum=checksum,
+            analysis=analysis
+        )
+        self._dirty = True
+
+    def prune(self, current_files: List[str]):
+        """Drop entries for files that no longer exist in the project"""
+        current_files_set = set(current_files)
+        stale = [f for f in self.entries if f not in current_files_set]
+        for file_path in stale:
+            del self.entries[file_path]
+        if stale:
+            self._dirty = True
+
+    def save(self):
+        """Persist index to disk if it changed (atomic rename)"""
+        if not self._dirty:
+            return
+
+        tmp_file = self.index_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({'header': self.header, 'entries': self.entries}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.index_file)
+            self._dirty = False
+        except (pickle.PickleError, IOError):
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+
+class FileDigestCache:
+    """Persistent ``{path: (mtime_ns, size, sha256)}`` map to skip re-hashing unchanged files
+
+    A stored digest is reused only while the file's modification time and size
+    are unchanged. Files modified within ``RACY_WINDOW_NS`` of being recorded
+    are not stored, since a same-size rewrite in the same timestamp tick would
+    otherwise go unnoticed.
+    """
+
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self.entries: Dict[str, tuple] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, tuple]:
+        """Load digests from disk"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                entries = pickle.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (pickle.PickleError, IOError, EOFError, AttributeError):
+            return {}
+
+    def lookup(self, file_path: str, stat: os.stat_result) -> Optional[str]:
+        """Return the stored digest if the file is unchanged, else None"""
+        entry = self.entries.get(file_path)
+        if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            return None
+        return entry[2]
+
+    def store(self, file_path: str, stat: os.stat_result, digest: str):
+        """Record a freshly computed digest for a file"""
+        if stat.st_mtime_ns >= time.time_ns() - self.RACY_WINDOW_NS:
+            return
+        self.entries[file_path] = (stat.st_mtime_ns, stat.st_size, digest)
+        self._dirty = True
+
+    def prune(self, current_files: List[str]):
+        """Drop entries for files that no longer exist in the project"""
+        current_files_set = set(current_files)
+        stale = [f for f in self.entries if f not in current_files_set]
+        for file_path in stale:
+            del self.entries[file_path]
+        if stale:
+            self._dirty = True
+
+    def save(self):
+        """Persist digests to disk if they changed (atomic rename)"""
+        if not self._dirty:
+            return
+
+        tmp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(self.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except (pickle.PickleError, IOError):
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+
+class SourceASTCache:
+    """Content-addressed on-disk cache of per-file AST analysis results
+
+    Entries live in ``<cache_dir>/<first 2 hex>/<sha256>.pkl`` and are keyed by
+    the SHA-256 of the source bytes together with the file path, Python version,
+    analyzer version and analyzer options, so unchanged files skip parsing entirely.
+
+    Every edit leaves the previous entry behind, so ``prune`` drops entries not
+    used for ``max_age_seconds`` and then the least recently used ones until the
+    cache fits in ``max_size_bytes``. Hits refresh an entry's mtime.
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+    DEFAULT_MAX_AGE = 30 * 24 * 3600
+    PRUNE_INTERVAL = 3600
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int = DEFAULT_MAX_SIZE,
+                 max_age_seconds: float = DEFAULT_MAX_AGE):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+        self.optimize = os.getenv('PYVIEW_OPTIMIZE_CACHE') == '1'
+
+    @staticmethod
+    def make_key(file_path: str, content_digest: str, analyzer_tag: str) -> str:
+        """Compute the cache key from a file's source SHA-256 hex digest
+
+        ``analyzer_tag`` is ``ASTAnalyzer.cache_tag``: the analyzer version and
+        every option that affects its output, so differently configured runs
+        sharing a cache directory never see each other's results.
+        """
+        key_str = f"{sys.version_info[:2]}|{analyzer_tag}|{file_path}\0{content_digest}"
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def load(self, key: str) -> Optional[Any]:
+        """Load a cached analysis, or None on miss"""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                analysis = pickle.load(f)
+            os.utime(entry_path)  # Mark as recently used for pruning
+            return analysis
+        except FileNotFoundError:
+            return None
+        except (pickle.PickleError, IOError, EOFError, AttributeError):
+            # Corrupted entry, remove it
+            try:
+                entry_path.unlink()
+            except OSError:
+                pass
+            return None
+
+    def store(self, key: str, analysis: Any):
+        """Store an analysis result (atomic rename, safe across worker processes)"""
+        entry_path = self._entry_path(key)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = pickle.dumps(analysis, protocol=pickle.HIGHEST_PROTOCOL)
+            if self.optimize:
+                payload = pickletools.optimize(payload)
+
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, entry_path)
+        except (pickle.PickleError, IOError):
+            pass
+
+    def prune(self, force: bool = False):
+        """Evict expired entries, then the least recently used until under the size bound
+
+        Runs at most once per ``PRUNE_INTERVAL`` unless ``force`` is set, since it
+        has to stat every entry.
+        """
+        marker = self.cache_dir / ".last_prune"
+        now = time.time()
+        try:
+            if not force and now - marker.stat().st_mtime < self.PRUNE_INTERVAL:
+                return
+        except OSError:
+            pass
+
+        entries = []
+        total_size = 0
+        try:
+            shards = [entry.path for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        except OSError:
+            return
+        for shard in shards:
+            try:
+                with os.scandir(shard) as files:
+                    for entry in files:
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        if now - stat.st_mtime > self.max_age_seconds:
+                            self._unlink(entry.path)
+                        else:
+                            entries.append((stat.st_mtime, stat.st_size, entry.path))
+                            total_size += stat.st_size
+            except OSError:
+                continue
+
+        if total_size > self.max_size_bytes:
+            entries.sort()  # Oldest first
+            for _, size, path in entries:
+                if total_size <= self.max_size_bytes:
+                    break
+                self._unlink(path)
+                total_size -= size
+
+        try:
+            marker.touch()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _unlink(path: str):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove all cached entries"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
 @dataclass
 class AnalysisCache:
     """Cache entry for analysis results"""
@@ -188,6 +506,20 @@ class CacheManager:
         cache_str = json.dumps(cache_data, sort_keys=True)
         return hashlib.sha256(cache_str.encode()).hexdigest()[:16]
     
+    def get_ast_cache(self) -> SourceASTCache:
+        """Get the content-addressed AST analysis cache"""
+        return SourceASTCache(self.cache_dir / "ast", max_size_bytes=self.max_cache_size)
+
+    def get_file_analysis_index(self, project_path: str, analyzer_tag: str = "") -> FileAnalysisIndex:
+        """Get the per-file AST analysis index for a project (``analyzer_tag`` is ``ASTAnalyzer.cache_tag``)"""
+        project_key = hashlib.sha256(os.path.abspath(project_path).encode()).hexdigest()[:16]
+        return FileAnalysisIndex(self.cache_dir / f"ast_index_{project_key}.pkl", analyzer_tag)
+
+    def get_file_digest_cache(self, project_path: str) -> FileDigestCache:
+        """Get the (mtime, size) -> content digest cache for a project"""
+        project_key = hashlib.sha256(os.path.abspath(project_path).encode()).hexdigest()[:16]
+        return FileDigestCache(self.cache_dir / f"digests_{project_key}.pkl")
+
     def get_cache(self, cache_id: str) -> Optional[AnalysisCache]:
         """Retrieve cached analysis results"""
         # Check memory cache first
@@ -213,22 +545,33 @@ class CacheManager:
             self.memory_cache[cache_id] = cache_data
             return cache_data
             
-        except (pickle.PickleError, IOError):
-            # Corrupted cache, remove it
+        except (pickle.PickleError, IOError, EOFError, AttributeError):
+            # Corrupted or incompatible cache, remove it
             self._remove_cache(cache_id)
             return None
+
+    def has_cache(self, cache_id: str, project_path: Optional[str] = None) -> bool:
+        """Check for a cache entry using the index only (the payload is not loaded)"""
+        if cache_id in self.memory_cache:
+            return True
+        entry = self.cache_index.get(cache_id)
+        if entry is None or (project_path is not None and entry.get('project_path') != project_path):
+            return False
+        return (self.cache_dir / f"{cache_id}.pkl").exists()
     
     def save_cache(self, cache: AnalysisCache):
         """Save analysis results to cache"""
         cache_file = self.cache_dir / f"{cache.cache_id}.pkl"
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
         
         try:
             # Ensure we don't exceed cache size
             self._ensure_cache_size_limit()
             
-            # Save to disk
-            with open(cache_file, 'wb') as f:
+            # Save to disk (streamed into a temp file, then renamed so readers never see a partial payload)
+            with open(tmp_file, 'wb') as f:
                 pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
             
             # Update index
             self.cache_index[cache.cache_id] = {
@@ -244,9 +587,9 @@ class CacheManager:
             self._save_cache_index()
             
         except (pickle.PickleError, IOError):
-            # Failed to save, clean up
-            if cache_file.exists():
-                cache_file.unlink()
+            # Failed to save, clean up (an existing cache file is left intact)
+            if tmp_file.exists():
+                tmp_file.unlink()
     
     def check_incremental_validity(self, cache: AnalysisCache, 
                                   current_files: List[str]) -> Dict[str, bool]:
@@ -307,7 +650,7 @@ class CacheManager:
             with open(file1, 'r') as f:
                 content = f.read()
                 # Simple check: does file1 import file2?
-                module_name = Path(file2).stem
+                module_name = os.path.splitext(os.path.basename(file2))[0]
                 return f"import {module_name}" in content or f"from {module_name}" in content
         except:
             return False
@@ -321,6 +664,8 @@ class CacheManager:
         for cache_file in self.cache_dir.glob("*.pkl"):
             cache_file.unlink()
         
+        self.get_ast_cache().clear()
+        
         self.cache_index.clear()
         self.memory_cache.clear()
         self._save_cache_index()
@@ -352,13 +697,14 @@ class IncrementalAnalyzer:
     def can_use_incremental(self, project_path: str, options: Dict[str, Any]) -> Optional[str]:
         """Check if incremental analysis is possible"""
         cache_id = self.cache_manager.generate_cache_key(project_path, options)
-        cache = self.cache_manager.get_cache(cache_id)
         
-        if not cache:
+        # Only the index is consulted here; the cached result itself is loaded by
+        # perform_incremental_analysis, which falls back to a full analysis if it is unreadable
+        if not self.cache_manager.has_cache(cache_id, project_path):
             return None
         
         # Check if the cache is still valid for the project
-        if not os.path.exists(cache.project_path):
+        if not os.path.exists(project_path):
             return None
         
         return cache_id
@@ -398,11 +744,12 @@ class IncrementalAnalyzer:
             merged_result = cache.analysis_result
         
         # Update cache with new results
+        now = datetime.now()
         updated_cache = AnalysisCache(
             cache_id=cache_id,
             project_path=project_path,
-            created_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(days=7),
+            created_at=now,
+            expires_at=now + timedelta(days=7),
             analysis_result=merged_result
         )
         
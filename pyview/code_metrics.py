@@ -160,16 +160,13 @@ class CohesionAnalyzer:
             method_field_usage[method.name] = used_fields
             
         # Count pairs with no shared field usage
-        methods = list(method_field_usage.keys())
+        usages = list(method_field_usage.values())
         no_shared_pairs = 0
         shared_pairs = 0
         
-        for i in range(len(methods)):
-            for j in range(i + 1, len(methods)):
-                fields1 = method_field_usage[methods[i]]
-                fields2 = method_field_usage[methods[j]]
-                
-                if fields1.intersection(fields2):
+        for i, fields1 in enumerate(usages):
+            for fields2 in usages[i + 1:]:
+                if not fields1.isdisjoint(fields2):
                     shared_pairs += 1
                 else:
                     no_shared_pairs += 1
@@ -257,7 +254,7 @@ class CodeMetricsEngine:
         # Calculate Maintainability Index (simplified version)
         # MI = 171 - 5.2 * ln(Halstead Volume) - 0.23 * (Cyclomatic Complexity) - 16.2 * ln(Lines of Code)
         # Using simplified approximation
-        lines_of_code = max(1, sum(len(m.body_text.split('\n')) for m in class_info.methods))
+        lines_of_code = max(1, sum(m.body_text.count('\n') + 1 for m in class_info.methods))
         maintainability_index = max(0, 171 - 0.23 * avg_complexity - 16.2 * math.log(lines_of_code))
         
         # Technical debt ratio (0-1, lower is better)
@@ -294,7 +291,7 @@ class CodeMetricsEngine:
             avg_complexity = 1
             
         # Module-level maintainability
-        lines_of_code = len(source_code.split('\n'))
+        lines_of_code = source_code.count('\n') + 1
         maintainability_index = max(0, 171 - 0.23 * avg_complexity - 16.2 * math.log(max(1, lines_of_code)))
         
         return QualityMetrics(
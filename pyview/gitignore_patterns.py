@@ -11,8 +11,9 @@
 
 import fnmatch
 import os
+import re
 from pathlib import Path, PurePath
-from typing import List, Union
+from typing import FrozenSet, List, Optional, Union
 
 
 class GitIgnorePatternMatcher:
@@ -29,6 +30,7 @@ class GitIgnorePatternMatcher:
         """
         self.include_patterns = []  # 포함할 패턴들 (! 로 시작)
         self.exclude_patterns = []  # 제외할 패턴들
+        self._part_match_cache = {}  # (경로 구성요소, 패턴) -> 매칭 여부
 
         for pattern in patterns:
             pattern = pattern.strip()
@@ -41,6 +43,28 @@ class GitIgnorePatternMatcher:
             else:
                 self.exclude_patterns.append(pattern)
 
+        # 와일드카드/경로 구분자가 없는 리터럴 패턴은 "경로 구성요소 중 하나와 일치"와 같으므로
+        # 구분자 경계에 고정한 하나의 정규식으로 합쳐 한 번에 검사
+        literal_patterns = [p for p in self.exclude_patterns if self._is_literal(p)]
+        self._glob_exclude_patterns = [p for p in self.exclude_patterns if not self._is_literal(p)]
+        self._literal_exclude_re = None
+        if literal_patterns:
+            seps = ''.join(re.escape(sep) for sep in {'/', os.sep, os.altsep} if sep)
+            alternatives = '|'.join(re.escape(p) for p in sorted(set(literal_patterns), key=len, reverse=True))
+            self._literal_exclude_re = re.compile(f"(?:^|[{seps}])(?:{alternatives})(?:[{seps}]|$)")
+
+    @property
+    def literal_names(self) -> Optional[FrozenSet[str]]:
+        """
+        모든 패턴이 단순 이름 패턴일 때 그 이름 집합 (아니면 None)
+
+        부정 패턴과 glob 패턴이 없으면 "경로 구성요소 중 하나와 일치"만 검사하면 되므로,
+        상위 디렉토리를 이미 걸러낸 탐색기는 새 구성요소 이름만 집합에서 찾으면 된다.
+        """
+        if self.include_patterns or self._glob_exclude_patterns:
+            return None
+        return frozenset(self.exclude_patterns)
+
     def should_exclude(self, file_path: Union[str, Path]) -> bool:
         """
         주어진 파일/디렉토리 경로가 제외되어야 하는지 확인
@@ -52,14 +76,17 @@ class GitIgnorePatternMatcher:
             True if 제외되어야 함, False otherwise
         """
         path_str = str(file_path)
-        path_obj = Path(path_str)
 
-        # 먼저 제외 패턴들을 확인
-        excluded = False
-        for pattern in self.exclude_patterns:
-            if self._match_pattern(path_str, path_obj, pattern):
-                excluded = True
-                break
+        # 먼저 리터럴 제외 패턴들을 한 번의 정규식 검색으로 확인
+        excluded = bool(self._literal_exclude_re and self._literal_exclude_re.search(path_str))
+
+        # 나머지 (glob) 제외 패턴 확인
+        path_obj = Path(path_str)
+        if not excluded:
+            for pattern in self._glob_exclude_patterns:
+                if self._match_pattern(path_str, path_obj, pattern):
+                    excluded = True
+                    break
 
         if not excluded:
             return False
@@ -71,6 +98,11 @@ class GitIgnorePatternMatcher:
 
         return excluded
 
+    @staticmethod
+    def _is_literal(pattern: str) -> bool:
+        """와일드카드와 경로 구분자가 없는 단순 이름 패턴인지 확인"""
+        return not any(ch in pattern for ch in '*?[/\\')
+
     def _match_pattern(self, path_str: str, path_obj: Path, pattern: str) -> bool:
         """
         개별 패턴과 경로를 매칭
@@ -110,13 +142,15 @@ class GitIgnorePatternMatcher:
         if fnmatch.fnmatch(str(path_obj), pattern):
             return True
 
-        # 파일명만 매칭
-        if fnmatch.fnmatch(path_obj.name, pattern):
-            return True
-
-        # 경로의 각 부분 매칭
+        # 파일명 및 경로의 각 부분 매칭 (파일명은 마지막 구성요소)
+        # 같은 디렉토리의 파일들은 상위 경로 구성요소가 동일하므로 결과를 캐시하여 재사용
+        cache = self._part_match_cache
         for part in path_obj.parts:
-            if fnmatch.fnmatch(part, pattern):
+            key = (part, pattern)
+            matched = cache.get(key)
+            if matched is None:
+                matched = cache[key] = fnmatch.fnmatch(part, pattern)
+            if matched:
                 return True
 
         return False
@@ -0,0 +1,77 @@
+"""
+파일 읽기/해싱 유틸리티
+
+AST 캐시, 증분 분석 인덱스, 파일 메타데이터가 모두 같은 SHA-256 다이제스트를 쓰도록
+파일 내용 해싱을 한 곳에 모은다. 한 번 계산한 다이제스트는 호출자가 전달하여
+같은 파일을 다시 읽고 해싱하지 않는다.
+"""
+
+import os
+import hashlib
+import mmap
+from typing import Dict, Iterable
+
+# 이 크기를 넘는 파일은 전체를 bytes로 읽지 않고 스트리밍 해싱
+STREAM_THRESHOLD = 64 * 1024
+
+# Python 3.11+: 파일 디스크립터에서 C 레벨로 읽으며 해싱 (OpenSSL 백엔드의 SHA-NI/ARMv8 SHA2 가속 사용)
+_file_digest = getattr(hashlib, 'file_digest', None)
+
+
+def hash_bytes(content: bytes) -> str:
+    """바이트 내용의 SHA-256 16진수 다이제스트"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def read_file_bytes(file_path: str) -> bytes:
+    """파일 전체를 바이트로 읽기 (버퍼링 없는 FileIO)
+
+    통째로 읽을 때는 BufferedReader가 필요 없으므로 생성하지 않는다 (isatty 검사도 생략).
+    FileIO.readall()은 fstat으로 크기를 알아내 한 번의 read로 읽는다.
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        return f.readall()
+
+
+def hash_file(file_path: str) -> str:
+    """파일 내용의 SHA-256 16진수 다이제스트 (내용은 반환하지 않음)
+
+    작은 소스 파일은 한 번에 읽는 편이 가장 빠르므로 (file_digest는 호출마다 256KiB 버퍼 할당)
+    큰 파일만 hashlib.file_digest로, 3.11 미만에서는 mmap으로 스트리밍 해싱한다.
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= STREAM_THRESHOLD:
+            return hash_bytes(f.readall())
+        if _file_digest is not None:
+            return _file_digest(f, 'sha256').hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+
+def stat_files(file_paths: Iterable[str]) -> Dict[str, os.stat_result]:
+    """파일 경로별 stat 결과 (디렉토리마다 scandir 한 번으로 수집, 없거나 읽을 수 없는 파일은 제외)
+
+    파일마다 exists + stat을 따로 호출하지 않고, 디렉토리 항목을 한 번 훑으며 필요한 파일만 stat한다.
+    DirEntry.stat()은 os.stat과 같이 심볼릭 링크를 따라간다.
+    """
+    by_dir: Dict[str, Dict[str, str]] = {}                      # 디렉토리 -> {파일명: 원래 경로}
+    for path in file_paths:
+        directory, name = os.path.split(path)
+        by_dir.setdefault(directory, {})[name] = path
+
+    results: Dict[str, os.stat_result] = {}
+    for directory, names in by_dir.items():
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    path = names.get(entry.name)
+                    if path is None:                            # 분석 대상이 아닌 항목
+                        continue
+                    try:
+                        results[path] = entry.stat()
+                    except OSError:                             # 깨진 링크 등
+                        continue
+        except OSError:                                         # 디렉토리가 사라졌거나 접근 불가
+            continue
+    return results
@@ -6,11 +6,16 @@ PyView의 5단계 의존성 분석을 위한 데이터 구조 정의:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Set
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Sequence, Set
 from enum import Enum
+import sys
 import json
 from datetime import datetime
 
+# High-volume records use __slots__ where dataclasses support it (Python 3.10+)
+_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class DependencyType(Enum):
     """엔티티 간의 의존성 종류"""
@@ -92,7 +97,7 @@ class ClassInfo:
     docstring: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ModuleInfo:
     """Information about a Python module"""
     id: str
@@ -135,7 +140,7 @@ class Relationship:
     context: Optional[str] = None  # Additional context
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class QualityMetrics:
     """Code quality metrics for entities"""
     entity_id: str
@@ -152,7 +157,7 @@ class QualityMetrics:
     quality_grade: str = "A"    # A, B, C, D, F
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CyclicDependency:
     """Information about a cyclic dependency"""
     id: str
@@ -164,6 +169,32 @@ class CyclicDependency:
     metrics: Optional[Dict[str, Any]] = None  # Cycle metrics (length, strength, etc.)
 
 
+@dataclass
+class CycleRecord:
+    """Compact cycle record produced by the cycle detectors
+
+    Uses __slots__ instead of a per-record dict. Item access (record['id'],
+    record.get('paths')) is kept for code that still treats cycles as dicts.
+    """
+    __slots__ = ('id', 'entities', 'cycle_type', 'severity', 'description', 'paths', 'metrics')
+    id: str
+    entities: List[str]  # Entity IDs forming the cycle
+    cycle_type: str  # "import", "inheritance", "call"
+    severity: str  # "low", "medium", "high"
+    description: Optional[str]
+    paths: Sequence[Dict[str, Any]]  # Detailed path information (may be built on first access)
+    metrics: Optional[Dict[str, Any]]  # Cycle metrics (length, edge_count, ...)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
 @dataclass
 class DependencyGraph:
     """The complete dependency graph structure"""
@@ -264,10 +295,14 @@ class AnalysisResult:
         def _convert_dataclass(obj):
             if hasattr(obj, '__dataclass_fields__'):
                 result = {}
-                for key, value in obj.__dict__.items():
+                if hasattr(obj, '__dict__'):
+                    items = obj.__dict__.items()
+                else:  # __slots__ record: read the declared fields
+                    items = ((name, getattr(obj, name)) for name in obj.__dataclass_fields__)
+                for key, value in items:
                     if key.startswith('_'):  # Skip private attributes
                         continue
-                    if isinstance(value, list):
+                    if isinstance(value, list) or (isinstance(value, Sequence) and not isinstance(value, str)):
                         result[key] = [_convert_dataclass(item) for item in value]
                     elif isinstance(value, dict):
                         result[key] = {k: _convert_dataclass(v) for k, v in value.items()}
@@ -315,8 +350,14 @@ def create_package_id(package_path: str) -> str:
     return f"pkg:{normalized}"
 
 
+@lru_cache(maxsize=200_000)
 def create_module_id(module_path: str) -> str:
-    """Create a unique module ID from module file path"""
+    """Create a unique module ID from module file path
+
+    Memoized: the same module path is converted many times (per import,
+    per cycle member, per integration pass), and callers then share one
+    ID string per module.
+    """
     # Convert file path to module name
     module_name = module_path.replace('/', '.').replace('\\', '.')
     if module_name.endswith('.py'):
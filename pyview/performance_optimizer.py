@@ -15,8 +15,9 @@ import gc
 import psutil
 import time
 import asyncio
-from typing import List, Dict, Iterator, Optional, Callable, Any, Generator
+from typing import List, Dict, Iterable, Iterator, Optional, Callable, Any, Generator, Set
 from dataclasses import dataclass
+from collections import Counter, deque
 from pathlib import Path
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import threading
@@ -100,10 +101,11 @@ class StreamingProcessor:
             except OSError:
                 continue
                 
-        print(f"📊 Processing {len(filtered_paths)}/{total_files} files (filtered out large files)")
+        total_filtered = len(filtered_paths)
+        print(f"📊 Processing {total_filtered}/{total_files} files (filtered out large files)")
         
         # Process in batches
-        for i in range(0, len(filtered_paths), self.config.batch_size):
+        for i in range(0, total_filtered, self.config.batch_size):
             batch = filtered_paths[i:i + self.config.batch_size]
             
             # Check memory before processing
@@ -117,14 +119,13 @@ class StreamingProcessor:
                 batch_results = processor(batch)
                 
                 # Yield results one by one to keep memory usage low
-                for result in batch_results:
-                    yield result
+                yield from batch_results
                     
                 processed += len(batch)
                 
                 if progress_callback and self.config.enable_progress:
-                    progress = (processed / len(filtered_paths)) * 100
-                    progress_callback(f"Processed {processed}/{len(filtered_paths)} files", progress)
+                    progress = (processed / total_filtered) * 100
+                    progress_callback(f"Processed {processed}/{total_filtered} files", progress)
                     
                 # Force GC after each batch if enabled
                 if self.config.enable_gc:
@@ -166,6 +167,7 @@ class ParallelAnalyzer:
         results = []
         completed = 0
         total_tasks = len(tasks)
+        report_every = max(1, total_tasks // 100)  # Report roughly every 1%, not per task
         
         # Use ProcessPoolExecutor for CPU-bound tasks
         with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
@@ -173,11 +175,10 @@ class ParallelAnalyzer:
             chunk_size = max(1, total_tasks // (self.max_workers * 2))
             
             future_to_task = {}
-            pending_tasks = tasks.copy()
             
             # Initial batch submission
-            initial_batch = pending_tasks[:chunk_size * self.max_workers]
-            pending_tasks = pending_tasks[chunk_size * self.max_workers:]
+            initial_batch = tasks[:chunk_size * self.max_workers]
+            pending_tasks = deque(tasks[chunk_size * self.max_workers:])
             
             for task in initial_batch:
                 future = executor.submit(worker_func, task)
@@ -197,7 +198,8 @@ class ParallelAnalyzer:
                         results.append(result)
                         completed += 1
                         
-                        if progress_callback and self.config.enable_progress:
+                        if (progress_callback and self.config.enable_progress and
+                                (completed % report_every == 0 or completed == total_tasks)):
                             progress = (completed / total_tasks) * 100
                             progress_callback(f"Completed {completed}/{total_tasks} tasks", progress)
                             
@@ -213,7 +215,7 @@ class ParallelAnalyzer:
                             not self.memory_monitor.is_memory_critical() and
                             len(future_to_task) < self.max_workers * 2):
                             
-                            new_task = pending_tasks.pop(0)
+                            new_task = pending_tasks.popleft()
                             new_future = executor.submit(worker_func, new_task)
                             future_to_task[new_future] = new_task
                             
@@ -231,32 +233,34 @@ class LargeProjectAnalyzer:
         self.parallel_analyzer = ParallelAnalyzer(self.config)
         self.memory_monitor = MemoryMonitor(self.config.max_memory_mb)
         
-    def estimate_project_size(self, project_path: str) -> Dict[str, Any]:
-        """Estimate project complexity and resource requirements"""
+    def estimate_project_size(self, project_path: str,
+                              file_paths: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Estimate project complexity and resource requirements
+
+        Pass ``file_paths`` when the caller has already discovered the project's
+        files; the directory tree is then not walked again.
+        """
         python_files = []
         total_size = 0
         large_files = 0
         
-        for root, dirs, files in os.walk(project_path):
-            # Skip common non-essential directories
-            dirs[:] = [d for d in dirs if d not in {
+        if file_paths is None:
+            file_paths = self._walk_python_files(project_path, {
                 '__pycache__', '.git', '.venv', 'venv', 'env', 'node_modules',
                 '.pytest_cache', '.mypy_cache', 'build', 'dist', '.tox'
-            }]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        size = os.path.getsize(file_path)
-                        python_files.append((file_path, size))
-                        total_size += size
-                        
-                        if size > self.config.max_file_size_mb * 1024 * 1024:
-                            large_files += 1
-                            
-                    except OSError:
-                        continue
+            })
+
+        for file_path in file_paths:
+            try:
+                size = os.path.getsize(file_path)
+                python_files.append((file_path, size))
+                total_size += size
+
+                if size > self.config.max_file_size_mb * 1024 * 1024:
+                    large_files += 1
+
+            except OSError:
+                continue
         
         # Estimate analysis complexity
         complexity = "low"
@@ -282,11 +286,24 @@ class LargeProjectAnalyzer:
         
     def analyze_large_project(self, project_path: str, 
                              analyzer_func: Callable,
-                             progress_callback: Optional[Callable] = None) -> Iterator[Any]:
-        """Analyze large project with optimizations"""
+                             progress_callback: Optional[Callable] = None,
+                             file_paths: Optional[List[str]] = None) -> Iterator[Any]:
+        """Analyze large project with optimizations
+
+        ``file_paths`` is the already-discovered file list; when omitted the
+        project directory is walked to find Python files.
+        """
         
+        # Get file list
+        if file_paths is None:
+            python_files = list(self._walk_python_files(project_path, {
+                '__pycache__', '.git', '.venv', 'venv', 'env'
+            }))
+        else:
+            python_files = file_paths
+
         # First, estimate project size
-        project_stats = self.estimate_project_size(project_path)
+        project_stats = self.estimate_project_size(project_path, python_files)
         
         print(f"📊 Project Analysis:")
         print(f"  📁 Files: {project_stats['total_files']:,}")
@@ -297,18 +314,6 @@ class LargeProjectAnalyzer:
         if project_stats['complexity'] in ['high', 'very_high']:
             print("⚠️  Large project detected, using streaming analysis...")
             
-        # Get file list
-        python_files = []
-        for root, dirs, files in os.walk(project_path):
-            dirs[:] = [d for d in dirs if d not in {
-                '__pycache__', '.git', '.venv', 'venv', 'env'
-            }]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    python_files.append(file_path)
-        
         # Use streaming processor for large projects
         if len(python_files) > 1000:
             print("🌊 Using streaming analysis for memory efficiency...")
@@ -341,6 +346,17 @@ class LargeProjectAnalyzer:
         print(f"  Usage: {memory_stats['usage_percent']:.1f}%")
 
 
+    @staticmethod
+    def _walk_python_files(project_path: str, skip_dirs: Set[str]) -> Iterator[str]:
+        """Yield Python file paths under project_path, skipping directories by name"""
+        for root, dirs, files in os.walk(project_path):
+            dirs[:] = [d for d in dirs if d not in skip_dirs]
+
+            for file in files:
+                if file.endswith('.py'):
+                    yield os.path.join(root, file)
+
+
 class ResultPaginator:
     """Handles pagination of large result sets"""
     
@@ -377,16 +393,8 @@ class ResultPaginator:
         sample = results[:sample_size] if len(results) > sample_size else results
         
         # Basic statistics
-        entity_types = {}
-        complexity_stats = []
-        
-        for result in sample:
-            entity_type = getattr(result, 'type', 'unknown')
-            entity_types[entity_type] = entity_types.get(entity_type, 0) + 1
-            
-            complexity = getattr(result, 'complexity', 0)
-            if complexity:
-                complexity_stats.append(complexity)
+        entity_types = dict(Counter(getattr(result, 'type', 'unknown') for result in sample))
+        complexity_stats = [c for c in (getattr(result, 'complexity', 0) for result in sample) if c]
                 
         avg_complexity = sum(complexity_stats) / len(complexity_stats) if complexity_stats else 0
         
@@ -5,10 +5,19 @@ PyView 분석 엔진 테스트
 import pytest
 import tempfile
 import os
+import time
 from unittest.mock import Mock, patch
 
 from pyview.analyzer_engine import AnalyzerEngine, AnalysisOptions, ProgressCallback
-from pyview.models import AnalysisResult
+from pyview.models import AnalysisResult, Relationship, DependencyType
+
+
+def rel(src, dst, relationship_type=DependencyType.CALL):
+    """Build a relationship between two entity IDs for cycle detection tests"""
+    return Relationship(
+        id=f"rel:{src}->{dst}", from_entity=src, to_entity=dst,
+        relationship_type=relationship_type, line_number=1, file_path="a.py"
+    )
 
 
 class TestAnalysisOptions:
@@ -26,6 +35,9 @@ class TestAnalysisOptions:
         assert 'class' in options.analysis_levels
         assert options.enable_type_inference is True
         assert options.max_workers > 0
+        assert options.use_processes is True
+        assert options.worker_start_method is None  # 플랫폼 기본 시작 방식
+        assert options.large_project_cycles is False  # 대규모 프로젝트는 순환 탐지 생략
     
     def test_custom_options(self):
         """Test custom analysis options"""
@@ -67,6 +79,18 @@ class TestProgressCallback:
         assert args['progress'] == 75.0
         assert args['files_processed'] == 10
 
+    def test_should_update_throttling(self):
+        """Test that per-file progress updates are throttled"""
+        callback = ProgressCallback(Mock())
+        callback.update("Analyzing file 1/1000", 30.0)
+
+        assert callback.should_update(100, 1000)       # every 100 items
+        assert callback.should_update(1000, 1000)      # always report completion
+        assert not callback.should_update(101, 1000)   # within 250ms of the last update
+
+        callback._last_emit_ns -= ProgressCallback.min_interval_ns
+        assert callback.should_update(101, 1000)
+
 
 class TestAnalyzerEngine:
     """Test the main analyzer engine"""
@@ -84,6 +108,7 @@ class TestAnalyzerEngine:
         main_content = '''
 """Main module"""
 import os
+import time
 from .utils import helper_function
 
 class MainClass:
@@ -144,8 +169,24 @@ class UtilityClass:
         assert "main.py" in file_names
         assert "utils.py" in file_names
         assert "__init__.py" in file_names
-    
-    @patch('pyview.analyzer_engine.LegacyBridge')
+
+    def test_file_discovery_excludes_directories_by_name(self):
+        """Literal exclude patterns prune matching directories at any depth"""
+        project_dir = self.create_test_project()
+        for sub in ("pkg/__pycache__", "pkg/tests", "pkg/testsuite"):
+            os.makedirs(os.path.join(project_dir, sub))
+            with open(os.path.join(project_dir, sub, "mod.py"), 'w') as f:
+                f.write("x = 1\n")
+
+        files = self.engine._discover_project_files(project_dir)
+
+        relative = {os.path.relpath(f, project_dir).replace(os.sep, '/') for f in files}
+        assert "pkg/testsuite/mod.py" in relative
+        assert "pkg/tests/mod.py" not in relative
+        assert "pkg/__pycache__/mod.py" not in relative
+        assert len(files) == 4
+
+    @patch('pyview.legacy_bridge.LegacyBridge')
     def test_pydeps_analysis_integration(self, mock_bridge_class):
         """Test integration with pydeps analysis"""
         mock_bridge = Mock()
@@ -220,6 +261,246 @@ class UtilityClass:
         assert len(result.dependency_graph.classes) >= 2  # MainClass, UtilityClass
         assert len(result.dependency_graph.methods) >= 4  # __init__, process, helper_function, static_method
     
+    def test_incremental_ast_analysis_skips_unchanged_files(self):
+        """Test that incremental mode reuses analyses of unchanged files"""
+        from pyview.cache_manager import CacheManager
+
+        project_dir = self.create_test_project()
+        engine = AnalyzerEngine(AnalysisOptions(max_workers=1, incremental=True))
+        engine.cache_manager = CacheManager(cache_dir=tempfile.mkdtemp())
+        files = engine._discover_project_files(project_dir)
+
+        first = engine._run_ast_analysis(files, Mock(), project_dir)
+        assert len(first) == len(files)
+
+        with patch.object(engine.ast_analyzer, 'analyze_file') as mock_analyze:
+            second = engine._run_ast_analysis(files, Mock(), project_dir)
+
+        mock_analyze.assert_not_called()
+        assert {a.file_path for a in second} == set(files)
+
+    def test_incremental_index_discarded_for_other_analyzer_settings(self):
+        """Test that the incremental index is dropped when analyzer version or options change"""
+        from pathlib import Path
+        from pyview.ast_analyzer import ASTAnalyzer
+        from pyview.cache_manager import FileAnalysisIndex
+
+        project_dir = self.create_test_project()
+        files = AnalyzerEngine(AnalysisOptions(max_workers=1))._discover_project_files(project_dir)
+        index_file = Path(tempfile.mkdtemp()) / "index.pkl"
+        typed, untyped = ASTAnalyzer().cache_tag, ASTAnalyzer(enable_type_inference=False).cache_tag
+
+        index = FileAnalysisIndex(index_file, typed)
+        index.store(files[0], "analysis")
+        index.save()
+
+        assert FileAnalysisIndex(index_file, typed).entries.keys() == {files[0]}
+        assert FileAnalysisIndex(index_file, untyped).entries == {}
+
+    def test_ast_cache_skips_parsing_unchanged_source(self):
+        """Test that the content-addressed AST cache avoids re-parsing"""
+        from pyview.cache_manager import SourceASTCache
+
+        project_dir = self.create_test_project()
+        engine = AnalyzerEngine(AnalysisOptions(max_workers=1))
+        engine.ast_cache = SourceASTCache(tempfile.mkdtemp())
+        files = engine._discover_project_files(project_dir)
+
+        first = engine._run_sequential_ast_analysis(files, Mock())
+        assert len(first) == len(files)
+
+        with patch.object(engine.ast_analyzer, 'analyze_source') as mock_parse:
+            second = engine._run_sequential_ast_analysis(files, Mock())
+
+        mock_parse.assert_not_called()
+        assert [a.file_path for a in second] == [a.file_path for a in first]
+
+    def test_ast_cache_separates_type_inference_settings(self):
+        """Test that runs with different analyzer options never share AST cache entries"""
+        from pyview.cache_manager import SourceASTCache
+
+        project_dir = tempfile.mkdtemp()
+        with open(os.path.join(project_dir, "typed.py"), "w") as f:
+            f.write("def greet(count=1):\n    return 'hi'\n")
+        cache_dir = tempfile.mkdtemp()
+
+        results = []
+        for enable_type_inference in (True, False):
+            engine = AnalyzerEngine(AnalysisOptions(max_workers=1, enable_type_inference=enable_type_inference))
+            engine.ast_cache = SourceASTCache(cache_dir)
+            files = engine._discover_project_files(project_dir)
+            results.append(engine._run_sequential_ast_analysis(files, Mock())[0].methods)
+
+        uncached = AnalyzerEngine(AnalysisOptions(max_workers=1, enable_type_inference=False))
+        files = uncached._discover_project_files(project_dir)
+        assert results[0] != results[1]
+        assert results[1] == uncached._run_sequential_ast_analysis(files, Mock())[0].methods
+
+    def test_process_pool_does_not_fork_multithreaded_parent(self):
+        """Test that the default worker pool avoids fork() once I/O threads are running"""
+        import multiprocessing
+        import warnings
+
+        project_dir = self.create_test_project()
+        options = AnalysisOptions(max_workers=2, enable_caching=False)
+        # Python 3.12+ warns on fork() with live threads; os.fork cannot raise it, so record instead of "error"
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", DeprecationWarning)
+            with AnalyzerEngine(options) as engine:
+                files = engine._discover_project_files(project_dir)
+                analyses = engine._run_parallel_ast_analysis(files, Mock())
+                pool = engine._pool
+
+        assert len(analyses) == len(files)
+        assert not [w for w in caught if issubclass(w.category, DeprecationWarning) and "fork()" in str(w.message)]
+        if multiprocessing.get_start_method() == 'fork' and hasattr(pool, '_mp_context'):
+            assert pool._mp_context.get_start_method() != 'fork'
+
+    def test_ast_cache_prune_evicts_least_recently_used(self):
+        """Test that the AST cache is bounded by size and drops the least recently used entries"""
+        from pyview.cache_manager import SourceASTCache
+
+        cache = SourceASTCache(tempfile.mkdtemp(), max_size_bytes=0)
+        keys = [cache.make_key(f"m{i}.py", f"{i:064x}", "tag") for i in range(3)]
+        for age, key in zip((300, 200, 100), keys):
+            cache.store(key, {"key": key})
+            stamp = time.time() - age
+            os.utime(cache._entry_path(key), (stamp, stamp))
+        cache.max_size_bytes = cache._entry_path(keys[0]).stat().st_size * 2
+
+        assert cache.load(keys[0]) == {"key": keys[0]}  # A hit makes the oldest entry the most recent
+        cache.prune(force=True)
+
+        assert cache.load(keys[1]) is None
+        assert cache.load(keys[0]) is not None and cache.load(keys[2]) is not None
+
+    def test_process_pool_recycled_after_task_budget(self):
+        """Test that worker processes are replaced between passes once they exceed the task budget"""
+        from pyview.analyzer_engine import _WORKER_MAX_TASKS
+
+        engine = AnalyzerEngine(AnalysisOptions(max_workers=2, enable_caching=False))
+        old_pool, new_pool = Mock(), Mock()
+        engine._pool = old_pool
+        engine._pool_tasks = _WORKER_MAX_TASKS * 2 - 1
+
+        with patch.object(AnalyzerEngine, '_create_worker_pool', return_value=new_pool):
+            assert engine._get_process_pool(1) is old_pool  # Still within budget
+            assert engine._get_process_pool(5) is new_pool
+
+        old_pool.shutdown.assert_called_once_with(wait=True)
+        assert engine._pool_tasks == 5
+
+    def test_parallel_workers_follow_type_inference_option(self):
+        """Test that pooled workers build their analyzer from the engine options"""
+        project_dir = self.create_test_project()
+        options = AnalysisOptions(max_workers=2, enable_caching=False, enable_type_inference=False)
+        with AnalyzerEngine(options) as engine:
+            files = engine._discover_project_files(project_dir)
+            parallel = engine._run_parallel_ast_analysis(files, Mock())
+            sequential = engine._run_sequential_ast_analysis(files, Mock())
+
+        assert [(a.methods, a.fields) for a in parallel] == [(a.methods, a.fields) for a in sequential]
+
+    def test_digest_cache_skips_hashing_unchanged_files(self):
+        """Test that file digests are reused while (mtime, size) is unchanged"""
+        from pyview.cache_manager import CacheManager
+
+        project_dir = self.create_test_project()
+        engine = AnalyzerEngine(AnalysisOptions(max_workers=1))
+        engine.cache_manager = CacheManager(cache_dir=tempfile.mkdtemp())
+        files = engine._discover_project_files(project_dir)
+        for file_path in files:                     # outside the racy-timestamp window
+            os.utime(file_path, (1_000_000_000, 1_000_000_000))
+
+        engine._digest_cache = engine.cache_manager.get_file_digest_cache(project_dir)
+        first = engine._group_identical_files(files)
+        engine._digest_cache.save()
+
+        engine._digest_cache = engine.cache_manager.get_file_digest_cache(project_dir)
+        with patch('pyview.analyzer_engine.hash_file') as mock_hash:
+            second = engine._group_identical_files(files)
+        mock_hash.assert_not_called()
+        assert second == first
+
+        with open(files[0], 'a') as f:
+            f.write("\n# changed\n")
+        changed = engine._group_identical_files(files)
+        assert changed[0][0] != first[0][0]
+
+    def test_identical_files_parsed_once(self):
+        """Test that byte-identical files share one parse but keep their own IDs"""
+        from pyview import ast_analyzer
+
+        temp_dir = tempfile.mkdtemp()
+        files = []
+        for pkg in ("pkg_a", "pkg_b"):
+            os.makedirs(os.path.join(temp_dir, pkg))
+            file_path = os.path.join(temp_dir, pkg, "generated.py")
+            with open(file_path, 'w') as f:
+                f.write("class Message:\n    def serialize(self):\n        return b''\n")
+            files.append(file_path)
+
+        self.engine.ast_cache = None
+        mock_parse = Mock(wraps=ast_analyzer.parse_source)
+        with patch('pyview.ast_analyzer.parse_source', mock_parse), \
+                patch('pyview.analyzer_engine.parse_source', mock_parse):
+            analyses = self.engine._run_sequential_ast_analysis(files, Mock())
+
+        assert mock_parse.call_count == 1
+        assert [a.file_path for a in analyses] == files
+        assert analyses[0].classes[0].id != analyses[1].classes[0].id
+
+    def test_file_digests_shared_with_metadata(self):
+        """Test that content hashes from grouping are reused for cache metadata"""
+        import hashlib
+        from pyview.cache_manager import FileMetadata
+
+        project_dir = self.create_test_project()
+        files = self.engine._discover_project_files(project_dir)
+        self.engine._run_sequential_ast_analysis(files, Mock())
+
+        for file_path in files:
+            with open(file_path, 'rb') as f:
+                assert self.engine._file_digests[file_path] == hashlib.sha256(f.read()).hexdigest()
+
+        with patch('pyview.cache_manager.hash_file') as mock_hash:
+            metadata = FileMetadata.from_file(files[0], self.engine._file_digests[files[0]])
+
+        mock_hash.assert_not_called()
+        assert not metadata.is_outdated()
+
+    def test_integration_reused_for_unchanged_inputs(self):
+        """Test that integration is skipped when no file content changed"""
+        project_dir = self.create_test_project()
+        files = self.engine._discover_project_files(project_dir)
+        pydeps_result = {'packages': [], 'modules': [], 'relationships': [], 'cycles': [], 'metrics': {}}
+
+        analyses = self.engine._run_sequential_ast_analysis(files, Mock())
+        first = self.engine._integrate_analyses(pydeps_result, analyses, Mock())
+
+        with patch.object(self.engine, '_detect_cycles_fused') as mock_cycles:
+            second = self.engine._integrate_analyses(pydeps_result, analyses, Mock())
+        mock_cycles.assert_not_called()
+        assert [c.id for c in second['classes']] == [c.id for c in first['classes']]
+
+        # Mutating a returned result must not leak into the cache or earlier results
+        assert second['classes'] is not first['classes']
+        first_class_ids = [c.id for c in first['classes']]
+        first['classes'][0].name = 'Renamed'
+        second['classes'].clear()
+        second['metrics'].clear()
+        fourth = self.engine._integrate_analyses(pydeps_result, analyses, Mock())
+        assert [c.id for c in fourth['classes']] == first_class_ids
+        assert fourth['classes'][0].name != 'Renamed'
+        assert fourth['metrics']
+
+        # A changed file invalidates the cached result
+        with open(files[0], 'a') as f:
+            f.write("\nclass Added:\n    pass\n")
+        analyses = self.engine._run_sequential_ast_analysis(files, Mock())
+        third = self.engine._integrate_analyses(pydeps_result, analyses, Mock())
+        assert len(third['classes']) == len(first['classes']) + 1
+
     def test_error_handling_in_analysis(self):
         """Test error handling during analysis"""
         # Create a project with syntax error
@@ -259,7 +540,218 @@ def broken_function(
         
         # Should return a list (empty in this case)
         assert isinstance(cycles, list)
-    
+
+    def test_detailed_cycle_path(self):
+        """Test that detailed cycle detection returns the closed cycle path"""
+        relationships = [rel("a", "b"), rel("b", "c"), rel("c", "a")]
+
+        cycles = self.engine._detect_detailed_cycles([], [], relationships)
+
+        assert len(cycles) >= 1
+        entities = cycles[0]['entities']
+        assert entities[0] == entities[-1]
+        assert set(entities) == {"a", "b", "c"}
+
+    def test_detailed_cycles_one_per_component(self):
+        """Test that Tarjan-based detection reports each cycle group once"""
+        relationships = [
+            rel("a", "b"), rel("b", "a"), rel("b", "c"),
+            rel("c", "d"), rel("d", "e"), rel("e", "c"),
+            rel("x", "x"), rel("y", "z"),
+        ]
+
+        cycles = self.engine._detect_detailed_cycles([], [], relationships)
+
+        assert sorted(sorted(set(c['entities'])) for c in cycles) == [
+            ["a", "b"], ["c", "d", "e"], ["x"]
+        ]
+        for cycle in cycles:
+            assert cycle['entities'][0] == cycle['entities'][-1]
+
+    def test_cycles_by_type_one_record_per_component(self):
+        """Test that typed cycle detection reports each SCC once and nothing else"""
+        # Two overlapping loops (a-b-c and a-c) form one SCC; d-e is a second one; f is acyclic
+        relationships = [rel("a", "b"), rel("b", "c"), rel("c", "a"), rel("a", "c"),
+                         rel("d", "e"), rel("e", "d"), rel("e", "f")]
+
+        cycles = self.engine._detect_cycles_by_type(relationships, 'call')
+
+        assert [c['id'] for c in cycles] == ["call_cycle_0", "call_cycle_1"]
+        assert sorted(sorted(c['entities']) for c in cycles) == [["a", "b", "c"], ["d", "e"]]
+
+    def test_fused_cycle_detection_matches_separate_detectors(self):
+        """Test that the single-pass detector keeps per-layer results"""
+        from pyview.models import ModuleInfo, ImportInfo
+
+        # Same names in different layers must not merge into one component
+        relationships = [rel("pkg.a", "pkg.b"), rel("pkg.b", "pkg.a")]
+        modules = [
+            ModuleInfo(id="module:pkg.a", name="pkg.a", file_path="pkg/a.py",
+                       imports=[ImportInfo(module="pkg.b")]),
+            ModuleInfo(id="module:pkg.b", name="pkg.b", file_path="pkg/b.py",
+                       imports=[ImportInfo(module="pkg.c")]),
+        ]
+
+        fused = self.engine._detect_cycles_fused(relationships, [], modules)
+        separate = (self.engine._detect_detailed_cycles([], [], relationships) +
+                    self.engine._detect_import_cycles_from_modules(modules))
+
+        assert [c['id'] for c in fused] == [c['id'] for c in separate] == ["detailed_cycle_0"]
+        assert set(fused[0]['entities']) == {"pkg.a", "pkg.b"}
+
+    def test_mutual_cycle_detection_above_file_limit(self):
+        """Test that very large inputs report only direct mutual dependencies"""
+        from pyview.models import ModuleInfo, ImportInfo
+
+        relationships = [rel("a", "b"), rel("b", "a"), rel("b", "c"), rel("c", "d"), rel("d", "b")]
+        modules = [
+            ModuleInfo(id="module:x", name="x", file_path="x.py", imports=[ImportInfo(module="y")]),
+            ModuleInfo(id="module:y", name="y", file_path="y.py", imports=[ImportInfo(module="x")]),
+        ]
+
+        cycles = self.engine._detect_mutual_cycles(relationships, [], modules)
+
+        # The three-node loop b -> c -> d is left to full SCC detection
+        assert [(c['id'], c['entities']) for c in cycles] == [
+            ("detailed_cycle_0", ["a", "b", "a"]),
+            ("mod_import_cycle_0", ["mod:x", "mod:y"]),
+        ]
+
+    def test_partial_cycle_detection_is_flagged(self):
+        """Test that falling back to mutual-only cycle detection is logged and recorded in the metrics"""
+        project_dir = self.create_test_project()
+        files = self.engine._discover_project_files(project_dir)
+        analyses = self.engine._run_sequential_ast_analysis(files, Mock())
+        pydeps_result = {'packages': [], 'modules': [], 'relationships': [], 'cycles': [], 'metrics': {}}
+
+        full = self.engine._integrate_analyses(pydeps_result, analyses, Mock())
+        assert full['metrics']['cycle_detection'] == 'full'
+
+        self.engine._integration_cache.clear()
+        with patch.object(self.engine, '_FULL_CYCLE_DETECTION_LIMIT', 0), \
+                patch.object(self.engine.logger, 'warning') as mock_warning:
+            partial = self.engine._integrate_analyses(pydeps_result, analyses, Mock())
+        assert partial['metrics']['cycle_detection'] == 'mutual_only'
+        mock_warning.assert_called_once()
+        assert "mutual" in mock_warning.call_args[0][0]
+
+    def test_import_cycle_detection_deep_chain(self):
+        """Test that import cycle detection does not recurse on long import chains"""
+        from pyview.models import ModuleInfo, ImportInfo
+
+        count = 5000  # deeper than the default recursion limit
+        modules = [
+            ModuleInfo(id=f"module:m{i}", name=f"m{i}", file_path=f"m{i}.py",
+                       imports=[ImportInfo(module=f"m{(i + 1) % count}")])
+            for i in range(count)
+        ]
+
+        cycles = self.engine._detect_import_cycles_from_modules(modules)
+
+        assert len(cycles) == 1
+        assert cycles[0]['metrics']['length'] == count
+        assert len(cycles[0]['paths']) == count
+
+    def test_import_cycle_paths_built_on_access(self):
+        """Test that cycle paths are materialized lazily and copy as plain lists"""
+        import pickle
+        from pyview.models import ModuleInfo, ImportInfo
+
+        modules = [
+            ModuleInfo(id="module:a", name="a", file_path="a.py", imports=[ImportInfo(module="b")]),
+            ModuleInfo(id="module:b", name="b", file_path="b.py", imports=[ImportInfo(module="a")]),
+        ]
+
+        paths = self.engine._detect_import_cycles_from_modules(modules)[0]['paths']
+
+        assert len(paths) == 2
+        assert sorted((p['from'], p['to']) for p in paths) == [("mod:a", "mod:b"), ("mod:b", "mod:a")]
+        assert type(pickle.loads(pickle.dumps(paths))) is list
+        assert pickle.loads(pickle.dumps(paths)) == paths
+
+    def test_large_project_relationships_stored_as_index_columns(self):
+        """Test that large-project relationships are kept as integer edges with capped objects"""
+        from pyview.analyzer_engine import EdgeColumns
+
+        edges = EdgeColumns(detail_limit=2)
+        for pair in [("mod:a", "mod:b"), ("mod:b", "mod:a"), ("mod:a", "mod:c")]:
+            edges.extend([rel(*pair, relationship_type=DependencyType.IMPORT)])
+
+        assert len(edges) == 3
+        assert len(edges.details) == 2
+        assert edges.node_ids == ["mod:a", "mod:b", "mod:c"]
+        assert list(zip(edges.src, edges.dst)) == [(0, 1), (1, 0), (0, 2)]
+
+        cycles = self.engine._detect_edge_column_cycles(edges)
+        assert len(cycles) == 1
+        assert set(cycles[0]['entities']) == {"mod:a", "mod:b"}
+
+    def test_large_project_queue_surfaces_integration_failure(self):
+        """Test that a full result queue does not block forever once integration has failed"""
+        from concurrent.futures import Future
+        from queue import Queue
+
+        pending = Queue(maxsize=1)
+        pending.put("analysis")
+        integration = Future()
+        integration.set_exception(RuntimeError("integration failed"))
+
+        with pytest.raises(RuntimeError, match="integration failed"):
+            AnalyzerEngine._put_pending(pending, "next analysis", integration)
+
+    def test_large_project_keeps_largest_modules(self):
+        """Test that large-project results keep the biggest modules rather than the first ones"""
+        from pyview.analyzer_engine import ModuleColumns
+        from pyview.ast_analyzer import FileAnalysis
+        from pyview.models import ModuleInfo
+
+        modules = ModuleColumns(detail_limit=2)
+        for name, loc in [("a", 10), ("b", 50), ("c", 30), ("d", 50)]:
+            modules.append(FileAnalysis(file_path=f"{name}.py",
+                                        module_info=ModuleInfo(id=f"mod:{name}", name=name, file_path=f"{name}.py", loc=loc),
+                                        classes=[], methods=[], fields=[], imports=[], relationships=[]))
+
+        assert len(modules) == 4
+        assert [(m.name, m.loc) for m in modules.to_module_infos()] == [("b", 50), ("d", 50)]
+
+    def test_large_project_counts_only_integration(self):
+        """Test that counts-only integration reports the same totals without keeping entities"""
+        from pyview.ast_analyzer import ASTAnalyzer
+
+        analyzer = ASTAnalyzer()
+        analyses = [analyzer.analyze_source(f"m{i}.py", b"class A:\n    x = 1\n    def f(self):\n        return self.x\n")
+                    for i in range(3)]
+        callback = ProgressCallback(lambda data: None)
+
+        sampled = self.engine._integrate_large_project_data(iter(analyses), callback)
+        counted = self.engine._integrate_large_project_data(iter(analyses), callback, detail_level='counts')
+
+        assert counted['metrics'] == sampled['metrics']
+        assert counted['metrics']['entity_counts'] == {
+            'modules': 3, 'classes': 3, 'methods': 3, 'fields': 3,
+            'relationships': sum(len(a.relationships) for a in analyses)
+        }
+        for key in ('packages', 'classes', 'methods', 'fields', 'cycles'):
+            assert counted[key] == []
+        assert len(counted['modules']) == 0 and len(counted['relationships']) == 0
+
+    def test_deserialized_analyses_share_identifier_strings(self):
+        """Test that analyses unpickled from workers/cache share repeated identifier strings"""
+        import pickle
+        from pyview.analyzer_engine import _intern_analysis
+        from pyview.ast_analyzer import ASTAnalyzer
+
+        analyzer = ASTAnalyzer()
+        source = b"import collections\n\nclass Base:\n    def run(self) -> str:\n        return ''\n"
+        first, second = (
+            _intern_analysis(pickle.loads(pickle.dumps(analyzer.analyze_source(path, source))))
+            for path in ("one.py", "two.py")
+        )
+
+        assert first.imports[0].module is second.imports[0].module
+        assert first.methods[0].name is second.methods[0].name
+        assert first.methods[0].file_path is first.file_path
+
     def test_metrics_calculation(self):
         """Test enhanced metrics calculation"""
         # Create mock data